@@ -2,6 +2,7 @@
 Configuration settings for the reporting system
 """
 import os
+from functools import lru_cache
 from typing import Dict, Any
 
 # Database Configuration
@@ -79,8 +80,9 @@ DEFAULT_HEADER_CONFIGS = {
     }
 }
 
+@lru_cache(maxsize=1)
 def get_database_connection_string() -> str:
-    """Generate database connection string"""
+    """Generate database connection string (built once per process)"""
     config = DATABASE_CONFIG
     return (
         f"DRIVER={{{config['driver']}}};"
@@ -1,6 +1,8 @@
+import asyncio
 import os
 from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
 
 # Import API routes
@@ -62,6 +64,11 @@ def create_app() -> FastAPI:
     
     print("DEBUG: Middleware added")
 
+    # Compress large JSON payloads (preview/list endpoints). Binary export
+    # responses opt out by setting Content-Encoding: identity, since xlsx/pdf
+    # containers are already compressed. Level 5 keeps CPU cost negligible.
+    app.add_middleware(GZipMiddleware, minimum_size=4096, compresslevel=5)
+
     csrf_cookie_secure = os.getenv("CSRF_COOKIE_SECURE", "true").lower() == "true"
 
     # Add JWT authentication middleware (before CSRF)
@@ -117,7 +124,14 @@ def create_app() -> FastAPI:
         print("\n" + "="*70)
         print("🚀 APPLICATION STARTUP")
         print("="*70)
-        
+
+        # Size the default executor so asyncio.to_thread DB calls don't queue
+        # behind each other under concurrent load
+        from concurrent.futures import ThreadPoolExecutor
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(max_workers=32, thread_name_prefix="db-worker")
+        )
+
         # Test database connection
         print("\n📊 Testing Database Connection...")
         try:
@@ -181,7 +195,23 @@ def create_app() -> FastAPI:
         except Exception as e:
             print(f"❌ DATABASE CONNECTION: ERROR - {str(e)}")
             logger.error(f"Database connection test error: {e}")
-        
+
+        # Bootstrap the report_exports schema once so request paths skip DDL
+        try:
+            from utils.db_schema import ensure_report_exports_schema
+            await asyncio.to_thread(ensure_report_exports_schema)
+            logger.info("✅ report_exports schema verified")
+        except Exception as e:
+            logger.warning(f"report_exports schema bootstrap failed (will retry on first request): {e}")
+
+        # Same for the dashboard chart / scheduled report tables
+        try:
+            from utils.db_schema import ensure_dashboard_tables_schema
+            await asyncio.to_thread(ensure_dashboard_tables_schema)
+            logger.info("✅ dashboard tables schema verified")
+        except Exception as e:
+            logger.warning(f"dashboard tables schema bootstrap failed (will retry on first request): {e}")
+
         # Verify fonts
         print("\n🔤 Verifying PDF Fonts...")
         try:
@@ -490,9 +490,10 @@ async def insert_check_record(
             
             insert_query = f"""
                 INSERT INTO [{table_name}] ({column_list})
+                OUTPUT INSERTED.id
                 VALUES ({placeholders})
             """
-            
+
             # Helper to coerce python value to SQL Server expected type
             from datetime import datetime, date, time
             def coerce_value(sql_type: str, val):
@@ -558,13 +559,12 @@ async def insert_check_record(
                     }
                 values.append(coerced)
             
-            # Execute insert
+            # Execute insert - OUTPUT INSERTED.id returns the new id from the
+            # same statement, no second round-trip
             cursor.execute(insert_query, values)
+            record_id = cursor.fetchone()[0]
             conn.commit()
             
-            # Get the inserted record ID
-            record_id = cursor.execute("SELECT @@IDENTITY").fetchone()[0]
-            
             return {
                 "success": True,
                 "message": f"Record inserted successfully into {table_name}",
@@ -934,6 +934,7 @@ async def create_table(request: Request):
                         
                         insert_query = f"""
                             INSERT INTO [{table_name}] ({column_list})
+                            OUTPUT INSERTED.id
                             VALUES ({placeholders})
                         """
                         
@@ -963,11 +964,10 @@ async def create_table(request: Request):
                             values.append(value)
                         
                         if values:  # Only insert if we have valid values
+                            # OUTPUT INSERTED.id returns the new id inline
                             cursor.execute(insert_query, values)
+                            record_id = cursor.fetchone()[0]
                             conn.commit()
-                            
-                            # Get the inserted record ID
-                            record_id = cursor.execute("SELECT @@IDENTITY").fetchone()[0]
                             print(f"[EnhancedBankCheck] Record inserted with ID: {record_id}")
                         
                 except Exception as insert_error:
@@ -2,25 +2,72 @@
 API routes for comply dashboard exports
 """
 import asyncio
+import concurrent.futures
 import json
 from datetime import datetime
 import os
 import httpx
-from fastapi import APIRouter, Query, HTTPException, Request
-from fastapi.responses import Response
-from typing import Optional
+from fastapi import APIRouter, Depends, Query, HTTPException, Request
+from fastapi.responses import Response, JSONResponse, FileResponse, StreamingResponse
+from pydantic import BaseModel
+from typing import Any, Dict, Optional
 
 from services import APIService, PDFService, ExcelService
+from services.export_job_service import ExportJobService, JOB_COMPLETED, JOB_FAILED
 from utils.export_utils import get_default_header_config
-from routes.route_utils import write_debug, parse_header_config, merge_header_config, convert_to_boolean, save_and_log_export
+from routes.route_utils import DEBUG_ENABLED, write_debug, parse_header_config, merge_header_config, save_and_log_export
 
 # Initialize services
 api_service = APIService()
 pdf_service = PDFService()
 excel_service = ExcelService()
+export_job_service = ExportJobService()
 
-# Create router
-router = APIRouter()
+# Shared HTTP client for calls to the Node backend. Reusing one client keeps
+# TCP/TLS connections alive across export requests instead of paying the
+# handshake cost on every call. HTTP/2 is enabled when the optional 'h2'
+# package is installed (httpx[http2]).
+try:
+    import h2  # noqa: F401
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+# orjson decodes the multi-MB Node payload several times faster than the
+# stdlib parser; fall back to response.json() if it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# msgspec lets us parse the payload's top level only, keeping each report's
+# rows as raw JSON bytes until one is actually selected - exports materialize
+# a single report instead of the whole dashboard
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+# Create router - JSON endpoints (test-save, job status) serialize through
+# orjson when available instead of the stdlib encoder
+if orjson is not None:
+    from fastapi.responses import ORJSONResponse
+    router = APIRouter(default_response_class=ORJSONResponse)
+else:
+    router = APIRouter()
+
+NODE_CLIENT = httpx.AsyncClient(
+    http2=_HTTP2_AVAILABLE,
+    timeout=60.0,
+    limits=httpx.Limits(max_keepalive_connections=32, max_connections=128),
+    follow_redirects=True
+)
+
+
+@router.on_event("shutdown")
+async def _close_node_client():
+    """Close the pooled Node client when the app shuts down"""
+    await NODE_CLIENT.aclose()
 
 @router.get("/api/grc/comply/test-save")
 async def test_comply_save(request: Request):
@@ -28,16 +75,16 @@ async def test_comply_save(request: Request):
     try:
         from datetime import datetime
         import os
-        
+
         # Create a test file content
         test_content = b"Test PDF content for comply export"
         test_filename = f"test_comply_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
-        
+
         # Get user from request headers
         created_by = request.headers.get('X-User-Name') or request.headers.get('Authorization') or "System"
-        
+
         write_debug(f"[TEST] Testing comply export save - user: {created_by}")
-        
+
         # Try to save using save_and_log_export
         export_info = await save_and_log_export(
             content=test_content,
@@ -48,15 +95,15 @@ async def test_comply_save(request: Request):
             created_by=created_by,
             date_range=None
         )
-        
+
         filename = export_info.get('filename', 'N/A')
         relative_path = export_info.get('relative_path', 'N/A')
         export_id = export_info.get('export_id', None)
         file_path = export_info.get('file_path', 'N/A')
-        
+
         # Verify file exists
         file_exists = os.path.exists(file_path) if file_path != 'N/A' else False
-        
+
         result = {
             "success": True,
             "message": "Test save completed",
@@ -71,171 +118,384 @@ async def test_comply_save(request: Request):
                 "file_size": os.path.getsize(file_path) if file_exists else 0
             }
         }
-        
-        write_debug(f"[TEST] Test save result: {result}")
-        
+
+        write_debug(lambda: f"[TEST] Test save result: {result}")
+
         return result
-        
+
     except Exception as e:
         write_debug(f"[TEST] Test save failed: {str(e)}")
-        import traceback
-        write_debug(f"[TEST] Traceback: {traceback.format_exc()}")
-        return {
+        result = {
             "success": False,
             "message": f"Test save failed: {str(e)}",
             "error": str(e),
-            "traceback": traceback.format_exc()
         }
+        # Formatting a traceback allocates a lot - only do it when debug
+        # logging is on
+        if DEBUG_ENABLED:
+            import traceback
+            result["traceback"] = traceback.format_exc()
+            write_debug(f"[TEST] Traceback: {result['traceback']}")
+        return result
 
-@router.get("/api/grc/comply/export-pdf")
-async def export_comply_pdf(
-    request: Request,
-    startDate: str = Query(None),
-    endDate: str = Query(None),
-    headerConfig: str = Query(None),
-    cardType: str = Query(None),
-    onlyCard: str = Query("False"),
-    onlyChart: str = Query("False"),
-    chartType: str = Query(None),
-    renderType: str = Query(None),
-    tableType: str = Query(None),
-    onlyOverallTable: str = Query("False"),
-    functionId: str = Query(None, description="Filter by specific function ID")
-):
-    """Export comply report in PDF format"""
-    
-    try:
-        # Parse and merge header configuration
-        header_config = parse_header_config(headerConfig)
-        if renderType:
-            try:
-                header_config["chartType"] = renderType
-            except Exception:
-                header_config = {"chartType": renderType}
-        elif chartType:
-            try:
-                header_config["chartType"] = chartType
-            except Exception:
-                header_config = {"chartType": chartType}
-        header_config = merge_header_config("comply", header_config)
-
-        # Convert to boolean
-        onlyCard = convert_to_boolean(onlyCard)
-        onlyChart = convert_to_boolean(onlyChart)
-        onlyOverallTable = convert_to_boolean(onlyOverallTable)
-        
-        if onlyChart and not cardType and chartType:
-            cardType = chartType
-         
-        if onlyOverallTable and tableType:
-            cardType = tableType
-        
-        # Require cardType for exports
-        if not cardType:
-            raise HTTPException(status_code=400, detail="cardType or chartType is required for exports")
 
-        # Fetch comply data from Node backend
-        node_api_url = os.getenv("NODE_API_BASE", "http://localhost:3002")
-        comply_url = f"{node_api_url}/api/grc/comply/all"
-        
-        params = {}
-        if startDate:
-            params['startDate'] = startDate
-        if endDate:
-            params['endDate'] = endDate
-        if functionId:
-            params['functionId'] = functionId
-
-        # Get auth token and cookies from request
-        auth_header = request.headers.get('Authorization', '')
-        cookies = dict(request.cookies)
-        
-        # Forward all cookies to Node.js API for authentication
-        async with httpx.AsyncClient(cookies=cookies, follow_redirects=True) as client:
-            headers = {}
-            if auth_header:
-                headers['Authorization'] = auth_header
-            # Forward CSRF token if present
-            csrf_token = request.headers.get('X-CSRF-Token') or request.cookies.get('csrfToken')
-            if csrf_token:
-                headers['X-CSRF-Token'] = csrf_token
-            
-            response = await client.get(
-                comply_url,
-                params=params,
-                headers=headers,
-                timeout=60.0
-            )
-            response.raise_for_status()
-            comply_data = response.json()
-
-        # Map frontend chart/card IDs to backend report names
-        # Backend returns reports with descriptive names like "Survey Completion Rate", "Bank Questions details", etc.
-        report_name_map = {
-            # Chart IDs from frontend -> Backend report names
-            'surveysByStatus': 'Surveys by Status',
-            'complianceByStatus': 'Compliance per complianceStatus',
-            'complianceByProgress': 'Compliance per progressStatus',
-            'complianceByApproval': 'Compliance per approval_status',
-            'avgScorePerSurvey': 'Average Score Per Survey',
-            'complianceByControlCategory': 'Compliance by Control Category',
-            'topFailedControls': 'Top Failed Controls',
-            'controlsPerCategory': 'Controls no. per category',
-            'risksPerCategory': 'Risks no. per category',
-            'impactedAreasTrend': 'Impacted Areas Trend Over Time',
-            # Card IDs from frontend -> Backend report names
-            'totalSurveys': 'Surveys by Status',
-            'totalCompliance': 'Compliance Details',
-            'avgCompletionRate': 'Survey Completion Rate',
-            'complianceWithoutEvidence': 'Compliance controls without evidence',
-            # Table IDs from frontend -> Backend report names
-            'complianceDetails': 'Compliance Details',
-            'surveyCompletionRate': 'Survey Completion Rate',
-            'bankQuestionsDetails': 'Bank Questions details',
-            'risksPerCategoryDetails': 'Risks per category details',
-            'controlsPerCategoryDetails': 'Controls per category details',
-            'controlsPerDomainsDetails': 'Controls per domains Details',
-            'questionsPerCategory': 'Questions Per Category',
-            'impactedAreasByControls': 'Impacted Areas by Number of Linked Controls',
-            'surveyParticipationByDepartment': 'Survey Participation by Department',
-            'activeFunctions': 'Most Active vs Least Active Functions (Answer Count)',
-            'surveyCoverageByCategory': 'Survey Coverage by Category (How many categories included per survey)',
-            'complianceManagementDetails': 'Compliance managment details',
-            # Additional chart mappings
-            'questionsPerType': 'Questions no. per type',
-            'questionsPerReferences': 'Questions no. per References',
-            'controlNosPerDomains': 'Control Nos. per Domains',
-        }
-        
-        # Get the actual report name from the map, or use cardType as-is
-        report_name = report_name_map.get(cardType, cardType)
-        
-        # Try to get data from comply_data using the report name
-        # comply_data structure: { "Report Name": [data], ... }
-        export_data = comply_data.get(report_name, comply_data.get(cardType, []))
-        
-        # If still no data, try to find it by partial match
-        if not export_data and cardType:
-            for key in comply_data.keys():
-                if isinstance(key, str) and cardType.lower() in key.lower():
-                    export_data = comply_data[key]
-                    report_name = key
+# Short-TTL cache for the Node comply dataset, keyed by (params, principal).
+# Exporting several cards/charts back-to-back re-fetches the same multi-MB
+# payload otherwise; within the TTL window we reuse the decoded response.
+# Same in-memory dict pattern as _export_cache in route_utils.
+_comply_data_cache = {}  # Key: cache_key, Value: (comply_data, timestamp)
+_comply_cache_lock = asyncio.Lock()
+COMPLY_CACHE_TTL = 30  # seconds
+COMPLY_CACHE_MAX_ENTRIES = 512
+
+
+def _comply_cache_key(params: Dict[str, str], auth_header: Optional[str],
+                      cookies: Dict[str, str], csrf_token: Optional[str]) -> tuple:
+    """Build a cache key for a comply fetch; auth material is hashed, not stored"""
+    import hashlib
+    principal_parts = [auth_header or '', csrf_token or '']
+    principal_parts.extend(f"{k}={v}" for k, v in sorted(cookies.items()))
+    principal = hashlib.blake2b('|'.join(principal_parts).encode(), digest_size=16).hexdigest()
+    return (
+        params.get('startDate'),
+        params.get('endDate'),
+        params.get('functionId'),
+        params.get('reportName'),
+        principal
+    )
+
+
+async def _fetch_comply_data(params: Dict[str, str], auth_header: Optional[str],
+                             cookies: Dict[str, str], csrf_token: Optional[str]) -> Dict[str, Any]:
+    """Fetch the comply dashboard dataset from the Node backend (TTL-cached)"""
+    node_api_url = os.getenv("NODE_API_BASE", "http://localhost:3002")
+    comply_url = f"{node_api_url}/api/grc/comply/all"
+
+    cache_key = _comply_cache_key(params, auth_header, cookies, csrf_token)
+    now = asyncio.get_event_loop().time()
+
+    async with _comply_cache_lock:
+        cached = _comply_data_cache.get(cache_key)
+        if cached and now - cached[1] < COMPLY_CACHE_TTL:
+            write_debug(lambda: f"[Comply Fetch] Cache hit for params={params}")
+            return cached[0]
+
+    headers = {}
+    if auth_header:
+        headers['Authorization'] = auth_header
+    # Forward CSRF token if present
+    if csrf_token:
+        headers['X-CSRF-Token'] = csrf_token
+
+    # Forward all cookies to Node.js API for authentication (per-request, so
+    # one user's session cookies never stick to the shared client)
+    response = await NODE_CLIENT.get(
+        comply_url,
+        params=params,
+        headers=headers,
+        cookies=cookies
+    )
+    response.raise_for_status()
+    if msgspec is not None:
+        # Structural scan only: report rows stay as msgspec.Raw bytes until
+        # _resolve_report_data picks one to decode
+        comply_data = msgspec.json.decode(response.content, type=Dict[str, msgspec.Raw])
+    elif orjson is not None:
+        comply_data = orjson.loads(response.content)
+    else:
+        comply_data = response.json()
+
+    async with _comply_cache_lock:
+        # Evict expired entries first, then oldest if still over the cap
+        expired = [k for k, v in _comply_data_cache.items() if now - v[1] >= COMPLY_CACHE_TTL]
+        for k in expired:
+            del _comply_data_cache[k]
+        if len(_comply_data_cache) >= COMPLY_CACHE_MAX_ENTRIES:
+            oldest = min(_comply_data_cache, key=lambda k: _comply_data_cache[k][1])
+            del _comply_data_cache[oldest]
+        _comply_data_cache[cache_key] = (comply_data, now)
+
+    return comply_data
+
+
+def _decode_report_value(comply_data: Dict[str, Any], key: str):
+    """Materialize a report value, decoding msgspec.Raw bytes lazily.
+
+    The decoded form is written back into comply_data (which is the cached
+    raw map), so repeat exports of the same report within the cache TTL pay
+    the decode once instead of per request. The generators render tables from
+    Python objects (reportlab/openpyxl), so they always need the decoded
+    form - there is no raw-bytes path past this point.
+    """
+    value = comply_data.get(key, [])
+    if msgspec is not None and isinstance(value, msgspec.Raw):
+        value = msgspec.json.decode(value)
+        comply_data[key] = value
+    return value
+
+
+def _resolve_report_data(comply_data: Dict[str, Any], cardType: str):
+    """Resolve (report_name, export_data) for a frontend cardType"""
+    # Get the actual report name from the map, or use cardType as-is
+    report_name = REPORT_NAME_MAP.get(cardType, cardType)
+
+    # Try to get data from comply_data using the report name
+    # comply_data structure: { "Report Name": [data], ... }
+    lookup_key = report_name if report_name in comply_data else cardType
+    export_data = _decode_report_value(comply_data, lookup_key)
+
+    # If still no data, fall back to case-insensitive matching. Lowercase the
+    # payload keys once into an index instead of calling .lower() per
+    # candidate inside a scan loop.
+    if not export_data and cardType:
+        card_lower = cardType.lower()
+        payload_lower = {key.lower(): key for key in comply_data if isinstance(key, str)}
+
+        # Exact case-insensitive hit on a known report name or payload key
+        known = REPORT_NAME_MAP_LOWER.get(card_lower)
+        hit = payload_lower.get(known[1].lower()) if known else None
+        if hit is None:
+            hit = payload_lower.get(card_lower)
+
+        # Last resort: substring match against the lowered index (single pass)
+        if hit is None:
+            for key_lower, key in payload_lower.items():
+                if card_lower in key_lower:
+                    hit = key
                     break
-        
-        # Log for debugging
-        write_debug(f"Comply PDF export - cardType={cardType}, report_name={report_name}, data found={len(export_data) if isinstance(export_data, list) else 'N/A'}")
-        
-        # Prepare data for PDF generation
-        # Use cardType as the key so export service finds it immediately
-        # Also include report_name in case service needs it for fallback
-        comply_export_data = {cardType: export_data or []}
-        # Add report_name as well for service fallback lookup
-        if report_name != cardType:
-            comply_export_data[report_name] = export_data or []
-
-        # Generate PDF
-        write_debug(f"Calling generate_comply_pdf with onlyCard={onlyCard}, onlyChart={onlyChart}, onlyOverallTable={onlyOverallTable}")
-        pdf_content = await pdf_service.generate_comply_pdf(
+
+        if hit is not None:
+            export_data = _decode_report_value(comply_data, hit)
+            report_name = hit
+
+    return report_name, export_data
+
+
+# Map frontend chart/card IDs to backend report names
+# Backend returns reports with descriptive names like "Survey Completion Rate", "Bank Questions details", etc.
+REPORT_NAME_MAP = {
+    # Chart IDs from frontend -> Backend report names
+    'surveysByStatus': 'Surveys by Status',
+    'complianceByStatus': 'Compliance per complianceStatus',
+    'complianceByProgress': 'Compliance per progressStatus',
+    'complianceByApproval': 'Compliance per approval_status',
+    'avgScorePerSurvey': 'Average Score Per Survey',
+    'complianceByControlCategory': 'Compliance by Control Category',
+    'topFailedControls': 'Top Failed Controls',
+    'controlsPerCategory': 'Controls no. per category',
+    'risksPerCategory': 'Risks no. per category',
+    'impactedAreasTrend': 'Impacted Areas Trend Over Time',
+    # Card IDs from frontend -> Backend report names
+    'totalSurveys': 'Surveys by Status',
+    'totalCompliance': 'Compliance Details',
+    'avgCompletionRate': 'Survey Completion Rate',
+    'complianceWithoutEvidence': 'Compliance controls without evidence',
+    # Table IDs from frontend -> Backend report names
+    'complianceDetails': 'Compliance Details',
+    'surveyCompletionRate': 'Survey Completion Rate',
+    'bankQuestionsDetails': 'Bank Questions details',
+    'risksPerCategoryDetails': 'Risks per category details',
+    'controlsPerCategoryDetails': 'Controls per category details',
+    'controlsPerDomainsDetails': 'Controls per domains Details',
+    'questionsPerCategory': 'Questions Per Category',
+    'impactedAreasByControls': 'Impacted Areas by Number of Linked Controls',
+    'surveyParticipationByDepartment': 'Survey Participation by Department',
+    'activeFunctions': 'Most Active vs Least Active Functions (Answer Count)',
+    'surveyCoverageByCategory': 'Survey Coverage by Category (How many categories included per survey)',
+    'complianceManagementDetails': 'Compliance managment details',
+    # Additional chart mappings
+    'questionsPerType': 'Questions no. per type',
+    'questionsPerReferences': 'Questions no. per References',
+    'controlNosPerDomains': 'Control Nos. per Domains',
+}
+
+# Precomputed lowercase view of the map so partial-match fallbacks don't have
+# to call .lower() on every candidate key per request
+REPORT_NAME_MAP_LOWER = {k.lower(): (k, v) for k, v in REPORT_NAME_MAP.items()}
+
+
+# Worker pool for report generation. The generate_comply_* methods are
+# CPU-bound rendering behind async def (they never await), so running them
+# inline would block the event loop and stall every concurrent export. The
+# services keep per-instance state, so threads rather than processes.
+_EXPORT_POOL = concurrent.futures.ThreadPoolExecutor(
+    max_workers=min(32, (os.cpu_count() or 4) * 2),
+    thread_name_prefix='comply-export'
+)
+
+
+async def _generate_in_pool(generator_coro) -> bytes:
+    """Run a (non-awaiting) generator coroutine on the export thread pool"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_EXPORT_POOL, asyncio.run, generator_coro)
+
+
+# One-time generator warm-up flag (matplotlib font cache + reportlab fonts)
+_generator_context_ready = False
+
+
+async def _prepare_generator_context() -> None:
+    """Warm generator dependencies that don't need the comply data.
+
+    The first chart render pays for matplotlib's font-manager cache build and
+    reportlab font registration; doing it here lets the export pipeline overlap
+    that cost with the Node fetch instead of serializing them. No-op after the
+    first call.
+    """
+    global _generator_context_ready
+    if _generator_context_ready:
+        return
+
+    def _warm():
+        try:
+            import matplotlib.pyplot as plt
+            fig = plt.figure(figsize=(1, 1))
+            plt.close(fig)
+        except Exception as warm_err:
+            write_debug(f"[Comply Export] matplotlib warm-up failed (continuing): {warm_err}")
+        try:
+            # Importing pdf_utils registers the PDF fonts as a side effect
+            from utils.pdf_utils import ARABIC_FONT_NAME  # noqa: F401
+        except Exception as font_err:
+            write_debug(f"[Comply Export] font warm-up failed (continuing): {font_err}")
+
+    await asyncio.to_thread(_warm)
+    _generator_context_ready = True
+
+
+# On-disk cache of rendered report bytes keyed by a hash of the actual render
+# inputs. Repeat exports of the same card/date-range/options skip the whole
+# PDF/Excel generation and reuse the cached file.
+_RENDER_CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'reports_export', '.render_cache')
+RENDER_CACHE_MAX_FILES = 256
+
+
+def _render_cache_key(report_name, export_data, header_config,
+                      onlyCard: bool, onlyChart: bool, onlyOverallTable: bool) -> str:
+    """Hash the materialized render inputs into a cache key"""
+    import hashlib
+    payload = [report_name, export_data, header_config, onlyCard, onlyChart, onlyOverallTable]
+    if orjson is not None:
+        encoded = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+    else:
+        encoded = json.dumps(payload, sort_keys=True, default=str).encode('utf-8')
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+def _render_cache_path(fmt: str, key: str) -> str:
+    return os.path.join(_RENDER_CACHE_DIR, fmt, f"{key}.{fmt}")
+
+
+def _render_cache_get(fmt: str, key: str) -> Optional[bytes]:
+    """Return cached render bytes for key, or None"""
+    path = _render_cache_path(fmt, key)
+    try:
+        with open(path, 'rb') as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _render_cache_put(fmt: str, key: str, content: bytes) -> None:
+    """Store rendered bytes, evicting oldest entries beyond the cap"""
+    cache_dir = os.path.join(_RENDER_CACHE_DIR, fmt)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(_render_cache_path(fmt, key), 'wb') as f:
+            f.write(content)
+        entries = [os.path.join(cache_dir, name) for name in os.listdir(cache_dir)]
+        if len(entries) > RENDER_CACHE_MAX_FILES:
+            entries.sort(key=os.path.getmtime)
+            for stale in entries[:len(entries) - RENDER_CACHE_MAX_FILES]:
+                try:
+                    os.remove(stale)
+                except OSError:
+                    pass
+    except OSError as cache_err:
+        write_debug(lambda: f"[Render Cache] put failed (continuing): {cache_err}")
+
+
+# Format dispatch for the shared export pipeline - both routes differ only in
+# generator, file extension and media type
+_EXPORT_FORMATS = {
+    'pdf': {
+        'generator': pdf_service.generate_comply_pdf,
+        'extension': 'pdf',
+        'media_type': 'application/pdf',
+        'label': 'COMPLY PDF',
+    },
+    'xlsx': {
+        'generator': excel_service.generate_comply_excel,
+        'extension': 'xlsx',
+        'media_type': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+        'label': 'COMPLY EXCEL',
+    },
+}
+
+
+async def _run_comply_export(
+    fmt: str,
+    params: Dict[str, str],
+    auth_header: Optional[str],
+    cookies: Dict[str, str],
+    csrf_token: Optional[str],
+    header_config: Dict[str, Any],
+    cardType: str,
+    onlyCard: bool,
+    onlyChart: bool,
+    onlyOverallTable: bool,
+    created_by: str,
+    startDate: Optional[str],
+    endDate: Optional[str],
+) -> Dict[str, Any]:
+    """Run the full comply export pipeline (fetch + generate + save) for fmt.
+
+    Returns the export_info dict from save_and_log_export with the generated
+    bytes under a transient 'content' key (dropped for background jobs).
+    """
+    spec = _EXPORT_FORMATS[fmt]
+    label = spec['label']
+
+    # Tell Node which report we actually want. The /all endpoint returns the
+    # whole dashboard payload today; once the backend honors reportName it can
+    # serialize just the requested report and the payload shrinks by ~Nx.
+    # Harmless passthrough until then.
+    params = dict(params)
+    params['reportName'] = REPORT_NAME_MAP.get(cardType, cardType)
+
+    # Overlap the Node fetch with generator warm-up - they are independent
+    comply_data, _ = await asyncio.gather(
+        _fetch_comply_data(params, auth_header, cookies, csrf_token),
+        _prepare_generator_context()
+    )
+
+    report_name, export_data = _resolve_report_data(comply_data, cardType)
+
+    # Log for debugging
+    write_debug(lambda: f"[{label}] export - cardType={cardType}, report_name={report_name}, data found={len(export_data) if isinstance(export_data, list) else 'N/A'}")
+
+    # Nothing to render - skip generation and save entirely instead of paying
+    # the full fixed rendering cost for an empty report
+    if not export_data:
+        write_debug(lambda: f"[{label}] No data for cardType={cardType}, skipping generation")
+        return {'empty': True, 'report_name': report_name, 'media_type': spec['media_type']}
+
+    # Prepare data for generation. Use cardType as the single key - the
+    # services try cardType first, so a second report_name alias would only
+    # make any full dict walk inside the generator visit the data twice.
+    comply_export_data = {cardType: export_data}
+
+    # Identical inputs render identical bytes - check the render cache before
+    # paying for a full generation
+    cache_key = _render_cache_key(report_name, export_data, header_config,
+                                  onlyCard, onlyChart, onlyOverallTable)
+    content = _render_cache_get(fmt, cache_key)
+    if content is not None:
+        write_debug(lambda: f"[{label}] Render cache hit for {report_name}")
+    else:
+        # Generate the report bytes
+        write_debug(lambda: f"[{label}] Calling generator with onlyCard={onlyCard}, onlyChart={onlyChart}, onlyOverallTable={onlyOverallTable}")
+        content = await _generate_in_pool(spec['generator'](
             comply_export_data,
             startDate,
             endDate,
@@ -244,284 +504,256 @@ async def export_comply_pdf(
             onlyCard=onlyCard,
             onlyOverallTable=onlyOverallTable,
             onlyChart=onlyChart
-        )
+        ))
+        if content:
+            _render_cache_put(fmt, cache_key, content)
 
-        if not pdf_content:
-            raise HTTPException(status_code=500, detail="PDF generation failed")
+    if not content:
+        raise HTTPException(status_code=500, detail=f"{fmt.upper()} generation failed")
 
-        # Get user from request headers
-        created_by = request.headers.get('X-User-Name') or request.headers.get('Authorization') or "System"
-        
-        # Store readable report_name in header_config for filename generation
-        # Use cardType for database (like risks/controls dashboard)
-        if report_name and report_name != cardType:
-            if not header_config:
-                header_config = {}
-            header_config['export_title'] = report_name  # Store readable name for filename
-        
-        write_debug(f"[COMPLY PDF] Saving export - cardType={cardType}, report_name={report_name}")
-        write_debug(f"[COMPLY PDF] PDF content size: {len(pdf_content) if pdf_content else 0} bytes")
-        
-        # Save file and log to database - use cardType for database (like risks/controls)
-        try:
-            export_info = await save_and_log_export(
-                content=pdf_content,
-                file_extension='pdf',
-                dashboard='comply',
-                card_type=cardType,  # Use cardType for database (matches risks/controls pattern)
-                header_config=header_config,
-                created_by=created_by,
-                date_range={'startDate': startDate, 'endDate': endDate}
-            )
-            
-            filename = export_info['filename']
-            relative_path = export_info.get('relative_path', '')
-            export_id = export_info.get('export_id', '')
-            
-            write_debug(f"[COMPLY PDF] Export saved successfully:")
-            write_debug(f"  - Filename: {filename}")
-            write_debug(f"  - Relative path: {relative_path}")
-            write_debug(f"  - Export ID: {export_id}")
-            write_debug(f"PDF generated successfully for {cardType}: {filename}")
-        except Exception as save_err:
-            write_debug(f"[COMPLY PDF] Error saving export: {str(save_err)}")
-            import traceback
-            write_debug(f"[COMPLY PDF] Save error traceback: {traceback.format_exc()}")
-            raise
-
-        # Return PDF as file download
-        return Response(
-            content=pdf_content,
-            media_type='application/pdf',
-            headers={
-                'Content-Disposition': f'attachment; filename="{filename}"',
-                'X-Export-Src': export_info['relative_path'],
-                'X-Export-Id': str(export_info.get('export_id', ''))
-            }
+    # Store readable report_name in header_config for filename generation
+    # Use cardType for database (like risks/controls dashboard)
+    if report_name and report_name != cardType:
+        if not header_config:
+            header_config = {}
+        header_config['export_title'] = report_name  # Store readable name for filename
+
+    write_debug(lambda: f"[{label}] Saving export - cardType={cardType}, report_name={report_name}")
+    write_debug(lambda: f"[{label}] Content size: {len(content) if content else 0} bytes")
+
+    # Save file and log to database - use cardType for database (like risks/controls)
+    try:
+        export_info = await save_and_log_export(
+            content=content,
+            file_extension=spec['extension'],
+            dashboard='comply',
+            card_type=cardType,  # Use cardType for database (matches risks/controls pattern)
+            header_config=header_config,
+            created_by=created_by,
+            date_range={'startDate': startDate, 'endDate': endDate}
         )
 
-    except Exception as e:
-        write_debug(f"Error during export_comply_pdf: {str(e)}")
+        write_debug(f"[{label}] Export saved successfully:")
+        write_debug(f"  - Filename: {export_info['filename']}")
+        write_debug(f"  - Relative path: {export_info.get('relative_path', '')}")
+        write_debug(f"  - Export ID: {export_info.get('export_id', '')}")
+    except Exception as save_err:
+        write_debug(f"[{label}] Error saving export: {str(save_err)}")
         import traceback
-        traceback.print_exc()
-        raise HTTPException(status_code=500, detail=f"Export failed: {str(e)}")
+        write_debug(f"[{label}] Save error traceback: {traceback.format_exc()}")
+        raise
 
+    export_info['content'] = content
+    export_info['media_type'] = spec['media_type']
+    return export_info
 
-@router.get("/api/grc/comply/export-excel")
-async def export_comply_excel(
-    request: Request,
-    startDate: str = Query(None),
-    endDate: str = Query(None),
-    headerConfig: str = Query(None),
-    cardType: str = Query(None),
-    onlyCard: str = Query("False"),
-    onlyChart: str = Query("False"),
-    chartType: str = Query(None),
-    renderType: str = Query(None),
-    tableType: str = Query(None),
-    onlyOverallTable: str = Query("False"),
-    functionId: str = Query(None, description="Filter by specific function ID")
-):
-    """Export comply report in Excel format"""
+
+async def run_comply_pdf_export(**kwargs) -> Dict[str, Any]:
+    """Comply PDF export pipeline (fetch + generate + save)"""
+    return await _run_comply_export('pdf', **kwargs)
+
+
+async def run_comply_excel_export(**kwargs) -> Dict[str, Any]:
+    """Comply Excel export pipeline (fetch + generate + save)"""
+    return await _run_comply_export('xlsx', **kwargs)
+
+
+def _iter_content_chunks(content: bytes, chunk_size: int = 65536):
+    """Yield the generated report bytes in chunks.
+
+    Must yield bytes: starlette calls .encode() on any non-bytes chunk, so
+    memoryview slices blow up inside StreamingResponse.
+    """
+    for offset in range(0, len(content), chunk_size):
+        yield content[offset:offset + chunk_size]
+
+
+def _export_file_response(export_info: Dict[str, Any]) -> StreamingResponse:
+    """Stream the generated report to the client in 64KB chunks"""
+    content = export_info['content']
+    return StreamingResponse(
+        _iter_content_chunks(content),
+        media_type=export_info['media_type'],
+        headers={
+            'Content-Disposition': f'attachment; filename="{export_info["filename"]}"',
+            'Content-Length': str(len(content)),
+            # pdf/xlsx are already compressed; identity makes GZipMiddleware
+            # skip them (and leave Content-Length intact)
+            'Content-Encoding': 'identity',
+            'X-Export-Src': export_info['relative_path'],
+            'X-Export-Id': str(export_info.get('export_id', ''))
+        }
+    )
+
+
+def _submit_background_export(task_coro) -> JSONResponse:
+    """Submit an export coroutine as a background job and return 202 + job_id"""
+    async def _job():
+        export_info = await task_coro
+        # Drop the generated bytes - background clients download from disk
+        export_info.pop('content', None)
+        return export_info
+
+    job_id = export_job_service.submit(_job())
+    return JSONResponse({"job_id": job_id, "status": "pending"}, status_code=202)
+
+
+@router.get("/api/grc/comply/export-status/{job_id}")
+async def comply_export_status(job_id: str):
+    """Poll the status of a background comply export job"""
+    job = export_job_service.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Unknown export job")
+
+    payload = {"job_id": job_id, "status": job["status"]}
+    if job["status"] == JOB_COMPLETED and job.get("result"):
+        payload["filename"] = job["result"].get("filename")
+        payload["export_id"] = job["result"].get("export_id")
+        payload["relative_path"] = job["result"].get("relative_path")
+    elif job["status"] == JOB_FAILED:
+        payload["error"] = job.get("error")
+    return payload
+
+
+@router.get("/api/grc/comply/export-download/{job_id}")
+async def comply_export_download(job_id: str):
+    """Download the file produced by a completed background export job"""
+    job = export_job_service.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Unknown export job")
+    if job["status"] == JOB_FAILED:
+        raise HTTPException(status_code=500, detail=f"Export failed: {job.get('error')}")
+    if job["status"] != JOB_COMPLETED or not job.get("result"):
+        raise HTTPException(status_code=409, detail=f"Export not ready (status: {job['status']})")
+
+    result = job["result"]
+    if result.get('empty'):
+        return Response(status_code=204, headers={'X-Export-Empty': 'true'})
+    file_path = result.get("file_path")
+    if not file_path or not os.path.exists(file_path):
+        raise HTTPException(status_code=404, detail="Export file no longer exists")
+
+    return FileResponse(
+        file_path,
+        media_type=result.get("media_type", "application/octet-stream"),
+        filename=result.get("filename"),
+        headers={
+            # Already-compressed binary; opt out of gzip re-compression
+            'Content-Encoding': 'identity',
+            'X-Export-Src': result.get('relative_path', ''),
+            'X-Export-Id': str(result.get('export_id', ''))
+        }
+    )
+
+
+class ComplyExportQuery(BaseModel):
+    """Query parameters shared by the comply export routes.
+
+    Booleans are coerced by pydantic directly ("true"/"1"/"yes" etc.), which
+    replaces the per-flag convert_to_boolean calls the handlers used to make.
+    """
+    startDate: Optional[str] = None
+    endDate: Optional[str] = None
+    headerConfig: Optional[str] = None
+    cardType: Optional[str] = None
+    onlyCard: bool = False
+    onlyChart: bool = False
+    chartType: Optional[str] = None
+    renderType: Optional[str] = None
+    tableType: Optional[str] = None
+    onlyOverallTable: bool = False
+    functionId: Optional[str] = None
+    background: bool = False
+
+
+def _normalize_export_query(q: ComplyExportQuery):
+    """Resolve header config, effective cardType and Node params for a query"""
+    # Parse and merge header configuration
+    header_config = parse_header_config(q.headerConfig)
+    chart_type = q.renderType or q.chartType
+    if chart_type:
+        header_config["chartType"] = chart_type
+    header_config = merge_header_config("comply", header_config)
+
+    cardType = q.cardType
+    if q.onlyChart and not cardType and q.chartType:
+        cardType = q.chartType
+
+    if q.onlyOverallTable and q.tableType:
+        cardType = q.tableType
+
+    params = {}
+    if q.startDate:
+        params['startDate'] = q.startDate
+    if q.endDate:
+        params['endDate'] = q.endDate
+    if q.functionId:
+        params['functionId'] = q.functionId
+
+    return header_config, cardType, params
+
+
+async def _handle_comply_export(fmt: str, request: Request, q: ComplyExportQuery):
+    """Shared handler body for the PDF and Excel export routes"""
     try:
-        # Parse header config
-        header_config = parse_header_config(headerConfig)
-        if renderType:
-            try:
-                header_config["chartType"] = renderType
-            except Exception:
-                header_config = {"chartType": renderType}
-        elif chartType:
-            try:
-                header_config["chartType"] = chartType
-            except Exception:
-                header_config = {"chartType": chartType}
-        header_config = merge_header_config("comply", header_config)
-        
-        # Convert to boolean
-        onlyCard = convert_to_boolean(onlyCard)
-        onlyChart = convert_to_boolean(onlyChart)
-        onlyOverallTable = convert_to_boolean(onlyOverallTable)
-        
-        if onlyChart and not cardType and chartType:
-            cardType = chartType
-         
-        if onlyOverallTable and tableType:
-            cardType = tableType
-        
+        header_config, cardType, params = _normalize_export_query(q)
+
         # Require cardType for exports
         if not cardType:
             raise HTTPException(status_code=400, detail="cardType or chartType is required for exports")
 
-        # Fetch comply data from Node backend
-        node_api_url = os.getenv("NODE_API_BASE", "http://localhost:3002")
-        comply_url = f"{node_api_url}/api/grc/comply/all"
-        
-        params = {}
-        if startDate:
-            params['startDate'] = startDate
-        if endDate:
-            params['endDate'] = endDate
-        if functionId:
-            params['functionId'] = functionId
-
-        # Get auth token and cookies from request
+        # Snapshot auth/cookies from the request so the pipeline can run
+        # outside the request lifecycle (background jobs). request.cookies is
+        # already a plain per-request dict, so no defensive copy is needed.
         auth_header = request.headers.get('Authorization', '')
-        cookies = dict(request.cookies)
-        
-        # Forward all cookies to Node.js API for authentication
-        async with httpx.AsyncClient(cookies=cookies, follow_redirects=True) as client:
-            headers = {}
-            if auth_header:
-                headers['Authorization'] = auth_header
-            # Forward CSRF token if present
-            csrf_token = request.headers.get('X-CSRF-Token') or request.cookies.get('csrfToken')
-            if csrf_token:
-                headers['X-CSRF-Token'] = csrf_token
-            
-            response = await client.get(
-                comply_url,
-                params=params,
-                headers=headers,
-                timeout=60.0
-            )
-            response.raise_for_status()
-            comply_data = response.json()
-
-        # Map frontend chart/card IDs to backend report names
-        # Backend returns reports with descriptive names like "Survey Completion Rate", "Bank Questions details", etc.
-        report_name_map = {
-            # Chart IDs from frontend -> Backend report names
-            'surveysByStatus': 'Surveys by Status',
-            'complianceByStatus': 'Compliance per complianceStatus',
-            'complianceByProgress': 'Compliance per progressStatus',
-            'complianceByApproval': 'Compliance per approval_status',
-            'avgScorePerSurvey': 'Average Score Per Survey',
-            'complianceByControlCategory': 'Compliance by Control Category',
-            'topFailedControls': 'Top Failed Controls',
-            'controlsPerCategory': 'Controls no. per category',
-            'risksPerCategory': 'Risks no. per category',
-            'impactedAreasTrend': 'Impacted Areas Trend Over Time',
-            # Card IDs from frontend -> Backend report names
-            'totalSurveys': 'Surveys by Status',
-            'totalCompliance': 'Compliance Details',
-            'avgCompletionRate': 'Survey Completion Rate',
-            'complianceWithoutEvidence': 'Compliance controls without evidence',
-            # Table IDs from frontend -> Backend report names
-            'complianceDetails': 'Compliance Details',
-            'surveyCompletionRate': 'Survey Completion Rate',
-            'bankQuestionsDetails': 'Bank Questions details',
-            'risksPerCategoryDetails': 'Risks per category details',
-            'controlsPerCategoryDetails': 'Controls per category details',
-            'controlsPerDomainsDetails': 'Controls per domains Details',
-            'questionsPerCategory': 'Questions Per Category',
-            'impactedAreasByControls': 'Impacted Areas by Number of Linked Controls',
-            'surveyParticipationByDepartment': 'Survey Participation by Department',
-            'activeFunctions': 'Most Active vs Least Active Functions (Answer Count)',
-            'surveyCoverageByCategory': 'Survey Coverage by Category (How many categories included per survey)',
-            'complianceManagementDetails': 'Compliance managment details',
-            # Additional chart mappings
-            'questionsPerType': 'Questions no. per type',
-            'questionsPerReferences': 'Questions no. per References',
-            'controlNosPerDomains': 'Control Nos. per Domains',
-        }
-        
-        # Get the actual report name from the map, or use cardType as-is
-        report_name = report_name_map.get(cardType, cardType)
-        
-        # Try to get data from comply_data using the report name
-        # comply_data structure: { "Report Name": [data], ... }
-        export_data = comply_data.get(report_name, comply_data.get(cardType, []))
-        
-        # If still no data, try to find it by partial match
-        if not export_data and cardType:
-            for key in comply_data.keys():
-                if isinstance(key, str) and cardType.lower() in key.lower():
-                    export_data = comply_data[key]
-                    report_name = key
-                    break
-        
-        # Log for debugging
-        write_debug(f"Comply Excel export - cardType={cardType}, report_name={report_name}, data found={len(export_data) if isinstance(export_data, list) else 'N/A'}")
-        
-        # Prepare data for Excel generation
-        # Use cardType as the key so export service finds it immediately
-        # Also include report_name in case service needs it for fallback
-        comply_export_data = {cardType: export_data or []}
-        # Add report_name as well for service fallback lookup
-        if report_name != cardType:
-            comply_export_data[report_name] = export_data or []
-
-        # Generate Excel
-        write_debug(f"Calling generate_comply_excel with onlyCard={onlyCard}, onlyChart={onlyChart}, onlyOverallTable={onlyOverallTable}")
-        excel_content = await excel_service.generate_comply_excel(
-            comply_export_data,
-            startDate,
-            endDate,
-            header_config,
-            cardType,
-            onlyCard=onlyCard,
-            onlyOverallTable=onlyOverallTable,
-            onlyChart=onlyChart
+        cookies = request.cookies
+        csrf_token = request.headers.get('X-CSRF-Token') or request.cookies.get('csrfToken')
+        created_by = request.headers.get('X-User-Name') or auth_header or "System"
+
+        task_coro = _run_comply_export(
+            fmt,
+            params=params,
+            auth_header=auth_header,
+            cookies=cookies,
+            csrf_token=csrf_token,
+            header_config=header_config,
+            cardType=cardType,
+            onlyCard=q.onlyCard,
+            onlyChart=q.onlyChart,
+            onlyOverallTable=q.onlyOverallTable,
+            created_by=created_by,
+            startDate=q.startDate,
+            endDate=q.endDate
         )
 
-        if not excel_content:
-            raise HTTPException(status_code=500, detail="Excel generation failed")
+        if q.background:
+            return _submit_background_export(task_coro)
 
-        # Get user from request headers
-        created_by = request.headers.get('X-User-Name') or request.headers.get('Authorization') or "System"
-        
-        # Store readable report_name in header_config for filename generation
-        # Use cardType for database (like risks/controls dashboard)
-        if report_name and report_name != cardType:
-            if not header_config:
-                header_config = {}
-            header_config['export_title'] = report_name  # Store readable name for filename
-        
-        write_debug(f"[COMPLY EXCEL] Saving export - cardType={cardType}, report_name={report_name}")
-        write_debug(f"[COMPLY EXCEL] Excel content size: {len(excel_content) if excel_content else 0} bytes")
-        
-        # Save file and log to database - use cardType for database (like risks/controls)
-        try:
-            export_info = await save_and_log_export(
-                content=excel_content,
-                file_extension='xlsx',
-                dashboard='comply',
-                card_type=cardType,  # Use cardType for database (matches risks/controls pattern)
-                header_config=header_config,
-                created_by=created_by,
-                date_range={'startDate': startDate, 'endDate': endDate}
-            )
-            
-            filename = export_info['filename']
-            relative_path = export_info.get('relative_path', '')
-            export_id = export_info.get('export_id', '')
-            
-            write_debug(f"[COMPLY EXCEL] Export saved successfully:")
-            write_debug(f"  - Filename: {filename}")
-            write_debug(f"  - Relative path: {relative_path}")
-            write_debug(f"  - Export ID: {export_id}")
-            write_debug(f"Excel generated successfully for {cardType}: {filename}")
-        except Exception as save_err:
-            write_debug(f"[COMPLY EXCEL] Error saving export: {str(save_err)}")
-            import traceback
-            write_debug(f"[COMPLY EXCEL] Save error traceback: {traceback.format_exc()}")
-            raise
-
-        # Return Excel as file download
-        return Response(
-            content=excel_content,
-            media_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-            headers={
-                'Content-Disposition': f'attachment; filename="{filename}"',
-                'X-Export-Src': export_info['relative_path'],
-                'X-Export-Id': str(export_info.get('export_id', ''))
-            }
-        )
+        export_info = await task_coro
+
+        # Empty dataset - nothing was generated or saved
+        if export_info.get('empty'):
+            return Response(status_code=204, headers={'X-Export-Empty': 'true'})
+
+        # Return generated report as a chunked file download
+        return _export_file_response(export_info)
 
+    except HTTPException:
+        raise
     except Exception as e:
-        write_debug(f"Error during export_comply_excel: {str(e)}")
+        write_debug(f"Error during comply {fmt} export: {str(e)}")
         import traceback
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=f"Export failed: {str(e)}")
 
+
+@router.get("/api/grc/comply/export-pdf")
+async def export_comply_pdf(request: Request, q: ComplyExportQuery = Depends()):
+    """Export comply report in PDF format"""
+    return await _handle_comply_export('pdf', request, q)
+
+
+@router.get("/api/grc/comply/export-excel")
+async def export_comply_excel(request: Request, q: ComplyExportQuery = Depends()):
+    """Export comply report in Excel format"""
+    return await _handle_comply_export('xlsx', request, q)
@@ -3,16 +3,27 @@ API routes for the reporting system
 """
 import asyncio
 import json
-from datetime import datetime
+import re
+import traceback
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+from collections import Counter
+from datetime import datetime, date
 import os
+import aiofiles.os
 import httpx
+import numpy as np
+import pyodbc
+from config import get_database_connection_string
 from fastapi import APIRouter, Query, HTTPException, Request, UploadFile, File, Form
 from fastapi.responses import Response, FileResponse, StreamingResponse
+from pydantic import BaseModel
 from typing import Optional
 
 from services import APIService, PDFService, ExcelService, ControlService, IncidentService
 from services.bank_check_service import BankCheckService
 from services.enhanced_bank_check_service import EnhancedBankCheckService
+from services.export_log_batcher import ExportLogBatcher
 # Dashboard activity service moved to Node.js backend (NestJS)
 DashboardActivityService = None  # type: ignore
 from utils.export_utils import get_default_header_config
@@ -26,8 +37,11 @@ from routes.route_utils import (
     build_dynamic_sql_query,
     generate_excel_report,
     generate_word_report,
-    generate_pdf_report
+    generate_pdf_report,
+    render_report_offloaded
 )
+from utils.db_pool import get_connection_pool
+from utils.db_schema import ensure_report_exports_schema, ensure_dashboard_tables_schema
 
 # Initialize services
 api_service = APIService()
@@ -38,12 +52,75 @@ incident_service = IncidentService() if IncidentService else None
 dashboard_activity_service = DashboardActivityService() if DashboardActivityService else None
 bank_check_service = BankCheckService()
 enhanced_bank_check_service = EnhancedBankCheckService()
+export_log_batcher = ExportLogBatcher()
+
+# Matches int/float/scientific literals; cheaper than a try/except float()
+# per row when probing mixed-type chart columns
+_NUMERIC_RE = re.compile(r'^-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?$')
+
+# Validation constants hoisted to module scope so they aren't rebuilt on
+# every request
+# Blocked statement keywords for the execute-sql endpoint, fused into one
+# alternation so validation is a single scan of the query text
+_DANGEROUS_SQL_RE = re.compile(
+    r'\b(?:DROP|DELETE|UPDATE|INSERT|ALTER|CREATE|TRUNCATE|EXEC|EXECUTE)\b'
+)
+
+# Detects queries that already bound their own row count (SELECT TOP or
+# OFFSET ... ROWS paging), where injecting another TOP would be wrong
+_HAS_ROW_LIMIT_RE = re.compile(
+    r'(?is)^\s*SELECT\s+(?:DISTINCT\s+)?TOP\s*\(?\d|\bOFFSET\s+\d+\s+ROWS\b'
+)
+_SELECT_PREFIX_RE = re.compile(r'(?is)^(\s*SELECT\s+(?:DISTINCT\s+)?)')
+
+# Error-path helpers: one alternation scan finds likely datetime column
+# names for the CAST suggestion instead of compiling a regex per pattern,
+# and the driver's column-index extraction is compiled once
+_DATETIME_COL_RE = re.compile(
+    r'\b(\w*(?:createdat|created_at|updatedat|updated_at|deletedat|deleted_at|date|timestamp)\w*)\b',
+    re.IGNORECASE,
+)
+_COL_INDEX_RE = re.compile(r'column-index=(\d+)')
+
+_DASHBOARD_TYPES = frozenset({'incidents', 'kris', 'risks', 'controls'})
+_VALID_FORMATS = frozenset({'excel', 'pdf', 'word'})
+_FORMAT_MAP = {
+    'xlsx': 'excel',
+    'xls': 'excel',
+    'doc': 'word',
+    'docx': 'word',
+}
+_MEDIA_TYPES = {
+    'pdf': 'application/pdf',
+    'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+    'xls': 'application/vnd.ms-excel',
+    'docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+    'doc': 'application/msword',
+}
 
 # db_service points to control_service for backward compatibility
 db_service = control_service
 
+# orjson parses request bodies and serializes responses faster than the
+# stdlib json used by Starlette's defaults (same guard as comply routes)
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is in requirements.txt
+    orjson = None
+
 # Create router
-router = APIRouter()
+if orjson is not None:
+    from fastapi.responses import ORJSONResponse
+    router = APIRouter(default_response_class=ORJSONResponse)
+else:
+    router = APIRouter()
+
+
+async def _read_json_body(request: Request) -> dict:
+    """Parse the request body with orjson when available"""
+    if orjson is not None:
+        return orjson.loads(await request.body())
+    return await request.json()
 
 
 
@@ -56,78 +133,28 @@ router = APIRouter()
 async def log_report_export(request: Request):
     """Log an export (excel/pdf/word/zip) with title and src for later download listing."""
     try:
-        import pyodbc
-        from config import get_database_connection_string
-
-        body = await request.json()
+        body = await _read_json_body(request)
         title = (body.get("title") or "").strip() or "Untitled Report"
         src = (body.get("src") or "").strip()
         fmt = (body.get("format") or "").strip().lower() or "unknown"
         dashboard = (body.get("dashboard") or "").strip() or "general"
 
-        connection_string = get_database_connection_string()
-        conn = pyodbc.connect(connection_string)
-        cursor = conn.cursor()
-        try:
-            # Ensure table exists and has created_by column
-            cursor.execute(
-                """
-                IF NOT EXISTS (
-                  SELECT * FROM INFORMATION_SCHEMA.TABLES 
-                  WHERE TABLE_NAME = 'report_exports' AND TABLE_SCHEMA='dbo'
-                )
-                BEGIN
-                  CREATE TABLE dbo.report_exports (
-                    id INT IDENTITY(1,1) PRIMARY KEY,
-                    title NVARCHAR(255) NOT NULL,
-                    src NVARCHAR(1024) NULL,
-                    format NVARCHAR(20) NOT NULL,
-                    dashboard NVARCHAR(100) NULL,
-                    created_by NVARCHAR(255) NULL,
-                    created_at DATETIME2 DEFAULT GETDATE()
-                  )
-                END
-                """
-            )
-            conn.commit()
-
-            # Add created_by column if it doesn't exist (for existing tables)
-            try:
-                cursor.execute(
-                    """
-                    IF NOT EXISTS (
-                      SELECT * FROM INFORMATION_SCHEMA.COLUMNS 
-                      WHERE TABLE_NAME = 'report_exports' AND COLUMN_NAME = 'created_by'
-                    )
-                    BEGIN
-                      ALTER TABLE dbo.report_exports ADD created_by NVARCHAR(255) NULL
-                    END
-                    """
-                )
-                conn.commit()
-            except Exception:
-                pass  # Column might already exist
+        # Schema bootstrap runs once per process (startup or first call);
+        # keep the blocking DDL off the event loop
+        await asyncio.to_thread(ensure_report_exports_schema)
 
-            created_by = (body.get("created_by") or "").strip() or "System"
-            # Determine type based on dashboard
-            export_type = "transaction"  # Default
-            if dashboard and dashboard.lower() in ['incidents', 'kris', 'risks', 'controls']:
-                export_type = "dashboard"
-            
-            cursor.execute(
-                """
-                INSERT INTO dbo.report_exports (title, src, format, dashboard, type, created_by)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                (title, src, fmt, dashboard, export_type, created_by)
-            )
-            conn.commit()
+        created_by = (body.get("created_by") or "").strip() or "System"
+        # Determine type based on dashboard
+        export_type = "transaction"  # Default
+        if dashboard and dashboard.lower() in _DASHBOARD_TYPES:
+            export_type = "dashboard"
 
-            new_id = cursor.execute("SELECT @@IDENTITY").fetchone()[0]
-            return {"success": True, "id": int(new_id)}
-        finally:
-            cursor.close()
-            conn.close()
+        # Rows from concurrent requests are coalesced into one multi-row
+        # INSERT by the batcher; this awaits the id from the shared flush
+        new_id = await export_log_batcher.log(
+            (title, src, fmt, dashboard, export_type, created_by)
+        )
+        return {"success": True, "id": new_id}
     except Exception as e:
         return {"success": False, "error": str(e)}
 
@@ -135,149 +162,116 @@ async def log_report_export(request: Request):
 async def list_recent_exports(request: Request, limit: int = Query(50), page: int = Query(1), search: str = Query("")):
     """Return recent report exports (newest first) with simple pagination and dashboard filtering."""
     try:
-        import pyodbc
-        from config import get_database_connection_string
+        # Schema bootstrap runs once per process (startup or first call)
+        type_filter = request.query_params.get('type', None)
+        dashboard_filter = request.query_params.get('dashboard', None)
 
-        connection_string = get_database_connection_string()
-        conn = pyodbc.connect(connection_string)
-        cursor = conn.cursor()
-        try:
-            cursor.execute(
-                """
-                IF NOT EXISTS (
-                  SELECT * FROM INFORMATION_SCHEMA.TABLES 
-                  WHERE TABLE_NAME = 'report_exports' AND TABLE_SCHEMA='dbo'
-                )
-                BEGIN
-                  CREATE TABLE dbo.report_exports (
-                    id INT IDENTITY(1,1) PRIMARY KEY,
-                    title NVARCHAR(255) NOT NULL,
-                    src NVARCHAR(1024) NULL,
-                    format NVARCHAR(20) NOT NULL,
-                    dashboard NVARCHAR(100) NULL,
-                    type NVARCHAR(50) NULL,
-                    created_by NVARCHAR(255) NULL,
-                    created_at DATETIME2 DEFAULT GETDATE()
-                  )
-                END
-                """
-            )
-            conn.commit()
-            
-            # Add type column if it doesn't exist
-            try:
-                cursor.execute(
-                    """
-                    IF NOT EXISTS (
-                      SELECT * FROM INFORMATION_SCHEMA.COLUMNS 
-                      WHERE TABLE_NAME = 'report_exports' AND COLUMN_NAME = 'type'
-                    )
-                    BEGIN
-                      ALTER TABLE dbo.report_exports ADD type NVARCHAR(50) NULL
-                    END
-                    """
-                )
-                conn.commit()
-            except Exception:
-                pass
-            
-            # Add created_by column if it doesn't exist
+        def _list_sync():
+            """Blocking DB work, run off the event loop via to_thread"""
+            ensure_report_exports_schema()
+
+            pool = get_connection_pool()
+            conn = pool.acquire()
+            cursor = conn.cursor()
+            discard = False
             try:
-                cursor.execute(
-                    """
-                    IF NOT EXISTS (
-                      SELECT * FROM INFORMATION_SCHEMA.COLUMNS 
-                      WHERE TABLE_NAME = 'report_exports' AND COLUMN_NAME = 'created_by'
-                    )
-                    BEGIN
-                      ALTER TABLE dbo.report_exports ADD created_by NVARCHAR(255) NULL
-                    END
-                    """
-                )
-                conn.commit()
-            except Exception:
-                pass
+                # Build search condition
+                search_condition = ""
+                search_params = []
+                conditions = []
 
-            # Build search condition
-            search_condition = ""
-            search_params = []
-            conditions = []
-            
-            # Handle title search
-            if search and search.strip():
-                conditions.append("title LIKE ?")
-                search_params.append(f"%{search.strip()}%")
-            
-            # Handle type filter (prefer type over dashboard filter)
-            type_filter = request.query_params.get('type', None)
-            if type_filter:
-                if type_filter.lower() == 'dashboard':
-                    conditions.append("type = 'dashboard'")
-                elif type_filter.lower() == 'transaction':
-                    conditions.append("(type = 'transaction' OR type IS NULL)")
-            
-            # Fallback to dashboard filter if type is not provided (for backward compatibility)
-            elif request.query_params.get('dashboard', None):
-                dashboard_filter = request.query_params.get('dashboard')
-                dashboard_list = [d.strip() for d in dashboard_filter.split(',')]
-                if len(dashboard_list) == 1 and dashboard_list[0] == 'transaction':
-                    # Transaction reports: exclude dashboard reports or explicitly transaction
-                    conditions.append("(type = 'transaction' OR type IS NULL OR type != 'dashboard')")
-                elif len(dashboard_list) > 0:
-                    # Dashboard reports: filter by specific dashboard types
-                    conditions.append("type = 'dashboard'")
-            
-            # Combine all conditions
-            if conditions:
-                search_condition = "WHERE " + " AND ".join(conditions)
-
-            # Total count with search and filters
-            count_query = f"SELECT COUNT(*) FROM dbo.report_exports {search_condition}"
-            cursor.execute(count_query, search_params)
-            total_count = int(cursor.fetchone()[0])
-
-            # Pagination via OFFSET/FETCH
-            safe_limit = max(1, min(200, int(limit)))
-            safe_page = max(1, int(page))
-            offset = (safe_page - 1) * safe_limit
-            
-            select_query = f"""
-                SELECT id, title, src, format, dashboard, type, created_by, created_at
-                FROM dbo.report_exports
-                {search_condition}
-                ORDER BY created_at DESC, id DESC
-                OFFSET ? ROWS FETCH NEXT ? ROWS ONLY
-            """
-            cursor.execute(select_query, search_params + [offset, safe_limit])
-            rows = cursor.fetchall()
-            exports = [
-                {
-                    "id": int(r[0]),
-                    "title": r[1],
-                    "src": r[2],
-                    "format": r[3],
-                    "dashboard": r[4],
-                    "type": r[5] if len(r) > 5 else None,
-                    "created_by": r[6] if len(r) > 6 else "System",
-                    "created_at": r[7].isoformat() if len(r) > 7 and hasattr(r[7], 'isoformat') else (str(r[7]) if len(r) > 7 else "")
-                }
-                for r in rows
-            ]
-            return {
-                "success": True,
-                "exports": exports,
-                "pagination": {
-                    "page": safe_page,
-                    "limit": safe_limit,
-                    "total": total_count,
-                    "totalPages": (total_count + safe_limit - 1) // safe_limit,
-                    "hasNext": offset + safe_limit < total_count,
-                    "hasPrev": safe_page > 1
+                # Handle title search. If the caller supplies their own '%'
+                # wildcards the pattern is used as-is, so a prefix search like
+                # 'Risk%' can use an index seek. Plain terms keep substring
+                # semantics: '_' and '[' are LIKE metacharacters but ubiquitous
+                # literals in report titles, so they get escaped rather than
+                # treated as wildcards.
+                if search and search.strip():
+                    term = search.strip()
+                    if '%' in term:
+                        conditions.append("title LIKE ?")
+                        search_params.append(term)
+                    else:
+                        conditions.append("title LIKE ? ESCAPE '\\'")
+                        escaped = (term.replace('\\', '\\\\')
+                                       .replace('_', '\\_')
+                                       .replace('[', '\\['))
+                        search_params.append(f"%{escaped}%")
+
+                # Handle type filter (prefer type over dashboard filter)
+                if type_filter:
+                    if type_filter.lower() == 'dashboard':
+                        conditions.append("type = 'dashboard'")
+                    elif type_filter.lower() == 'transaction':
+                        conditions.append("(type = 'transaction' OR type IS NULL)")
+
+                # Fallback to dashboard filter if type is not provided (for backward compatibility)
+                elif dashboard_filter:
+                    dashboard_list = [d.strip() for d in dashboard_filter.split(',')]
+                    if len(dashboard_list) == 1 and dashboard_list[0] == 'transaction':
+                        # Transaction reports: exclude dashboard reports or explicitly transaction
+                        conditions.append("(type = 'transaction' OR type IS NULL OR type != 'dashboard')")
+                    elif len(dashboard_list) > 0:
+                        # Dashboard reports: filter by specific dashboard types
+                        conditions.append("type = 'dashboard'")
+
+                # Combine all conditions
+                if conditions:
+                    search_condition = "WHERE " + " AND ".join(conditions)
+
+                # Pagination via OFFSET/FETCH. COUNT(*) OVER() carries the total
+                # filtered count on every row, so one query serves both the page
+                # and the pagination metadata (no separate COUNT round-trip).
+                safe_limit = max(1, min(200, int(limit)))
+                safe_page = max(1, int(page))
+                offset = (safe_page - 1) * safe_limit
+
+                select_query = f"""
+                    SELECT id, title, src, format, dashboard, type, created_by, created_at,
+                           COUNT(*) OVER() AS total
+                    FROM dbo.report_exports
+                    {search_condition}
+                    ORDER BY created_at DESC, id DESC
+                    OFFSET ? ROWS FETCH NEXT ? ROWS ONLY
+                """
+                cursor.execute(select_query, search_params + [offset, safe_limit])
+                rows = cursor.fetchall()
+                total_count = int(rows[0][8]) if rows else 0
+                # The SELECT list is fixed at 9 columns, so unpack positionally -
+                # no per-row len()/hasattr() guards needed
+                exports = [
+                    {
+                        "id": int(row_id),
+                        "title": title,
+                        "src": src,
+                        "format": fmt,
+                        "dashboard": dashboard,
+                        "type": export_type,
+                        "created_by": created_by or "System",
+                        "created_at": created_at.isoformat() if created_at else ""
+                    }
+                    for row_id, title, src, fmt, dashboard, export_type, created_by, created_at, _total in rows
+                ]
+                return {
+                    "success": True,
+                    "exports": exports,
+                    "pagination": {
+                        "page": safe_page,
+                        "limit": safe_limit,
+                        "total": total_count,
+                        "totalPages": (total_count + safe_limit - 1) // safe_limit,
+                        "hasNext": offset + safe_limit < total_count,
+                        "hasPrev": safe_page > 1
+                    }
                 }
-            }
-        finally:
-            cursor.close()
-            conn.close()
+            except Exception:
+                discard = True
+                raise
+            finally:
+                cursor.close()
+                pool.release(conn, discard=discard)
+
+        return await asyncio.to_thread(_list_sync)
     except Exception as e:
         return {"success": False, "error": str(e), "exports": [], "pagination": {}}
 
@@ -285,36 +279,46 @@ async def list_recent_exports(request: Request, limit: int = Query(50), page: in
 async def delete_export(export_id: int):
     """Delete an export row and its file if present"""
     try:
-        import pyodbc
-        from config import get_database_connection_string
-        connection_string = get_database_connection_string()
-        conn = pyodbc.connect(connection_string)
-        cursor = conn.cursor()
-        try:
-            cursor.execute("SELECT src FROM dbo.report_exports WHERE id = ?", export_id)
-            row = cursor.fetchone()
-            if not row:
-                raise HTTPException(status_code=404, detail="Export not found")
-            src = row[0]
-
-            # Delete DB row
-            cursor.execute("DELETE FROM dbo.report_exports WHERE id = ?", export_id)
-            conn.commit()
-
-            # Delete file if exists
-            if src:
-                try:
-                    import os
-                    file_path = src if os.path.isabs(src) else os.path.join(os.getcwd(), src)
-                    if os.path.exists(file_path):
-                        os.remove(file_path)
-                except Exception as fe:
-                    return {"success": True, "deleted": True, "fileDeleted": False, "warning": str(fe)}
-
-            return {"success": True, "deleted": True, "fileDeleted": True}
-        finally:
-            cursor.close()
-            conn.close()
+        def _delete_sync():
+            """Blocking DB work, run off the event loop via to_thread"""
+            pool = get_connection_pool()
+            conn = pool.acquire()
+            cursor = conn.cursor()
+            discard = False
+            try:
+                # Delete and read back src in one round-trip
+                cursor.execute(
+                    "DELETE FROM dbo.report_exports OUTPUT DELETED.src WHERE id = ?",
+                    export_id,
+                )
+                row = cursor.fetchone()
+                if not row:
+                    conn.commit()
+                    raise HTTPException(status_code=404, detail="Export not found")
+                conn.commit()
+                return row[0]
+            except HTTPException:
+                raise
+            except Exception:
+                discard = True
+                raise
+            finally:
+                cursor.close()
+                pool.release(conn, discard=discard)
+
+        src = await asyncio.to_thread(_delete_sync)
+
+        # Delete file if exists - async removal so a slow disk/NFS unlink
+        # doesn't block the event loop
+        if src:
+            try:
+                file_path = src if os.path.isabs(src) else os.path.join(os.getcwd(), src)
+                if await aiofiles.os.path.exists(file_path):
+                    await aiofiles.os.remove(file_path)
+            except Exception as fe:
+                return {"success": True, "deleted": True, "fileDeleted": False, "warning": str(fe)}
+
+        return {"success": True, "deleted": True, "fileDeleted": True}
     except HTTPException:
         raise
     except Exception as e:
@@ -324,7 +328,7 @@ async def delete_export(export_id: int):
 async def generate_dynamic_report(request: Request):
     """Generate dynamic report based on table selection, joins, columns, and conditions"""
     try:
-        body = await request.json()
+        body = await _read_json_body(request)
         tables = body.get('tables', [])
         joins = body.get('joins', [])
         columns = body.get('columns', [])
@@ -342,65 +346,71 @@ async def generate_dynamic_report(request: Request):
             format_type = 'excel'
         
         # Map common format variations
-        format_mapping = {
-            'xlsx': 'excel',
-            'xls': 'excel',
-            'doc': 'word',
-            'docx': 'word',
-        }
-        format_type = format_mapping.get(format_type, format_type)
-        
+        format_type = _FORMAT_MAP.get(format_type, format_type)
+
         # Validate format
-        valid_formats = ['excel', 'pdf', 'word']
-        if format_type not in valid_formats:
+        if format_type not in _VALID_FORMATS:
             write_debug(f"[Dynamic Report] Invalid format received: '{format_type_raw}' (normalized: '{format_type}'), defaulting to 'excel'")
             format_type = 'excel'
         
-        write_debug(f"[Dynamic Report] Request received: tables={tables}, columns={columns}, valid_columns={valid_columns}, format={format_type} (original: {format_type_raw})")
+        write_debug(lambda: f"[Dynamic Report] Request received: tables={tables}, columns={columns}, valid_columns={valid_columns}, format={format_type} (original: {format_type_raw})")
         
         if not tables or not valid_columns:
             raise HTTPException(status_code=400, detail="Tables and valid columns are required")
         
-        # Build SQL query using valid columns (without '#')
+        # Build SQL query using valid columns (without '#'); filter values
+        # come back separately and are bound as parameters
         try:
-            sql_query = build_dynamic_sql_query(tables, joins, valid_columns, where_conditions, time_filter)
-            write_debug(f"[Dynamic Report] SQL query built: {sql_query[:200]}...")
+            sql_query, sql_params = build_dynamic_sql_query(tables, joins, valid_columns, where_conditions, time_filter)
+            write_debug(lambda: f"[Dynamic Report] SQL query built: {sql_query[:200]}...")
         except Exception as sql_err:
             write_debug(f"[Dynamic Report] SQL query build failed: {str(sql_err)}")
             raise HTTPException(status_code=400, detail=f"Failed to build SQL query: {str(sql_err)}")
         
         # Execute query and get data
-        import pyodbc
-        from config import get_database_connection_string
-        
         try:
-            connection_string = get_database_connection_string()
-            conn = pyodbc.connect(connection_string)
+            pool = get_connection_pool()
+            conn = await asyncio.to_thread(pool.acquire)
             cursor = conn.cursor()
+            # Tell the driver to pull rows in big blocks; fetchmany below
+            # uses the same size so each round-trip fills one buffer
+            cursor.arraysize = 10000
         except Exception as db_err:
             write_debug(f"[Dynamic Report] Database connection failed: {str(db_err)}")
             raise HTTPException(status_code=500, detail=f"Database connection failed: {str(db_err)}")
-        
+
+        discard = False
         try:
-            cursor.execute(sql_query)
-            rows = cursor.fetchall()
-            write_debug(f"[Dynamic Report] Query executed, fetched {len(rows)} rows")
-            
-            # Get column names from cursor description
-            column_names = [desc[0] for desc in cursor.description] if cursor.description else []
-            
-            # Convert to list of dictionaries (for chart data extraction) and list of lists (for table)
-            data_rows_dict = []
-            data_rows = []
-            for row in rows:
-                row_dict = {}
-                row_list = []
-                for idx, cell in enumerate(row):
-                    col_name = column_names[idx] if idx < len(column_names) else f"col_{idx}"
-                    row_dict[col_name] = cell
-                    row_list.append(str(cell) if cell is not None else '')
-                data_rows_dict.append(row_dict)
-                data_rows.append(row_list)
+            def _fetch_report_rows():
+                """Blocking execute + fetch, run off the event loop"""
+                if sql_params:
+                    cursor.execute(sql_query, sql_params)
+                else:
+                    cursor.execute(sql_query)
+
+                # Get column names from cursor description
+                column_names = [desc[0] for desc in cursor.description] if cursor.description else []
+
+                # Stream the result set in batches instead of materializing it
+                # all at once with fetchall - keeps driver-side memory flat.
+                # Raw driver rows are kept as-is; the chart branch reads them
+                # positionally, so no per-row dicts are built anymore
+                raw_rows = []
+                data_rows = []
+                _to_s = str  # local binding skips a global lookup per cell
+                while True:
+                    batch = cursor.fetchmany(cursor.arraysize)
+                    if not batch:
+                        break
+                    raw_rows.extend(batch)
+                    data_rows.extend(
+                        [_to_s(cell) if cell is not None else '' for cell in row]
+                        for row in batch
+                    )
+                return column_names, raw_rows, data_rows
+
+            column_names, raw_rows, data_rows = await asyncio.to_thread(_fetch_report_rows)
+            write_debug(lambda: f"[Dynamic Report] Query executed, fetched {len(data_rows)} rows")
             
             # Add index column at the beginning for all dynamic reports
             # Add "#" or "Index" as the first column header
@@ -409,58 +419,34 @@ async def generate_dynamic_report(request: Request):
             columns_with_index = [index_column_name] + valid_columns
             
             # Add index number (1, 2, 3, ...) to the beginning of each data row
-            data_rows_with_index = []
+            # (in place - these rows are already our own lists)
             for idx, row in enumerate(data_rows, start=1):
-                data_rows_with_index.append([str(idx)] + row)
-            
-            # Also add index column to data_rows_dict for chart processing
-            for idx, row_dict in enumerate(data_rows_dict, start=1):
-                row_dict[index_column_name] = str(idx)
-            
-            # Use the modified columns and data
+                row.insert(0, str(idx))
+
+            # Use the modified columns
             columns = columns_with_index
-            data_rows = data_rows_with_index
-            
-            write_debug(f"[Dynamic Report] Added index column, total columns: {len(columns)}, total rows: {len(data_rows)}")
-            write_debug(f"[Dynamic Report] data_rows_dict length: {len(data_rows_dict)}")
-            if data_rows_dict:
-                write_debug(f"[Dynamic Report] data_rows_dict[0] keys: {list(data_rows_dict[0].keys())}")
+
+            write_debug(lambda: f"[Dynamic Report] Added index column, total columns: {len(columns)}, total rows: {len(data_rows)}")
             
             # Get header configuration from request body
             header_config = body.get('headerConfig', {})
-            write_debug(f"[Dynamic Report] Raw header_config keys: {list(header_config.keys()) if header_config else 'None'}")
-            write_debug(f"[Dynamic Report] chartConfig in header_config: {header_config.get('chartConfig') if header_config else 'N/A'}")
-            
+
             if header_config:
-                from utils.export_utils import get_default_header_config
                 default_config = get_default_header_config("dynamic")
                 merged_config = {**default_config, **header_config}
             else:
-                from utils.export_utils import get_default_header_config
                 merged_config = get_default_header_config("dynamic")
-            
-            write_debug(f"[Dynamic Report] Merged config keys: {list(merged_config.keys())}")
-            
+
             # Transform chartConfig to chart_data format if chartConfig exists
             # Check both merged_config and original header_config (in case it was filtered out)
             chart_config_raw = merged_config.get('chartConfig') or header_config.get('chartConfig')
-            write_debug(f"[Dynamic Report] chart_config_raw from merged_config: {merged_config.get('chartConfig')}")
-            write_debug(f"[Dynamic Report] chart_config_raw from header_config: {header_config.get('chartConfig')}")
-            write_debug(f"[Dynamic Report] chart_config_raw final: {chart_config_raw}")
-            write_debug(f"[Dynamic Report] chart_config_raw type: {type(chart_config_raw)}")
-            
+
             # Filter out None/null values
             if chart_config_raw is None or (isinstance(chart_config_raw, dict) and not chart_config_raw.get('xKey') and not chart_config_raw.get('yKey')):
                 chart_config = None
-                write_debug(f"[Dynamic Report] chart_config filtered out - was None or missing both xKey and yKey")
             else:
                 chart_config = chart_config_raw
-            write_debug(f"[Dynamic Report] chart_config extracted (after filtering): {chart_config}")
-            
-            if chart_config:
-                write_debug(f"[Dynamic Report] chart_config type: {type(chart_config)}")
-                write_debug(f"[Dynamic Report] chart_config details: type={chart_config.get('type') if isinstance(chart_config, dict) else 'N/A'}, xKey={chart_config.get('xKey') if isinstance(chart_config, dict) else 'N/A'}, yKey={chart_config.get('yKey') if isinstance(chart_config, dict) else 'N/A'}")
-            
+
             # Check conditions more explicitly
             has_chart_config = chart_config is not None and isinstance(chart_config, dict)
             x_key_val = chart_config.get('xKey') if has_chart_config else None
@@ -477,25 +463,20 @@ async def generate_dynamic_report(request: Request):
                     y_str = str(y_key_val).strip()
                     has_y_key = y_str != '' and y_str.lower() != 'none'
             
-            has_data = len(data_rows_dict) > 0
-            
-            write_debug(f"[Dynamic Report] Chart conditions - has_chart_config: {has_chart_config}, x_key_val: {x_key_val}, y_key_val: {y_key_val}, has_x_key: {has_x_key}, has_y_key: {has_y_key}, has_data: {has_data}")
-            
+            has_data = len(raw_rows) > 0
+
+            # Column matches are reported in the summary log after the branch
+            x_col_match = None
+            y_col_match = None
+
             if has_chart_config and has_x_key and has_y_key and has_data:
                 try:
                     x_key = str(x_key_val).strip()
                     y_key = str(y_key_val).strip()
                     chart_type = chart_config.get('type', 'bar')
-                    
-                    write_debug(f"[Dynamic Report] Building chart data from xKey={x_key}, yKey={y_key}, type={chart_type}")
-                    
-                    # Get available column names from first row
-                    available_cols = list(data_rows_dict[0].keys()) if data_rows_dict else []
-                    write_debug(f"[Dynamic Report] Available columns: {available_cols}")
-                    
-                    # Try to find matching column names (case-insensitive, handle table prefixes)
-                    x_col_match = None
-                    y_col_match = None
+
+                    # Column names come straight from the cursor description
+                    available_cols = list(column_names)
                     
                     # Normalize x_key and y_key (remove table prefix if present, lowercase)
                     x_key_normalized = x_key.split('.')[-1].lower() if '.' in x_key else x_key.lower()
@@ -507,48 +488,64 @@ async def generate_dynamic_report(request: Request):
                     if y_key == '#' or y_key_normalized == '#':
                         y_col_match = '#'
                     
-                    # Try exact match first, then normalized match
+                    # Build one lookup dict and resolve both keys with O(1)
+                    # gets: exact name wins, then the un-prefixed lowercase
+                    # name, then the full lowercase name (setdefault keeps the
+                    # first column for each alias, like the old scan did)
+                    col_index = {}
                     for col in available_cols:
-                        col_normalized = col.split('.')[-1].lower() if '.' in col else col.lower()
-                        # Exact match (case-sensitive)
-                        if not x_col_match and col == x_key:
-                            x_col_match = col
-                        # Normalized match (case-insensitive, without table prefix)
-                        elif not x_col_match and col_normalized == x_key_normalized:
-                            x_col_match = col
-                        # Also try matching the full normalized string
-                        elif not x_col_match and col.lower() == x_key.lower():
-                            x_col_match = col
-                            
-                        # Same for y_key
-                        if not y_col_match and col == y_key:
-                            y_col_match = col
-                        elif not y_col_match and col_normalized == y_key_normalized:
-                            y_col_match = col
-                        elif not y_col_match and col.lower() == y_key.lower():
-                            y_col_match = col
-                    
-                    write_debug(f"[Dynamic Report] Column matches - xKey: {x_key} -> {x_col_match}, yKey: {y_key} -> {y_col_match}")
-                    
+                        col_index.setdefault(col, col)
+                        col_index.setdefault(col.split('.')[-1].lower() if '.' in col else col.lower(), col)
+                        col_index.setdefault(col.lower(), col)
+
+                    if not x_col_match:
+                        x_col_match = (col_index.get(x_key)
+                                       or col_index.get(x_key_normalized)
+                                       or col_index.get(x_key.lower()))
+                    if not y_col_match:
+                        y_col_match = (col_index.get(y_key)
+                                       or col_index.get(y_key_normalized)
+                                       or col_index.get(y_key.lower()))
+
                     if not x_col_match or not y_col_match:
-                        write_debug(f"[Dynamic Report] Could not find matching columns for chart. xKey={x_key}, yKey={y_key}, available_cols={available_cols}")
+                        write_debug(lambda: f"[Dynamic Report] Could not find matching columns for chart. xKey={x_key}, yKey={y_key}, available_cols={available_cols}")
                     else:
-                        # Extract labels and values from data_rows_dict
+                        # Resolve column positions once; the synthetic '#'
+                        # index column has no position (None) and is derived
+                        # from the row number below
+                        col_pos = {name: i for i, name in enumerate(column_names)}
+                        x_pos = col_pos.get(x_col_match)
+                        y_pos = col_pos.get(y_col_match)
+
+                        # Extract labels and values from the raw rows
                         # Special handling: if yKey is '#', count occurrences instead of summing
                         if y_col_match == '#':
-                            # Count occurrences of each xKey value
-                            from collections import Counter
-                            x_values = []
-                            for row_dict in data_rows_dict:
-                                x_val = row_dict.get(x_col_match)
-                                if x_val is not None:
-                                    x_values.append(str(x_val))
-                            
-                            # Count occurrences
-                            counter = Counter(x_values)
-                            labels = list(counter.keys())
-                            values = list(counter.values())
-                            write_debug(f"[Dynamic Report] Counting occurrences (yKey='#') - {len(labels)} unique labels")
+                            # Count occurrences of each xKey value, preferring a
+                            # SQL GROUP BY over a Python Counter pass. The synthetic
+                            # '#' index column only exists client-side, so it keeps
+                            # the Python path.
+                            labels = values = None
+                            if x_col_match != '#':
+                                try:
+                                    labels, values = await asyncio.to_thread(
+                                        _fetch_group_counts, cursor, sql_query, sql_params, x_col_match)
+                                except Exception as agg_err:
+                                    write_debug(f"[Dynamic Report] SQL chart aggregation failed, counting in Python: {str(agg_err)}")
+                                    labels = values = None
+                            if labels is None:
+                                if x_pos is None:
+                                    # xKey is the synthetic index - every row is
+                                    # its own label with a count of 1
+                                    labels = [str(i) for i in range(1, len(raw_rows) + 1)]
+                                    values = [1] * len(raw_rows)
+                                else:
+                                    counter = Counter(
+                                        str(row[x_pos])
+                                        for row in raw_rows
+                                        if row[x_pos] is not None
+                                    )
+                                    labels = list(counter.keys())
+                                    values = list(counter.values())
                         else:
                             # Normal extraction: use yKey values
                             labels = []
@@ -556,52 +553,55 @@ async def generate_dynamic_report(request: Request):
                             
                             # Check if yKey values are numeric
                             sample_y_vals = []
-                            for row_dict in data_rows_dict[:10]:  # Check first 10 rows
-                                y_val = row_dict.get(y_col_match)
+                            for row in raw_rows[:10]:  # Check first 10 rows
+                                y_val = row[y_pos]
                                 if y_val is not None:
                                     sample_y_vals.append(y_val)
                             
-                            # Determine if yKey is numeric
+                            # Determine if yKey is numeric (no try/except probe)
                             is_y_numeric = False
                             if sample_y_vals:
-                                try:
-                                    float(sample_y_vals[0])
-                                    is_y_numeric = True
-                                except (ValueError, TypeError):
-                                    is_y_numeric = False
-                            
-                            write_debug(f"[Dynamic Report] yKey numeric check - is_numeric: {is_y_numeric}, sample values: {sample_y_vals[:3]}")
-                            
+                                sample = sample_y_vals[0]
+                                is_y_numeric = (
+                                    isinstance(sample, (int, float))
+                                    or _NUMERIC_RE.match(str(sample).strip()) is not None
+                                )
+
                             # If yKey is not numeric and chart type is pie, group by yKey and count
                             # This makes more sense for pie charts - show distribution of yKey values
                             if not is_y_numeric and chart_type == 'pie':
-                                from collections import Counter
-                                y_values = []
-                                for row_dict in data_rows_dict:
-                                    y_val = row_dict.get(y_col_match)
-                                    if y_val is not None:
-                                        y_values.append(str(y_val))
-                                
-                                # Count occurrences of each yKey value (e.g., status distribution)
-                                counter = Counter(y_values)
-                                labels = list(counter.keys())
-                                values = list(counter.values())
-                                write_debug(f"[Dynamic Report] Counting yKey occurrences (yKey is categorical) - {len(labels)} unique categories: {labels[:10]}")
+                                # Distribution of yKey values (e.g. status counts) -
+                                # grouped in SQL when possible
+                                labels = values = None
+                                try:
+                                    labels, values = await asyncio.to_thread(
+                                        _fetch_group_counts, cursor, sql_query, sql_params, y_col_match)
+                                except Exception as agg_err:
+                                    write_debug(f"[Dynamic Report] SQL chart aggregation failed, counting in Python: {str(agg_err)}")
+                                    labels = values = None
+                                if labels is None:
+                                    counter = Counter(
+                                        str(row[y_pos])
+                                        for row in raw_rows
+                                        if row[y_pos] is not None
+                                    )
+                                    labels = list(counter.keys())
+                                    values = list(counter.values())
                             else:
                                 # Normal extraction: use yKey values (must be numeric)
-                                for row_dict in data_rows_dict:
-                                    x_val = row_dict.get(x_col_match)
-                                    y_val = row_dict.get(y_col_match)
-                                    
+                                for idx, row in enumerate(raw_rows, start=1):
+                                    x_val = row[x_pos] if x_pos is not None else str(idx)
+                                    y_val = row[y_pos]
+
                                     if x_val is not None and y_val is not None:
-                                        # Convert y_val to number if possible
-                                        try:
-                                            y_num = float(y_val) if not isinstance(y_val, (int, float)) else y_val
+                                        # Branch on type/regex instead of paying
+                                        # exception setup for every bad row
+                                        if isinstance(y_val, (int, float)):
+                                            labels.append(str(x_val))
+                                            values.append(y_val)
+                                        elif _NUMERIC_RE.match(str(y_val).strip()):
                                             labels.append(str(x_val))
-                                            values.append(y_num)
-                                        except (ValueError, TypeError):
-                                            write_debug(f"[Dynamic Report] Skipping row - yKey value '{y_val}' is not numeric")
-                                            continue
+                                            values.append(float(y_val))
                         
                         if len(labels) > 0 and len(values) > 0:
                             # Create chart_data in the format expected by generate_excel_report
@@ -611,16 +611,17 @@ async def generate_dynamic_report(request: Request):
                                 'type': chart_type
                             }
                             merged_config['chart_type'] = chart_type
-                            write_debug(f"[Dynamic Report] Chart data created: {len(labels)} labels, {len(values)} values")
-                        else:
-                            write_debug(f"[Dynamic Report] No valid chart data extracted - labels={len(labels)}, values={len(values)}")
                 except Exception as e:
                     write_debug(f"[Dynamic Report] Error processing chartConfig: {str(e)}")
-                    import traceback
                     write_debug(f"[Dynamic Report] Traceback: {traceback.format_exc()}")
-            else:
-                write_debug(f"[Dynamic Report] No chartConfig found or missing xKey/yKey")
-                write_debug(f"[Dynamic Report] Debug - chart_config={chart_config}, xKey={chart_config.get('xKey') if chart_config and isinstance(chart_config, dict) else None}, yKey={chart_config.get('yKey') if chart_config and isinstance(chart_config, dict) else None}, data_rows_dict_len={len(data_rows_dict)}")
+
+            # One structured summary instead of per-step chart debug lines
+            write_debug(lambda: (
+                f"[Dynamic Report] Chart summary - has_chart_config: {has_chart_config}, "
+                f"x_col_match: {x_col_match}, y_col_match: {y_col_match}, "
+                f"type: {chart_config.get('type') if has_chart_config else None}, "
+                f"labels: {len((merged_config.get('chart_data') or {}).get('labels', []))}"
+            ))
             
             # Get export type from request (transaction or dashboard)
             # Default to 'transaction' for dynamic reports if not specified
@@ -629,41 +630,32 @@ async def generate_dynamic_report(request: Request):
                 export_type = 'transaction'
             
             write_debug(f"[Dynamic Report] Export type: {export_type}")
-            
-            # Debug: Check what's in merged_config before generating report
-            write_debug(f"[Dynamic Report] Before report generation - merged_config has chart_data: {'chart_data' in merged_config}")
-            write_debug(f"[Dynamic Report] Before report generation - chart_data value: {merged_config.get('chart_data')}")
-            write_debug(f"[Dynamic Report] Before report generation - chartConfig value: {merged_config.get('chartConfig')}")
-            
+
             # Final check: if chartConfig exists but chart_data doesn't, log warning
             if merged_config.get('chartConfig') and not merged_config.get('chart_data'):
-                write_debug(f"[Dynamic Report] WARNING: chartConfig exists but chart_data was not created!")
-                write_debug(f"[Dynamic Report] chartConfig details: {merged_config.get('chartConfig')}")
-                write_debug(f"[Dynamic Report] This usually means xKey/yKey didn't match available columns or data extraction failed.")
-            
+                write_debug(f"[Dynamic Report] WARNING: chartConfig exists but chart_data was not created - xKey/yKey likely didn't match available columns")
+
             # Generate report based on format
             report_content = None
             file_extension = format_type
-            write_debug(f"[Dynamic Report] About to generate report - format_type: '{format_type}', type: {type(format_type)}")
             try:
+                # to_thread keeps the event loop free while the render runs:
+                # render_report_offloaded blocks on the worker process for
+                # large exports and renders in-process for small ones
                 if format_type == 'excel':
                     write_debug(f"[Dynamic Report] Generating Excel report...")
-                    write_debug(f"[Dynamic Report] RIGHT BEFORE Excel generation - merged_config keys: {list(merged_config.keys())}")
-                    write_debug(f"[Dynamic Report] RIGHT BEFORE Excel generation - chart_data in merged_config: {'chart_data' in merged_config}")
-                    write_debug(f"[Dynamic Report] RIGHT BEFORE Excel generation - chart_data value: {merged_config.get('chart_data')}")
-                    write_debug(f"[Dynamic Report] RIGHT BEFORE Excel generation - chart_data type: {type(merged_config.get('chart_data'))}")
-                    if merged_config.get('chart_data'):
-                        cd = merged_config.get('chart_data')
-                        write_debug(f"[Dynamic Report] RIGHT BEFORE Excel generation - chart_data has labels: {bool(cd.get('labels'))}, has values: {bool(cd.get('values'))}, labels count: {len(cd.get('labels', []))}, values count: {len(cd.get('values', []))}")
-                    report_content = generate_excel_report(columns, data_rows, merged_config)
+                    report_content = await asyncio.to_thread(
+                        render_report_offloaded, 'excel', columns, data_rows, merged_config)
                     file_extension = 'xlsx'
                 elif format_type == 'word':
                     write_debug(f"[Dynamic Report] Generating Word report...")
-                    report_content = generate_word_report(columns, data_rows, merged_config)
+                    report_content = await asyncio.to_thread(
+                        render_report_offloaded, 'word', columns, data_rows, merged_config)
                     file_extension = 'docx'
                 elif format_type == 'pdf':
                     write_debug(f"[Dynamic Report] Generating PDF report...")
-                    report_content = generate_pdf_report(columns, data_rows, merged_config)
+                    report_content = await asyncio.to_thread(
+                        render_report_offloaded, 'pdf', columns, data_rows, merged_config)
                     file_extension = 'pdf'
                 else:
                     write_debug(f"[Dynamic Report] ERROR: Unsupported format '{format_type}' (type: {type(format_type)}). Valid formats: excel, pdf, word")
@@ -671,7 +663,6 @@ async def generate_dynamic_report(request: Request):
                 write_debug(f"[Dynamic Report] Report generated successfully, size: {len(report_content)} bytes")
             except Exception as gen_err:
                 write_debug(f"[Dynamic Report] Report generation failed: {str(gen_err)}")
-                import traceback
                 write_debug(f"[Dynamic Report] Traceback: {traceback.format_exc()}")
                 raise HTTPException(status_code=500, detail=f"Failed to generate report: {str(gen_err)}")
             
@@ -709,7 +700,6 @@ async def generate_dynamic_report(request: Request):
                 write_debug(f"  - Created by: {created_by}")
             except Exception as save_err:
                 write_debug(f"[Dynamic Report] Save failed: {str(save_err)}")
-                import traceback
                 write_debug(f"[Dynamic Report] Save traceback: {traceback.format_exc()}")
                 # Continue even if save fails - still return the file
                 export_info = {
@@ -717,55 +707,85 @@ async def generate_dynamic_report(request: Request):
                     'relative_path': '',
                     'export_id': None
                 }
-            
+
             # Determine media type
-            media_types = {
-                'pdf': 'application/pdf',
-                'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-                'docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
+            media_type = _MEDIA_TYPES.get(file_extension, 'application/octet-stream')
+
+            response_headers = {
+                'Content-Disposition': f'attachment; filename="{export_info["filename"]}"',
+                'X-Export-Src': export_info['relative_path'],
+                'X-Export-Id': str(export_info.get('export_id', '')),
+                # xlsx/docx are already zip containers and PDF streams are
+                # deflated; identity tells GZipMiddleware not to recompress
+                'Content-Encoding': 'identity'
             }
-            media_type = media_types.get(file_extension, 'application/octet-stream')
-            
-            # Return file with headers
+
+            # Serve the file save_and_log_export just wrote instead of
+            # keeping a second copy of the bytes alive in the response -
+            # FileResponse streams from disk (sendfile where available)
+            saved_path = export_info.get('file_path')
+            if saved_path and os.path.exists(saved_path):
+                del report_content
+                return FileResponse(
+                    saved_path,
+                    media_type=media_type,
+                    filename=export_info['filename'],
+                    headers=response_headers
+                )
+
+            # Save failed - fall back to the in-memory bytes
             return Response(
                 content=report_content,
                 media_type=media_type,
-                headers={
-                    'Content-Disposition': f'attachment; filename="{export_info["filename"]}"',
-                    'X-Export-Src': export_info['relative_path'],
-                    'X-Export-Id': str(export_info.get('export_id', ''))
-                }
+                headers=response_headers
             )
-                
+
+        except HTTPException:
+            raise
+        except Exception:
+            discard = True
+            raise
         finally:
             cursor.close()
-            conn.close()
-            
+            pool.release(conn, discard=discard)
+
     except HTTPException:
         raise
     except Exception as e:
         write_debug(f"[Dynamic Report] Unexpected error: {str(e)}")
-        import traceback
         write_debug(f"[Dynamic Report] Full traceback: {traceback.format_exc()}")
         raise HTTPException(status_code=500, detail=f"Failed to generate dynamic report: {str(e)}")
 
 
+class PreviewRequestBody(BaseModel):
+    """Preview request payload, parsed by pydantic-core instead of dict.get.
+
+    Field types stay loose (dict shapes are validated downstream by the SQL
+    builder) so the accepted payloads are the same as the old manual parse.
+    """
+    tables: List[str] = []
+    joins: List[Dict[str, Any]] = []
+    columns: List[str] = []
+    whereConditions: List[Dict[str, Any]] = []
+    timeFilter: Optional[Dict[str, Any]] = None
+    previewLimit: int = 200
+
+
 @router.post("/api/reports/dynamic/preview")
-async def preview_dynamic_report(request: Request):
+async def preview_dynamic_report(body: PreviewRequestBody):
     """
     Preview dynamic report data for transactions before export.
     Returns JSON with columns and limited rows instead of a file.
     """
     try:
-        body = await request.json()
-        tables = body.get('tables', [])
-        joins = body.get('joins', [])
-        columns = body.get('columns', [])
-        where_conditions = body.get('whereConditions', [])
-        time_filter = body.get('timeFilter')
-        preview_limit = int(body.get('previewLimit', 200))
+        tables = body.tables
+        joins = body.joins
+        columns = body.columns
+        where_conditions = body.whereConditions
+        time_filter = body.timeFilter
+        preview_limit = int(body.previewLimit)
 
-        write_debug(f"[Dynamic Report Preview] Request received: tables={tables}, columns={columns}")
+        write_debug(lambda: f"[Dynamic Report Preview] Request received: tables={tables}, columns={columns}")
 
         if not tables or not columns:
             raise HTTPException(status_code=400, detail="Tables and columns are required")
@@ -778,108 +798,153 @@ async def preview_dynamic_report(request: Request):
 
         # Build SQL query
         try:
-            sql_query = build_dynamic_sql_query(tables, joins, valid_columns, where_conditions, time_filter)
-            write_debug(f"[Dynamic Report Preview] SQL query built: {sql_query[:200]}...")
+            sql_query, sql_params = build_dynamic_sql_query(tables, joins, valid_columns, where_conditions, time_filter)
+            write_debug(lambda: f"[Dynamic Report Preview] SQL query built: {sql_query[:200]}...")
         except Exception as sql_err:
             write_debug(f"[Dynamic Report Preview] SQL query build failed: {str(sql_err)}")
             raise HTTPException(status_code=400, detail=f"Failed to build SQL query: {str(sql_err)}")
 
         # Execute query and get data
-        import pyodbc
-        from config import get_database_connection_string
+        def _preview_sync():
+            """Blocking DB work, run off the event loop via to_thread"""
+            try:
+                pool = get_connection_pool()
+                conn = pool.acquire()
+                cursor = conn.cursor()
+            except Exception as db_err:
+                write_debug(f"[Dynamic Report Preview] Database connection failed: {str(db_err)}")
+                raise HTTPException(status_code=500, detail=f"Database connection failed: {str(db_err)}")
 
-        try:
-            connection_string = get_database_connection_string()
-            conn = pyodbc.connect(connection_string)
-            cursor = conn.cursor()
-        except Exception as db_err:
-            write_debug(f"[Dynamic Report Preview] Database connection failed: {str(db_err)}")
-            raise HTTPException(status_code=500, detail=f"Database connection failed: {str(db_err)}")
+            discard = False
+            try:
+                # Push the preview limit into the query itself so SQL Server
+                # can stop producing rows at the cap instead of running the
+                # full plan and having the driver truncate client-side
+                preview_sql = re.sub(
+                    r'^\s*SELECT\b', f'SELECT TOP ({int(preview_limit)})',
+                    sql_query, count=1, flags=re.IGNORECASE
+                )
+                if sql_params:
+                    cursor.execute(preview_sql, sql_params)
+                else:
+                    cursor.execute(preview_sql)
+                # fetchmany keeps the client-side bound as a belt-and-braces
+                rows = cursor.fetchmany(preview_limit)
+                write_debug(lambda: f"[Dynamic Report Preview] Query executed, fetched {len(rows)} preview rows")
 
-        try:
-            cursor.execute(sql_query)
-            rows = cursor.fetchall()
-            total_rows = len(rows)
-            write_debug(f"[Dynamic Report Preview] Query executed, fetched {total_rows} rows")
+                # Total comes from a COUNT over the same query - a single scalar
+                # instead of transferring every row just to len() it
+                count_sql = f"SELECT COUNT(*) FROM ({sql_query}) t"
+                if sql_params:
+                    cursor.execute(count_sql, sql_params)
+                else:
+                    cursor.execute(count_sql)
+                total_rows = int(cursor.fetchone()[0])
 
-            # Add index column like the export endpoint
-            index_column_name = "#"
-            columns_with_index = [index_column_name] + columns
+                # Add index column like the export endpoint
+                index_column_name = "#"
+                columns_with_index = [index_column_name] + columns
 
-            preview_rows = []
-            for idx, row in enumerate(rows[:preview_limit], start=1):
-                row_values = [str(cell) if cell is not None else '' for cell in row]
-                row_with_index = [str(idx)] + row_values
-                # Convert to dict keyed by column names for easier consumption on frontend
-                preview_rows.append(dict(zip(columns_with_index, row_with_index)))
+                # Vectorized cell conversion: NULL -> '' and str() run in
+                # numpy's ufunc loop instead of a Python loop per cell. The
+                # array stays dtype=object throughout - astype(str) would
+                # build a fixed-width <U array sized rows x cols x the
+                # longest cell, so one long text/JSON value multiplies the
+                # allocation by orders of magnitude
+                if rows:
+                    arr = np.asarray([tuple(r) for r in rows], dtype=object)
+                    arr[arr == None] = ''  # noqa: E711 - elementwise NULL test
+                    arr = np.frompyfunc(str, 1, 1)(arr)
+                    idx_col = np.frompyfunc(str, 1, 1)(
+                        np.arange(1, len(rows) + 1, dtype=object).reshape(-1, 1))
+                    preview_rows = np.hstack([idx_col, arr]).tolist()
+                else:
+                    preview_rows = []
+                # Columnar payload: "columns" is sent once and each row is a
+                # plain value list in the same order, instead of per-row dicts
+                # that repeat every column name N times. The frontend zips
+                # columns with each row (rows[i][j] belongs to columns[j]).
 
-            return {
-                "success": True,
-                "columns": columns_with_index,
-                "rows": preview_rows,
-                "total": total_rows,
-                "previewLimit": preview_limit,
-            }
-        finally:
-            cursor.close()
-            conn.close()
+                return {
+                    "success": True,
+                    "columns": columns_with_index,
+                    "rows": preview_rows,
+                    "total": total_rows,
+                    "previewLimit": preview_limit,
+                }
+            except HTTPException:
+                raise
+            except Exception:
+                discard = True
+                raise
+            finally:
+                cursor.close()
+                pool.release(conn, discard=discard)
+
+        return await asyncio.to_thread(_preview_sync)
     except HTTPException:
         raise
     except Exception as e:
         write_debug(f"[Dynamic Report Preview] Unexpected error: {str(e)}")
-        import traceback
         write_debug(f"[Dynamic Report Preview] Full traceback: {traceback.format_exc()}")
         raise HTTPException(status_code=500, detail=f"Failed to preview dynamic report: {str(e)}")
 
 
 @router.get("/api/exports/{export_id}/download")
-async def download_export(export_id: int):
+async def download_export(export_id: int, request: Request):
     """Download a saved export file by ID"""
     try:
-        import pyodbc
-        from config import get_database_connection_string
-        import os
-        
-        connection_string = get_database_connection_string()
-        conn = pyodbc.connect(connection_string)
-        cursor = conn.cursor()
+        def _lookup_sync():
+            """Blocking DB work, run off the event loop via to_thread"""
+            pool = get_connection_pool()
+            conn = pool.acquire()
+            cursor = conn.cursor()
+            discard = False
+            try:
+                cursor.execute("SELECT src, format FROM dbo.report_exports WHERE id = ?", export_id)
+                row = cursor.fetchone()
+                if not row:
+                    raise HTTPException(status_code=404, detail="Export not found")
+                return row[0], row[1] or 'pdf'
+            except HTTPException:
+                raise
+            except Exception:
+                discard = True
+                raise
+            finally:
+                cursor.close()
+                pool.release(conn, discard=discard)
+
+        src, fmt = await asyncio.to_thread(_lookup_sync)
+
+        if not src:
+            raise HTTPException(status_code=404, detail="Export file not found")
+
+        # Build file path
+        base_dir = os.path.dirname(os.path.dirname(__file__))
+        file_path = os.path.join(base_dir, src)
+
         try:
-            cursor.execute("SELECT src, format FROM dbo.report_exports WHERE id = ?", export_id)
-            row = cursor.fetchone()
-            if not row:
-                raise HTTPException(status_code=404, detail="Export not found")
-            
-            src = row[0]
-            fmt = row[1] or 'pdf'
-            
-            if not src:
-                raise HTTPException(status_code=404, detail="Export file not found")
-            
-            # Build file path
-            base_dir = os.path.dirname(os.path.dirname(__file__))
-            file_path = os.path.join(base_dir, src)
-            
-            if not os.path.exists(file_path):
-                raise HTTPException(status_code=404, detail="Export file not found on disk")
-            
-            # Determine media type
-            media_types = {
-                'pdf': 'application/pdf',
-                'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-                'xls': 'application/vnd.ms-excel',
-                'docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
-                'doc': 'application/msword'
-            }
-            media_type = media_types.get(fmt.lower(), 'application/octet-stream')
-            
-            return FileResponse(
-                file_path,
-                media_type=media_type,
-                filename=os.path.basename(file_path)
-            )
-        finally:
-            cursor.close()
-            conn.close()
+            st = os.stat(file_path)
+        except OSError:
+            raise HTTPException(status_code=404, detail="Export file not found on disk")
+
+        # Export files are immutable once written, so mtime+size make a
+        # stable validator; a matching If-None-Match skips the transfer
+        etag = f'W/"{st.st_mtime_ns:x}-{st.st_size:x}"'
+        if request.headers.get('if-none-match') == etag:
+            return Response(status_code=304, headers={'ETag': etag})
+
+        # Determine media type
+        media_type = _MEDIA_TYPES.get(fmt.lower(), 'application/octet-stream')
+
+        return FileResponse(
+            file_path,
+            media_type=media_type,
+            filename=os.path.basename(file_path),
+            # identity skips GZipMiddleware: these formats are pre-compressed
+            headers={'ETag': etag, 'Content-Encoding': 'identity'}
+        )
     except HTTPException:
         raise
     except Exception as e:
@@ -890,46 +955,37 @@ async def download_export(export_id: int):
 async def save_report_schedule(request: Request):
     """Save scheduled report configuration"""
     try:
-        body = await request.json()
+        body = await _read_json_body(request)
         report_config = body.get('reportConfig', {})
         schedule = body.get('schedule', {})
         
-        # Save to database (you can create a scheduled_reports table)
-        import pyodbc
-        from config import get_database_connection_string
-        
-        connection_string = get_database_connection_string()
-        conn = pyodbc.connect(connection_string)
-        cursor = conn.cursor()
-        
-        try:
-            # Create table if not exists
-            cursor.execute("""
-                IF NOT EXISTS (SELECT * FROM sysobjects WHERE name='scheduled_reports' and xtype='U')
-                CREATE TABLE scheduled_reports (
-                    id INT IDENTITY(1,1) PRIMARY KEY,
-                    report_config NVARCHAR(MAX) NOT NULL,
-                    schedule_config NVARCHAR(MAX) NOT NULL,
-                    is_active BIT DEFAULT 1,
-                    created_at DATETIME2 DEFAULT GETDATE()
-                );
-            """)
-            conn.commit()
-            
-            # Insert schedule
-            import json
-            cursor.execute("""
-                INSERT INTO scheduled_reports (report_config, schedule_config)
-                VALUES (?, ?)
-            """, json.dumps(report_config), json.dumps(schedule))
-            conn.commit()
-            
-            return {"success": True, "message": "Schedule saved successfully"}
-            
-        finally:
-            cursor.close()
-            conn.close()
-            
+        def _save_schedule_sync():
+            """Blocking DB work, run off the event loop via to_thread"""
+            # Schema bootstrap runs once per process (startup or first call)
+            ensure_dashboard_tables_schema()
+
+            pool = get_connection_pool()
+            conn = pool.acquire()
+            cursor = conn.cursor()
+            discard = False
+            try:
+                # Insert schedule
+                cursor.execute("""
+                    INSERT INTO scheduled_reports (report_config, schedule_config)
+                    VALUES (?, ?)
+                """, json.dumps(report_config), json.dumps(schedule))
+                conn.commit()
+
+                return {"success": True, "message": "Schedule saved successfully"}
+            except Exception:
+                discard = True
+                raise
+            finally:
+                cursor.close()
+                pool.release(conn, discard=discard)
+
+        return await asyncio.to_thread(_save_schedule_sync)
+
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to save schedule: {str(e)}")
 
@@ -938,7 +994,7 @@ async def save_report_schedule(request: Request):
 async def save_chart_to_dynamic_dashboard(request: Request):
     """Save chart configuration to dynamic dashboard"""
     try:
-        body = await request.json()
+        body = await _read_json_body(request)
         
         # Extract chart configuration
         chart_config = {
@@ -959,169 +1015,147 @@ async def save_chart_to_dynamic_dashboard(request: Request):
         user_id = user.get('id') if user else None
         user_name = user.get('name') or user.get('userName') or request.headers.get('X-User-Name') or "System"
         
-        from config import get_database_connection_string
-        import pyodbc
-        import json
-        
-        connection_string = get_database_connection_string()
-        conn = pyodbc.connect(connection_string, timeout=30)
-        cursor = conn.cursor()
-        
-        try:
-            # Create table if not exists
-            cursor.execute("""
-                IF NOT EXISTS (SELECT * FROM sysobjects WHERE name='dynamic_dashboard_charts' and xtype='U')
-                CREATE TABLE dynamic_dashboard_charts (
-                    id INT IDENTITY(1,1) PRIMARY KEY,
-                    user_id NVARCHAR(500),
-                    user_name NVARCHAR(500),
-                    chart_config NVARCHAR(MAX) NOT NULL,
-                    title NVARCHAR(1000),
-                    chart_type NVARCHAR(100),
-                    is_active BIT DEFAULT 1,
-                    created_at DATETIME2 DEFAULT GETDATE(),
-                    updated_at DATETIME2 DEFAULT GETDATE()
-                );
-            """)
-            conn.commit()
-            
-            # Alter existing table columns if they're too small (for existing tables)
+        def _save_chart_sync():
+            """Blocking DB work, run off the event loop via to_thread"""
+            # Schema bootstrap runs once per process (startup or first call)
+            ensure_dashboard_tables_schema()
+
+            pool = get_connection_pool()
+            conn = pool.acquire()
+            cursor = conn.cursor()
+            discard = False
             try:
+                # Insert chart configuration
+                # Truncate fields to fit database constraints
+                # orjson encodes large configs several times faster than stdlib
+                # json; pyodbc needs str for NVARCHAR so decode the bytes
+                if orjson is not None:
+                    chart_config_json = orjson.dumps(chart_config).decode('utf-8')
+                else:
+                    chart_config_json = json.dumps(chart_config)
+                # NVARCHAR(MAX) can hold up to 2GB, but let's ensure it's reasonable
+                if len(chart_config_json) > 10000000:  # 10MB limit
+                    write_debug(f"Warning: chart_config JSON is very large ({len(chart_config_json)} bytes), truncating")
+                    chart_config_json = chart_config_json[:10000000]
+
+                title = (chart_config.get('title', 'Dynamic Chart') or 'Dynamic Chart')[:1000]  # Limit to 1000 chars
+                chart_type = (chart_config.get('chartType', 'bar') or 'bar')[:100]  # Limit to 100 chars
+                user_id_str = (user_id or '')[:500] if user_id else None  # Limit to 500 chars
+                user_name_str = (user_name or 'System')[:500]  # Limit to 500 chars
+
                 cursor.execute("""
-                    IF EXISTS (SELECT * FROM INFORMATION_SCHEMA.COLUMNS 
-                               WHERE TABLE_NAME = 'dynamic_dashboard_charts' AND COLUMN_NAME = 'title' 
-                               AND CHARACTER_MAXIMUM_LENGTH < 1000)
-                    ALTER TABLE dynamic_dashboard_charts ALTER COLUMN title NVARCHAR(1000);
-                """)
-                cursor.execute("""
-                    IF EXISTS (SELECT * FROM INFORMATION_SCHEMA.COLUMNS 
-                               WHERE TABLE_NAME = 'dynamic_dashboard_charts' AND COLUMN_NAME = 'chart_type' 
-                               AND CHARACTER_MAXIMUM_LENGTH < 100)
-                    ALTER TABLE dynamic_dashboard_charts ALTER COLUMN chart_type NVARCHAR(100);
-                """)
-                cursor.execute("""
-                    IF EXISTS (SELECT * FROM INFORMATION_SCHEMA.COLUMNS 
-                               WHERE TABLE_NAME = 'dynamic_dashboard_charts' AND COLUMN_NAME = 'user_id' 
-                               AND CHARACTER_MAXIMUM_LENGTH < 500)
-                    ALTER TABLE dynamic_dashboard_charts ALTER COLUMN user_id NVARCHAR(500);
-                """)
-                cursor.execute("""
-                    IF EXISTS (SELECT * FROM INFORMATION_SCHEMA.COLUMNS 
-                               WHERE TABLE_NAME = 'dynamic_dashboard_charts' AND COLUMN_NAME = 'user_name' 
-                               AND CHARACTER_MAXIMUM_LENGTH < 500)
-                    ALTER TABLE dynamic_dashboard_charts ALTER COLUMN user_name NVARCHAR(500);
-                """)
+                    INSERT INTO dynamic_dashboard_charts (user_id, user_name, chart_config, title, chart_type)
+                    OUTPUT INSERTED.id
+                    VALUES (?, ?, ?, ?, ?)
+                """, user_id_str, user_name_str, chart_config_json, title, chart_type)
+                chart_id = cursor.fetchone()[0]
                 conn.commit()
-            except Exception as alter_err:
-                write_debug(f"Note: Could not alter table columns (may not exist yet): {str(alter_err)}")
-            
-            # Insert chart configuration
-            # Truncate fields to fit database constraints
-            chart_config_json = json.dumps(chart_config)
-            # NVARCHAR(MAX) can hold up to 2GB, but let's ensure it's reasonable
-            if len(chart_config_json) > 10000000:  # 10MB limit
-                write_debug(f"Warning: chart_config JSON is very large ({len(chart_config_json)} bytes), truncating")
-                chart_config_json = chart_config_json[:10000000]
-            
-            title = (chart_config.get('title', 'Dynamic Chart') or 'Dynamic Chart')[:1000]  # Limit to 1000 chars
-            chart_type = (chart_config.get('chartType', 'bar') or 'bar')[:100]  # Limit to 100 chars
-            user_id_str = (user_id or '')[:500] if user_id else None  # Limit to 500 chars
-            user_name_str = (user_name or 'System')[:500]  # Limit to 500 chars
-            
-            cursor.execute("""
-                INSERT INTO dynamic_dashboard_charts (user_id, user_name, chart_config, title, chart_type)
-                VALUES (?, ?, ?, ?, ?)
-            """, user_id_str, user_name_str, chart_config_json, title, chart_type)
-            conn.commit()
-            
-            # Get the inserted ID
-            cursor.execute("SELECT SCOPE_IDENTITY()")
-            chart_id = cursor.fetchone()[0]
-            
-            return {
-                "success": True,
-                "message": "Chart saved to dynamic dashboard successfully",
-                "chartId": chart_id
-            }
-            
-        finally:
-            cursor.close()
-            conn.close()
-            
+
+                return {
+                    "success": True,
+                    "message": "Chart saved to dynamic dashboard successfully",
+                    "chartId": chart_id
+                }
+            except Exception:
+                discard = True
+                raise
+            finally:
+                cursor.close()
+                pool.release(conn, discard=discard)
+
+        return await asyncio.to_thread(_save_chart_sync)
+
     except Exception as e:
         write_debug(f"Error saving chart to dynamic dashboard: {str(e)}")
-        import traceback
         write_debug(f"Traceback: {traceback.format_exc()}")
         raise HTTPException(status_code=500, detail=f"Failed to save chart: {str(e)}")
 
 
+# Once the charts table has been seen, later requests skip the
+# INFORMATION_SCHEMA probe - tables are never dropped at runtime
+_charts_table_seen = False
+
+
 @router.get("/api/reports/dynamic-dashboard/charts")
-async def get_dynamic_dashboard_charts(request: Request):
-    """Get all saved charts for dynamic dashboard"""
+async def get_dynamic_dashboard_charts(request: Request, limit: int = Query(50), offset: int = Query(0)):
+    """Get saved charts for dynamic dashboard (newest first, paged)"""
     try:
         # Get user from request.state (set by auth middleware)
         user = getattr(request.state, 'user', None)
         user_id = user.get('id') if user else None
-        
-        from config import get_database_connection_string
-        import pyodbc
-        import json
-        
-        connection_string = get_database_connection_string()
-        conn = pyodbc.connect(connection_string, timeout=30)
-        cursor = conn.cursor()
-        
-        try:
-            # Check if table exists
-            cursor.execute("""
-                SELECT COUNT(*) FROM INFORMATION_SCHEMA.TABLES 
-                WHERE TABLE_NAME = 'dynamic_dashboard_charts'
-            """)
-            table_exists = cursor.fetchone()[0] > 0
-            
-            if not table_exists:
-                return {"success": True, "charts": []}
-            
-            # Get all active charts (show all charts for now, can filter by user later if needed)
-            # For now, show all charts to all users so they can see shared charts
-            cursor.execute("""
-                SELECT id, user_id, user_name, chart_config, title, chart_type, created_at, updated_at
-                FROM dynamic_dashboard_charts
-                WHERE is_active = 1
-                ORDER BY created_at DESC
-            """)
-            
-            rows = cursor.fetchall()
-            write_debug(f"[Dynamic Dashboard] Found {len(rows)} charts in database")
-            charts = []
-            
-            for row in rows:
-                chart_id, db_user_id, db_user_name, chart_config_json, title, chart_type, created_at, updated_at = row
-                try:
-                    chart_config = json.loads(chart_config_json) if chart_config_json else {}
-                    charts.append({
-                        'id': chart_id,
-                        'userId': db_user_id,
-                        'userName': db_user_name,
-                        'title': title or chart_config.get('title', 'Dynamic Chart'),
-                        'chartType': chart_type or chart_config.get('chartType', 'bar'),
-                        'config': chart_config,
-                        'createdAt': created_at.isoformat() if created_at else None,
-                        'updatedAt': updated_at.isoformat() if updated_at else None,
-                    })
-                except json.JSONDecodeError:
-                    write_debug(f"Error parsing chart config for chart ID {chart_id}")
-                    continue
-            
-            return {"success": True, "charts": charts}
-            
-        finally:
-            cursor.close()
-            conn.close()
-            
+
+        def _get_charts_sync():
+            """Blocking DB work, run off the event loop via to_thread"""
+            global _charts_table_seen
+            pool = get_connection_pool()
+            conn = pool.acquire()
+            cursor = conn.cursor()
+            discard = False
+            try:
+                # Check if table exists (only until the first positive answer;
+                # after that every request skips this extra round-trip)
+                if not _charts_table_seen:
+                    cursor.execute("""
+                        SELECT COUNT(*) FROM INFORMATION_SCHEMA.TABLES
+                        WHERE TABLE_NAME = 'dynamic_dashboard_charts'
+                    """)
+                    if cursor.fetchone()[0] == 0:
+                        return {"success": True, "charts": []}
+                    _charts_table_seen = True
+
+                # Get active charts (show all charts for now, can filter by user
+                # later if needed). Server-side paging keeps the NVARCHAR(MAX)
+                # chart_config blobs transferred per request bounded instead of
+                # shipping the whole table every call.
+                safe_limit = max(1, min(200, int(limit)))
+                safe_offset = max(0, int(offset))
+                cursor.execute("""
+                    SELECT id, user_id, user_name, chart_config, title, chart_type, created_at, updated_at
+                    FROM dynamic_dashboard_charts
+                    WHERE is_active = 1
+                    ORDER BY created_at DESC
+                    OFFSET ? ROWS FETCH NEXT ? ROWS ONLY
+                """, safe_offset, safe_limit)
+
+                rows = cursor.fetchall()
+                write_debug(f"[Dynamic Dashboard] Found {len(rows)} charts in database")
+                charts = []
+
+                for row in rows:
+                    chart_id, db_user_id, db_user_name, chart_config_json, title, chart_type, created_at, updated_at = row
+                    try:
+                        if not chart_config_json:
+                            chart_config = {}
+                        elif orjson is not None:
+                            chart_config = orjson.loads(chart_config_json)
+                        else:
+                            chart_config = json.loads(chart_config_json)
+                        charts.append({
+                            'id': chart_id,
+                            'userId': db_user_id,
+                            'userName': db_user_name,
+                            'title': title or chart_config.get('title', 'Dynamic Chart'),
+                            'chartType': chart_type or chart_config.get('chartType', 'bar'),
+                            'config': chart_config,
+                            'createdAt': created_at.isoformat() if created_at else None,
+                            'updatedAt': updated_at.isoformat() if updated_at else None,
+                        })
+                    except ValueError:  # covers json and orjson decode errors
+                        write_debug(f"Error parsing chart config for chart ID {chart_id}")
+                        continue
+
+                return {"success": True, "charts": charts}
+            except Exception:
+                discard = True
+                raise
+            finally:
+                cursor.close()
+                pool.release(conn, discard=discard)
+
+        return await asyncio.to_thread(_get_charts_sync)
+
     except Exception as e:
         write_debug(f"Error getting dynamic dashboard charts: {str(e)}")
-        import traceback
         write_debug(f"Traceback: {traceback.format_exc()}")
         raise HTTPException(status_code=500, detail=f"Failed to get charts: {str(e)}")
 
@@ -1133,41 +1167,46 @@ async def delete_dynamic_dashboard_chart(chart_id: int, request: Request):
         # Get user from request.state (set by auth middleware)
         user = getattr(request.state, 'user', None)
         user_id = user.get('id') if user else None
-        
-        from config import get_database_connection_string
-        import pyodbc
-        
-        connection_string = get_database_connection_string()
-        conn = pyodbc.connect(connection_string, timeout=30)
-        cursor = conn.cursor()
-        
-        try:
-            # Soft delete (set is_active = 0)
-            if user_id:
-                cursor.execute("""
-                    UPDATE dynamic_dashboard_charts
-                    SET is_active = 0, updated_at = GETDATE()
-                    WHERE id = ? AND (user_id = ? OR user_id IS NULL)
-                """, chart_id, user_id)
-            else:
-                cursor.execute("""
-                    UPDATE dynamic_dashboard_charts
-                    SET is_active = 0, updated_at = GETDATE()
-                    WHERE id = ?
-                """, chart_id)
-            
-            conn.commit()
-            deleted = cursor.rowcount > 0
-            
-            if not deleted:
-                raise HTTPException(status_code=404, detail="Chart not found")
-            
-            return {"success": True, "message": "Chart deleted successfully"}
-            
-        finally:
-            cursor.close()
-            conn.close()
-            
+
+        def _delete_chart_sync():
+            """Blocking DB work, run off the event loop via to_thread"""
+            pool = get_connection_pool()
+            conn = pool.acquire()
+            cursor = conn.cursor()
+            discard = False
+            try:
+                # Soft delete (set is_active = 0)
+                if user_id:
+                    cursor.execute("""
+                        UPDATE dynamic_dashboard_charts
+                        SET is_active = 0, updated_at = GETDATE()
+                        WHERE id = ? AND (user_id = ? OR user_id IS NULL)
+                    """, chart_id, user_id)
+                else:
+                    cursor.execute("""
+                        UPDATE dynamic_dashboard_charts
+                        SET is_active = 0, updated_at = GETDATE()
+                        WHERE id = ?
+                    """, chart_id)
+
+                conn.commit()
+                deleted = cursor.rowcount > 0
+
+                if not deleted:
+                    raise HTTPException(status_code=404, detail="Chart not found")
+
+                return {"success": True, "message": "Chart deleted successfully"}
+            except HTTPException:
+                raise
+            except Exception:
+                discard = True
+                raise
+            finally:
+                cursor.close()
+                pool.release(conn, discard=discard)
+
+        return await asyncio.to_thread(_delete_chart_sync)
+
     except HTTPException:
         raise
     except Exception as e:
@@ -1175,26 +1214,77 @@ async def delete_dynamic_dashboard_chart(chart_id: int, request: Request):
         raise HTTPException(status_code=500, detail=f"Failed to delete chart: {str(e)}")
 
 
+def _fetch_group_counts(cursor, sql_query, sql_params, group_col):
+    """Aggregate chart label counts in SQL instead of a Python Counter pass.
+
+    Wraps the dynamic report query and lets SQL Server group it, so the
+    client receives O(unique labels) rows instead of re-counting every row.
+    """
+    escaped = group_col.replace(']', ']]')
+    chart_sql = (
+        f"SELECT [{escaped}] AS label, COUNT(*) AS value "
+        f"FROM ({sql_query}) t WHERE [{escaped}] IS NOT NULL GROUP BY [{escaped}]"
+    )
+    if sql_params:
+        cursor.execute(chart_sql, sql_params)
+    else:
+        cursor.execute(chart_sql)
+    pairs = cursor.fetchall()
+    labels = [str(label) for label, _ in pairs]
+    values = [int(count) for _, count in pairs]
+    return labels, values
+
+
+def _convert_passthrough(value):
+    """JSON-native cell types pass through; NULL keeps the legacy '' form"""
+    return value if value is not None else ''
+
+
+# cursor.description[i][1] is the Python type pyodbc decodes column i into.
+# JSON-native types skip convert_value_safely's isinstance ladder entirely;
+# anything else (datetime, bytes, Decimal, ...) still goes through it.
+_EXEC_SQL_CONVERTERS = {
+    str: _convert_passthrough,
+    int: _convert_passthrough,
+    float: _convert_passthrough,
+    bool: _convert_passthrough,
+}
+
+
+@lru_cache(maxsize=256)
+def _validate_select_only(sql_query: str):
+    """Return a rejection message for non-SELECT SQL, or None when allowed.
+
+    Dashboards re-run the same handful of queries on every refresh, so the
+    verdict is memoized on the exact query text - repeat calls skip the
+    uppercase copy and the keyword scan entirely.
+    """
+    sql_upper = sql_query.upper().strip()
+    if not sql_upper.startswith('SELECT'):
+        return "Only SELECT statements are allowed"
+    # Word boundaries keep "CREATE" from matching inside "createdAt"
+    danger_match = _DANGEROUS_SQL_RE.search(sql_upper)
+    if danger_match:
+        return f"Operation '{danger_match.group(0)}' is not allowed"
+    return None
+
+
 def convert_value_safely(value):
     """Safely convert a database value to string"""
+    if value is None:
+        return ''
+    if type(value) is str:  # most common case: return as-is, no copy
+        return value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    # Try to convert to string, fallback to repr or placeholder
     try:
-        if value is None:
-            return ''
-        elif isinstance(value, (str, int, float, bool)):
-            return str(value)
-        elif isinstance(value, (datetime, date)):
-            return value.isoformat()
-        else:
-            # Try to convert to string, fallback to repr or placeholder
-            try:
-                return str(value)
-            except (TypeError, ValueError, UnicodeEncodeError):
-                try:
-                    return repr(value)
-                except:
-                    return '[Unsupported Type]'
-    except Exception as e:
-        return '[Conversion Error]'
+        return str(value)
+    except (TypeError, ValueError, UnicodeEncodeError):
+        try:
+            return repr(value)
+        except Exception:
+            return '[Unsupported Type]'
 
 
 @router.post("/api/reports/execute-sql")
@@ -1204,7 +1294,7 @@ async def execute_sql_query(request: Request):
     Only SELECT statements are allowed for security.
     """
     try:
-        body = await request.json()
+        body = await _read_json_body(request)
         sql_query = body.get('sql', '').strip()
         limit = int(body.get('limit', 1000))
         
@@ -1213,94 +1303,68 @@ async def execute_sql_query(request: Request):
         if not sql_query:
             raise HTTPException(status_code=400, detail="SQL query is required")
         
-        # Security: Only allow SELECT statements
-        sql_upper = sql_query.upper().strip()
-        if not sql_upper.startswith('SELECT'):
-            write_debug(f"[Execute SQL] Rejected: Query does not start with SELECT")
-            raise HTTPException(status_code=400, detail="Only SELECT statements are allowed")
-        
-        # Prevent dangerous operations
-        # Use word boundaries to avoid matching keywords inside other words
-        # (e.g., "CREATE" should not match inside "createdAt" or "CAST(createdAt")
-        dangerous_keywords = ['DROP', 'DELETE', 'UPDATE', 'INSERT', 'ALTER', 'CREATE', 'TRUNCATE', 'EXEC', 'EXECUTE']
-        
-        import re
-        for keyword in dangerous_keywords:
-            # Use word boundary regex to match only whole words
-            # \b ensures we match "CREATE" as a word, not "CREATE" inside "createdAt"
-            pattern = rf'\b{re.escape(keyword)}\b'
-            if re.search(pattern, sql_upper):
-                write_debug(f"[Execute SQL] Rejected: Found dangerous keyword '{keyword}'")
-                raise HTTPException(status_code=400, detail=f"Operation '{keyword}' is not allowed")
-        
-        # Automatically wrap common datetime column names with CAST to avoid unsupported type errors
-        # This handles columns like createdAt, created_at, updatedAt, updated_at, date, timestamp, etc.
-        datetime_column_patterns = [
-            r'\bcreatedAt\b', r'\bcreated_at\b', r'\bupdatedAt\b', r'\bupdated_at\b',
-            r'\bdeletedAt\b', r'\bdeleted_at\b', r'\bdate\b', r'\btimestamp\b',
-            r'\bdatetime\b', r'\bdatetime2\b', r'\bdatetimeoffset\b'
-        ]
-        
-        import re
-        modified_query = sql_query
-        for pattern in datetime_column_patterns:
-            # Find columns that match datetime patterns and aren't already CAST
-            matches = re.finditer(pattern, sql_query, re.IGNORECASE)
-            for match in matches:
-                col_name = match.group(0)
-                # Check if it's already wrapped in CAST
-                start_pos = match.start()
-                end_pos = match.end()
-                
-                # Look backwards and forwards to see if it's already in a CAST
-                before = sql_query[max(0, start_pos-10):start_pos].upper()
-                after = sql_query[end_pos:min(len(sql_query), end_pos+10)].upper()
-                
-                if 'CAST' not in before and 'AS VARCHAR' not in after:
-                    # Wrap the column name with CAST
-                    # This is a simple replacement - for complex queries, user should CAST manually
-                    # We'll only do this for simple SELECT column patterns
-                    if re.search(rf'\b{re.escape(col_name)}\b', sql_query, re.IGNORECASE):
-                        # Replace in SELECT clause only (simple case)
-                        # For complex queries, we'll let the error happen and show helpful message
-                        pass
-        
-        # For now, we'll let the query run and handle errors gracefully
-        # Users can CAST datetime columns manually: CAST(createdAt AS VARCHAR(MAX)) AS createdAt
-        
-        write_debug(f"[Execute SQL] Executing query: {sql_query[:200]}...")
-        
-        # Execute query
-        import pyodbc
-        from config import get_database_connection_string
-        from datetime import datetime, date
-        
-        connection_string = get_database_connection_string()
-        conn = pyodbc.connect(connection_string, timeout=30)
-        cursor = conn.cursor()
-        
-        # Set output converter to handle unsupported types by converting to string
-        def handle_unsupported_type(value):
-            """Converter for unsupported SQL types"""
+        # Security: Only allow SELECT statements. The verdict is memoized per
+        # query text since dashboards re-submit identical SQL on every refresh.
+        rejection = _validate_select_only(sql_query)
+        if rejection:
+            write_debug(f"[Execute SQL] Rejected: {rejection}")
+            raise HTTPException(status_code=400, detail=rejection)
+
+        # Datetime columns need no SELECT-list rewriting: pooled connections
+        # register an output converter for DATETIMEOFFSET - the one type
+        # pyodbc cannot decode - so those columns come back on the first
+        # execution. The CAST suggestion in the error handler below remains
+        # as a safety net for any other exotic column type.
+
+        # Push the row cap into the query itself (SELECT TOP (n)) so SQL
+        # Server stops producing rows at the limit instead of shipping the
+        # whole result for client-side truncation. Queries that already
+        # carry TOP or OFFSET/FETCH paging are left untouched.
+        exec_sql = sql_query
+        if not _HAS_ROW_LIMIT_RE.search(sql_query):
+            exec_sql = _SELECT_PREFIX_RE.sub(
+                rf'\g<1>TOP ({int(limit)}) ', sql_query, count=1
+            )
+            write_debug(lambda: f"[Execute SQL] Injected TOP: {exec_sql[:200]}...")
+
+        write_debug(f"[Execute SQL] Executing query: {exec_sql[:200]}...")
+
+        # Execute on a pooled connection (saves the ~50-200 ms TCP/TLS/login
+        # handshake a fresh pyodbc.connect pays) off the event loop
+        def _execute_sync():
+            """Blocking DB work, run off the event loop via to_thread"""
+            pool = get_connection_pool()
+            conn = pool.acquire()
+            discard = False
             try:
-                return str(value) if value is not None else None
-            except:
-                return '[Unsupported Type]'
-        
-        # Register converter for all SQL types that might cause issues
-        # This will catch types that pyodbc doesn't natively support
-        try:
-            # Try to set a default converter (this might not work in all pyodbc versions)
-            # Instead, we'll handle it in the fetch logic
-            pass
-        except:
-            pass
-        
-        try:
-            cursor.execute(sql_query)
-            
-            # Get column names
-            columns = [column[0] for column in cursor.description] if cursor.description else []
+                return _run_query(conn)
+            except Exception:
+                discard = True  # broken connections are closed, not pooled
+                raise
+            finally:
+                pool.release(conn, discard=discard)
+
+        # The error handler below runs in this frame after the worker's
+        # cursor is gone; _run_query parks the column metadata here so the
+        # CAST suggestion can still name the offending column
+        description_holder = {}
+
+        def _run_query(conn):
+            # Cursor lifecycle stays in here because the fallback path has to
+            # close and reopen it; on any exception the caller discards the
+            # whole connection, which reclaims the cursor too
+            cursor = conn.cursor()
+            cursor.execute(exec_sql)
+
+            # Resolve column names and a type-specialised converter per
+            # column once, instead of re-deciding per cell in the row loop
+            description = cursor.description or ()
+            description_holder['description'] = description
+            columns = [column[0] for column in description]
+            col_converters = tuple(
+                _EXEC_SQL_CONVERTERS.get(column[1], convert_value_safely)
+                for column in description
+            )
             
             # Fetch rows one by one to handle unsupported data types gracefully
             result_rows = []
@@ -1308,21 +1372,28 @@ async def execute_sql_query(request: Request):
             max_rows = limit  # Limit the number of rows returned
             
             try:
-                # Try to fetch all at once first (faster for supported types)
-                rows = cursor.fetchall()
-                for row in rows[:max_rows]:
-                    row_dict = {}
-                    for idx, col in enumerate(columns):
-                        value = row[idx]
-                        row_dict[col] = convert_value_safely(value)
-                    result_rows.append(row_dict)
-                    row_count += 1
+                # Batched block fetch: at most max_rows rows are ever
+                # materialized, instead of fetchall() pulling the server's
+                # whole result set and slicing it afterwards
+                cursor.arraysize = min(max_rows, 1000)
+                # Locals hoisted out of the loop; dict(zip(...)) assembles
+                # each row in C instead of a per-cell Python loop
+                _convs = col_converters
+                _cols = columns
+                _append = result_rows.append
+                while row_count < max_rows:
+                    batch = cursor.fetchmany(min(cursor.arraysize, max_rows - row_count))
+                    if not batch:
+                        break
+                    for row in batch:
+                        _append(dict(zip(_cols, (f(v) for f, v in zip(_convs, row)))))
+                    row_count += len(batch)
             except Exception as fetch_err:
                 # If fetchall fails due to unsupported types, fetch row by row with new cursor
                 write_debug(f"[Execute SQL] fetchall failed, trying row-by-row: {str(fetch_err)}")
                 cursor.close()
                 cursor = conn.cursor()
-                cursor.execute(sql_query)
+                cursor.execute(exec_sql)
                 
                 while row_count < max_rows:
                     try:
@@ -1357,58 +1428,56 @@ async def execute_sql_query(request: Request):
                         break
             
             write_debug(f"[Execute SQL] Query executed successfully, returned {len(result_rows)} rows")
-            
-            return {
+
+            payload = {
                 "success": True,
                 "columns": columns,
                 "rows": result_rows,
                 "total": len(result_rows)
             }
-            
-        finally:
             cursor.close()
-            conn.close()
-            
+            return payload
+
+        payload = await asyncio.to_thread(_execute_sync)
+        if orjson is not None:
+            # Returning the Response directly skips FastAPI's
+            # jsonable_encoder walk over thousands of row dicts; the cells
+            # are already JSON-native types
+            return ORJSONResponse(content=payload)
+        return payload
+
     except HTTPException:
         raise
     except Exception as e:
         error_msg = str(e)
         write_debug(f"[Execute SQL] Error: {error_msg}")
-        import traceback
         write_debug(f"[Execute SQL] Traceback: {traceback.format_exc()}")
         
         # Provide helpful error message for unsupported SQL types
         if 'ODBC SQL type' in error_msg and 'is not yet supported' in error_msg:
             # Try to extract column index if available
-            import re
-            col_match = re.search(r'column-index=(\d+)', error_msg)
+            col_match = _COL_INDEX_RE.search(error_msg)
             col_index = col_match.group(1) if col_match else None
-            
-            # Try to get column name from the query
+
+            # Try to get the column name from the worker's parked metadata
+            # (the cursor itself died with the discarded connection)
             col_name = None
-            try:
-                if col_index and 'cursor' in locals() and cursor.description:
-                    col_idx = int(col_index)
-                    if col_idx < len(cursor.description):
-                        col_name = cursor.description[col_idx][0]
-            except:
-                pass
-            
-            # Check if the query contains common datetime column names
-            datetime_columns = []
-            sql_lower = sql_query.lower()
-            datetime_patterns = ['createdat', 'created_at', 'updatedat', 'updated_at', 'deletedat', 'deleted_at', 'date', 'timestamp']
-            for pattern in datetime_patterns:
-                if pattern in sql_lower:
-                    # Extract the actual column name from the query
-                    col_match = re.search(rf'\b(\w*{pattern}\w*)\b', sql_query, re.IGNORECASE)
-                    if col_match:
-                        datetime_columns.append(col_match.group(1))
-            
+            description = description_holder.get('description')
+            if col_index and description:
+                col_idx = int(col_index)
+                if col_idx < len(description):
+                    col_name = description[col_idx][0]
+
+            # Check if the query contains common datetime column names - one
+            # precompiled alternation scan, deduplicated case-insensitively
+            datetime_columns = list(
+                {m.lower(): m for m in _DATETIME_COL_RE.findall(sql_query)}.values()
+            )[:3]
+
             suggestion = "This error occurs when selecting datetime/datetimeoffset columns. "
             if datetime_columns:
                 examples = []
-                for col in set(datetime_columns[:3]):  # Show max 3 examples
+                for col in datetime_columns:  # Show max 3 examples
                     examples.append(f"CAST({col} AS VARCHAR(MAX)) AS {col}")
                 suggestion += f"Please CAST these columns in your SELECT: {', '.join(examples)}. "
                 suggestion += "Example query: SELECT name, " + examples[0] + " FROM table_name"
@@ -17,7 +17,7 @@ from services.enhanced_bank_check_service import EnhancedBankCheckService
 DashboardActivityService = None  # type: ignore
 from utils.export_utils import get_default_header_config
 from models import ExportRequest, ExportResponse
-from routes.route_utils import write_debug, parse_header_config, merge_header_config, convert_to_boolean, save_and_log_export
+from routes.route_utils import DEBUG_ENABLED, write_debug, parse_header_config, merge_header_config, save_and_log_export
 from services.user_function_access_service import user_function_access_service, UserFunctionAccess
 
 # Initialize services
@@ -33,6 +33,77 @@ enhanced_bank_check_service = EnhancedBankCheckService()
 # db_service now points to risk_service for risk-related database calls
 db_service = risk_service 
 
+# cardType -> risk_service method name, shared by the PDF and Excel export
+# handlers; one dict lookup replaces ~20 sequential elif comparisons.
+# Resolved with getattr so a name missing on the service (e.g.
+# get_risks_reduced was never implemented) just leaves data as None for
+# that card instead of breaking the module import.
+_RISK_CARD_METHODS = {
+    # Metrics
+    'total': 'get_total_risks',
+    'high': 'get_high_risks',
+    'medium': 'get_medium_risks',
+    'low': 'get_low_risks',
+    'risksReduced': 'get_risks_reduced',
+    'newRisks': 'get_new_risks',
+    # Charts
+    'risksByCategory': 'get_risks_by_category',
+    'risksByEventType': 'get_risks_by_event_type_chart',
+    'createdDeletedRisksPerQuarter': 'get_created_deleted_risks_per_quarter',
+    'quarterlyRiskCreationTrends': 'get_quarterly_risk_creation_trends',
+    'riskApprovalStatusDistribution': 'get_risk_approval_status_distribution',
+    'riskDistributionByFinancialImpact': 'get_risk_distribution_by_financial_impact',
+    # Tables
+    'risksPerDepartment': 'get_risks_per_department',
+    'risksPerBusinessProcess': 'get_risks_per_business_process',
+    'inherentResidualRiskComparison': 'get_inherent_residual_risk_comparison',
+    'highResidualRiskOverview': 'get_high_residual_risk_overview',
+    'risksAndControlsCount': 'get_risks_and_controls_count',
+    'controlsAndRiskCount': 'get_controls_and_risk_count',
+    'allRisks': 'get_risks_details',
+}
+_RISK_CARD_DISPATCH = {} if not risk_service else {
+    card: method
+    for card, name in _RISK_CARD_METHODS.items()
+    if (method := getattr(risk_service, name, None)) is not None
+}
+
+# Query-param boolean normalization as one dict lookup; anything not in the
+# map (None, garbage, 'None') is False, same as the old try/except fallback
+_BOOL_MAP = {'true': True, '1': True, 'yes': True,
+             'false': False, '0': False, 'no': False, '': False}
+
+
+def _to_bool(value) -> bool:
+    if isinstance(value, bool):
+        return value
+    return _BOOL_MAP.get(str(value).strip().lower(), False)
+
+
+async def _fetch_risk_cards(card_types, start_date, end_date, function_filter):
+    """Fetch data for several card types concurrently.
+
+    The service queries are independent, so they run through
+    asyncio.gather and a composite export costs max(query_i) instead of
+    sum(query_i). Unknown card types resolve to None, same as the
+    single-card dispatch. The first failure is re-raised so error
+    behavior matches awaiting the queries one by one.
+    """
+    async def _none():
+        return None
+
+    coros = [
+        fetch(start_date, end_date, function_filter)
+        if (fetch := _RISK_CARD_DISPATCH.get(card)) else _none()
+        for card in card_types
+    ]
+    results = await asyncio.gather(*coros, return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return dict(zip(card_types, results))
+
+
 # Create router
 router = APIRouter()
 
@@ -67,19 +138,12 @@ async def export_risks_pdf(
         write_debug(f"[RISKS PDF] chartType={chartType} onlyOverallTable={onlyOverallTable} tableType={tableType}")
 
         # Parse and merge header configuration
-        header_config = parse_header_config(headerConfig)
-        # Allow chartType as separate query param
-        renderType = request.query_params.get('renderType')
-        if renderType:
-            try:
-                header_config["chartType"] = renderType
-            except Exception:
-                header_config = {"chartType": renderType}
-        elif chartType:
-            try:
-                header_config["chartType"] = chartType
-            except Exception:
-                header_config = {"chartType": chartType}
+        header_config = parse_header_config(headerConfig) or {}
+        # Allow chartType as a separate query param (renderType wins);
+        # parse_header_config always returns a dict so no try/except dance
+        render_type = request.query_params.get('renderType') or chartType
+        if render_type:
+            header_config["chartType"] = render_type
         header_config = merge_header_config("risks", header_config)
         
         # Normalize parameters
@@ -89,20 +153,9 @@ async def export_risks_pdf(
             cardType = tableType
 
         # Normalize booleans
-        try:
-            only_card_bool = convert_to_boolean(onlyCard)
-        except Exception:
-            only_card_bool = str(onlyCard).lower() == 'true'
-        
-        try:
-            only_chart_bool = convert_to_boolean(onlyChart)
-        except Exception:
-            only_chart_bool = str(onlyChart).lower() == 'true'
-        
-        try:
-            only_overall_table_bool = convert_to_boolean(onlyOverallTable)
-        except Exception:
-            only_overall_table_bool = str(onlyOverallTable).lower() == 'true'
+        only_card_bool = _to_bool(onlyCard)
+        only_chart_bool = _to_bool(onlyChart)
+        only_overall_table_bool = _to_bool(onlyOverallTable)
 
         # Require cardType
         if not cardType:
@@ -114,66 +167,35 @@ async def export_risks_pdf(
         if not risk_service:
             raise HTTPException(status_code=500, detail="Risk service not available")
 
-        data = None
-        # Metrics
-        if cardType == 'total':
-            data = await risk_service.get_total_risks(startDate, endDate, function_filter)
-        elif cardType == 'high':
-            data = await risk_service.get_high_risks(startDate, endDate, function_filter)
-        elif cardType == 'medium':
-            write_debug(f"[RISKS PDF] fetching medium risks for {startDate} to {endDate}")
-            data = await risk_service.get_medium_risks(startDate, endDate, function_filter)
-            write_debug(f"[RISKS PDF] medium risks data: {data}")
-        elif cardType == 'low':
-            data = await risk_service.get_low_risks(startDate, endDate, function_filter)
-        elif cardType == 'risksReduced':
-            data = await risk_service.get_risks_reduced(startDate, endDate, function_filter)
-        elif cardType == 'newRisks':
-            write_debug(f"[RISKS PDF] fetching new risks for {startDate} to {endDate}")
-            data = await risk_service.get_new_risks(startDate, endDate, function_filter)
-
-        # Charts
-        elif cardType == 'risksByCategory':
-            data = await risk_service.get_risks_by_category(startDate, endDate, function_filter)
-        elif cardType == 'risksByEventType':
-            data = await risk_service.get_risks_by_event_type_chart(startDate, endDate, function_filter)
-        elif cardType == 'createdDeletedRisksPerQuarter':
-            data = await risk_service.get_created_deleted_risks_per_quarter(startDate, endDate, function_filter)
-        elif cardType == 'quarterlyRiskCreationTrends':
-            data = await risk_service.get_quarterly_risk_creation_trends(startDate, endDate, function_filter)
-        elif cardType == 'riskApprovalStatusDistribution':
-            data = await risk_service.get_risk_approval_status_distribution(startDate, endDate, function_filter)
-        elif cardType == 'riskDistributionByFinancialImpact':
-            data = await risk_service.get_risk_distribution_by_financial_impact(startDate, endDate, function_filter)
-        # Tables
-        elif cardType == 'risksPerDepartment':
-            data = await risk_service.get_risks_per_department(startDate, endDate, function_filter)
-        elif cardType == 'risksPerBusinessProcess':
-            data = await risk_service.get_risks_per_business_process(startDate, endDate, function_filter)
-        elif cardType == 'inherentResidualRiskComparison':
-            data = await risk_service.get_inherent_residual_risk_comparison(startDate, endDate, function_filter)
-        elif cardType == 'highResidualRiskOverview':
-            data = await risk_service.get_high_residual_risk_overview(startDate, endDate, function_filter)
-        elif cardType == 'risksAndControlsCount':
-            data = await risk_service.get_risks_and_controls_count(startDate, endDate, function_filter)
-        elif cardType == 'controlsAndRiskCount':
-            data = await risk_service.get_controls_and_risk_count(startDate, endDate, function_filter)
-        elif cardType == 'allRisks':
-            data = await risk_service.get_risks_details(startDate, endDate, function_filter)
-
-        risks_data = {cardType: data}
-        write_debug(f"risks_data: {risks_data}")
-        try:
-            data_len = len(data) if isinstance(data, list) else (len(data.keys()) if isinstance(data, dict) else 1)
-            write_debug(f"[RISKS PDF] data_type={type(data).__name__} data_len={data_len}")
-        except Exception:
-            pass
+        # Metrics / charts / tables all resolve through the dispatch table;
+        # unknown cardType keeps the old behavior (data stays None).
+        # _fetch_risk_cards gathers concurrently should this ever grow to
+        # composite exports with several cards.
+        risks_data = await _fetch_risk_cards([cardType], startDate, endDate, function_filter)
+        data = risks_data[cardType]
+
+        # Lazy: stringifying the full result set (potentially megabytes) is
+        # deferred until the debug writer actually logs it
+        write_debug(lambda: f"risks_data: {risks_data}")
+        if DEBUG_ENABLED:
+            try:
+                data_len = len(data) if isinstance(data, list) else (len(data.keys()) if isinstance(data, dict) else 1)
+                write_debug(f"[RISKS PDF] data_type={type(data).__name__} data_len={data_len}")
+            except Exception:
+                pass
         
-        # Generate PDF
+        # Generate PDF. The generator is async in signature only - it never
+        # awaits - so running it inline would block the event loop for the
+        # whole render. A worker thread drives it on its own short-lived
+        # loop instead (the service objects don't pickle, so a process pool
+        # is not an option here).
         try:
-            pdf_content = await pdf_service.generate_risks_pdf(  # ← FIXED: Proper indentation
-                risks_data, startDate, endDate, header_config, cardType, only_card_bool, only_overall_table_bool, only_chart_bool
-        )
+            pdf_content = await asyncio.to_thread(
+                asyncio.run,
+                pdf_service.generate_risks_pdf(
+                    risks_data, startDate, endDate, header_config, cardType, only_card_bool, only_overall_table_bool, only_chart_bool
+                )
+            )
         except Exception as gen_err:
             write_debug(f"[RISKS PDF] generate_risks_pdf error: {gen_err}")
             raise
@@ -193,15 +215,32 @@ async def export_risks_pdf(
         )
         
         filename = export_info['filename']
-        
+        response_headers = {
+            'Content-Disposition': f'attachment; filename="{filename}"',
+            # pdf/xlsx are already compressed; identity makes GZipMiddleware
+            # skip re-compressing the download
+            'Content-Encoding': 'identity',
+            'X-Export-Src': export_info['relative_path'],
+            'X-Export-Id': str(export_info.get('export_id', ''))
+        }
+
+        # Stream the file save_and_log_export just wrote instead of holding
+        # a second in-memory copy of the bytes for the response
+        saved_path = export_info.get('file_path')
+        if saved_path and os.path.exists(saved_path):
+            del pdf_content
+            return FileResponse(
+                saved_path,
+                media_type='application/pdf',
+                filename=filename,
+                headers=response_headers
+            )
+
+        # Save failed - fall back to the in-memory bytes
         return Response(
             content=pdf_content,
             media_type='application/pdf',
-            headers={
-                'Content-Disposition': f'attachment; filename="{filename}"',
-                'X-Export-Src': export_info['relative_path'],
-                'X-Export-Id': str(export_info.get('export_id', ''))
-            }
+            headers=response_headers
         )
     except Exception as e:
         write_debug(f"[RISKS PDF] Export failed: {str(e)}")
@@ -242,19 +281,12 @@ async def export_risks_excel(
         write_debug(f"tableType: {tableType}")
 
         # Parse and merge header configuration
-        header_config = parse_header_config(headerConfig)
-        # Allow chartType as separate query param
-        renderType = request.query_params.get('renderType')
-        if renderType:
-            try:
-                header_config["chartType"] = renderType
-            except Exception:
-                header_config = {"chartType": renderType}
-        elif chartType:
-            try:
-                header_config["chartType"] = chartType
-            except Exception:
-                header_config = {"chartType": chartType}
+        header_config = parse_header_config(headerConfig) or {}
+        # Allow chartType as a separate query param (renderType wins);
+        # parse_header_config always returns a dict so no try/except dance
+        render_type = request.query_params.get('renderType') or chartType
+        if render_type:
+            header_config["chartType"] = render_type
         header_config = merge_header_config("risks", header_config)
 
         # Normalize parameters
@@ -264,20 +296,9 @@ async def export_risks_excel(
             cardType = tableType
 
         # Normalize booleans
-        try:
-            only_card_bool = convert_to_boolean(onlyCard)
-        except Exception:
-            only_card_bool = str(onlyCard).lower() == 'true'
-        
-        try:
-            only_chart_bool = convert_to_boolean(onlyChart)
-        except Exception:
-            only_chart_bool = str(onlyChart).lower() == 'true'
-        
-        try:
-            only_overall_table_bool = convert_to_boolean(onlyOverallTable)
-        except Exception:
-            only_overall_table_bool = str(onlyOverallTable).lower() == 'true'
+        only_card_bool = _to_bool(onlyCard)
+        only_chart_bool = _to_bool(onlyChart)
+        only_overall_table_bool = _to_bool(onlyOverallTable)
 
         if not cardType:
             raise HTTPException(status_code=400, detail="cardType or chartType is required for exports")
@@ -286,55 +307,23 @@ async def export_risks_excel(
         if not risk_service:
             raise HTTPException(status_code=500, detail="Risk service not available")
 
-        data = None
-        # Metrics (counts) or lists when onlyCard is requested - with function filtering
-        if cardType == 'total':
-            data = await risk_service.get_total_risks(startDate, endDate, function_filter)
-        elif cardType == 'high':
-            data = await risk_service.get_high_risks(startDate, endDate, function_filter)
-        elif cardType == 'medium':
-            data = await risk_service.get_medium_risks(startDate, endDate, function_filter)
-        elif cardType == 'low':
-            data = await risk_service.get_low_risks(startDate, endDate, function_filter)
-        elif cardType == 'risksReduced':
-            data = await risk_service.get_risks_reduced(startDate, endDate, function_filter)
-        elif cardType == 'newRisks':
-            data = await risk_service.get_new_risks(startDate, endDate, function_filter)
-        # Charts
-        elif cardType == 'risksByCategory':
-            data = await risk_service.get_risks_by_category(startDate, endDate, function_filter)
-        elif cardType == 'risksByEventType':
-            data = await risk_service.get_risks_by_event_type_chart(startDate, endDate, function_filter)
-        elif cardType == 'createdDeletedRisksPerQuarter':
-            data = await risk_service.get_created_deleted_risks_per_quarter(startDate, endDate, function_filter)
-        elif cardType == 'quarterlyRiskCreationTrends':
-            data = await risk_service.get_quarterly_risk_creation_trends(startDate, endDate, function_filter)
-        elif cardType == 'riskApprovalStatusDistribution':
-            data = await risk_service.get_risk_approval_status_distribution(startDate, endDate, function_filter)
-        elif cardType == 'riskDistributionByFinancialImpact':
-            data = await risk_service.get_risk_distribution_by_financial_impact(startDate, endDate, function_filter)
-        # Tables
-        elif cardType == 'risksPerDepartment':
-            data = await risk_service.get_risks_per_department(startDate, endDate, function_filter)
-        elif cardType == 'risksPerBusinessProcess':
-            data = await risk_service.get_risks_per_business_process(startDate, endDate, function_filter)
-        elif cardType == 'inherentResidualRiskComparison':
-            data = await risk_service.get_inherent_residual_risk_comparison(startDate, endDate, function_filter)
-        elif cardType == 'highResidualRiskOverview':
-            data = await risk_service.get_high_residual_risk_overview(startDate, endDate, function_filter)
-        elif cardType == 'risksAndControlsCount':
-            data = await risk_service.get_risks_and_controls_count(startDate, endDate, function_filter)
-        elif cardType == 'controlsAndRiskCount':
-            data = await risk_service.get_controls_and_risk_count(startDate, endDate, function_filter)
-        elif cardType == 'allRisks':
-            data = await risk_service.get_risks_details(startDate, endDate, function_filter)
-
-        risks_data = {cardType: data}
-        write_debug(f"risks_data: {risks_data}")
+        # Metrics / charts / tables all resolve through the dispatch table;
+        # unknown cardType keeps the old behavior (data stays None).
+        # _fetch_risk_cards gathers concurrently should this ever grow to
+        # composite exports with several cards.
+        risks_data = await _fetch_risk_cards([cardType], startDate, endDate, function_filter)
+        data = risks_data[cardType]
+        # Lazy: stringifying the full result set (potentially megabytes) is
+        # deferred until the debug writer actually logs it
+        write_debug(lambda: f"risks_data: {risks_data}")
         
-        # Generate Excel
-        excel_content = await excel_service.generate_risks_excel(
-            risks_data, startDate, endDate, header_config, cardType, only_card_bool, only_overall_table_bool, only_chart_bool
+        # Generate Excel off the event loop - same reasoning as the PDF
+        # handler: the generator is CPU-bound with no awaits inside
+        excel_content = await asyncio.to_thread(
+            asyncio.run,
+            excel_service.generate_risks_excel(
+                risks_data, startDate, endDate, header_config, cardType, only_card_bool, only_overall_table_bool, only_chart_bool
+            )
         )
         
         # Get user from request headers (if available)
@@ -352,15 +341,32 @@ async def export_risks_excel(
         )
         
         filename = export_info['filename']
-        
+        response_headers = {
+            'Content-Disposition': f'attachment; filename="{filename}"',
+            # pdf/xlsx are already compressed; identity makes GZipMiddleware
+            # skip re-compressing the download
+            'Content-Encoding': 'identity',
+            'X-Export-Src': export_info['relative_path'],
+            'X-Export-Id': str(export_info.get('export_id', ''))
+        }
+
+        # Stream the file save_and_log_export just wrote instead of holding
+        # a second in-memory copy of the bytes for the response
+        saved_path = export_info.get('file_path')
+        if saved_path and os.path.exists(saved_path):
+            del excel_content
+            return FileResponse(
+                saved_path,
+                media_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+                filename=filename,
+                headers=response_headers
+            )
+
+        # Save failed - fall back to the in-memory bytes
         return Response(
             content=excel_content,
             media_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-            headers={
-                'Content-Disposition': f'attachment; filename="{filename}"',
-                'X-Export-Src': export_info['relative_path'],
-                'X-Export-Id': str(export_info.get('export_id', ''))
-            }
+            headers=response_headers
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Export failed: {str(e)}")
\ No newline at end of file
@@ -7,32 +7,113 @@ generate_pdf_report) are intentionally kept in individual route files due to the
 are centralized here.
 """
 from typing import Dict, Any, Optional, List
+import atexit
 import json
+import os
+import queue
 import sys
+import threading
 from datetime import datetime
+from functools import lru_cache
 
+# orjson serializes dict payloads much faster than str()/json.dumps
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def write_debug(msg: str) -> None:
-    """Write debug message to file with timestamp"""
-    from datetime import datetime
+# Debug logging is on by default (matches historical behavior) and can be
+# switched off in production with DEBUG_LOG=false. Checked once at import so
+# hot paths pay a single boolean test per call.
+DEBUG_ENABLED = os.getenv('DEBUG_LOG', 'true').lower() in ('true', '1', 'yes')
+
+# Debug lines are handed to a background writer thread instead of doing an
+# open/write/flush per call on the request path. The writer coalesces
+# whatever has queued up into a single write.
+_debug_queue: "queue.SimpleQueue[str]" = queue.SimpleQueue()
+_debug_writer_started = False
+_debug_writer_lock = threading.Lock()
+
+
+def _debug_writer_loop() -> None:
+    """Drain queued debug lines and append them to debug_log.txt in batches"""
+    log_file = open('debug_log.txt', 'a', encoding='utf-8')
+    while True:
+        lines = [_debug_queue.get()]
+        try:
+            while True:
+                lines.append(_debug_queue.get_nowait())
+        except queue.Empty:
+            pass
+        chunk = ''.join(lines)
+        log_file.write(chunk)
+        log_file.flush()
+        sys.stderr.write(chunk)
+        sys.stderr.flush()
+
+
+def _flush_debug_queue() -> None:
+    """Write any lines still queued at interpreter shutdown"""
+    lines = []
+    try:
+        while True:
+            lines.append(_debug_queue.get_nowait())
+    except queue.Empty:
+        pass
+    if lines:
+        with open('debug_log.txt', 'a', encoding='utf-8') as f:
+            f.write(''.join(lines))
+
+
+def _ensure_debug_writer() -> None:
+    global _debug_writer_started
+    if _debug_writer_started:
+        return
+    with _debug_writer_lock:
+        if _debug_writer_started:
+            return
+        threading.Thread(
+            target=_debug_writer_loop, name='debug-log-writer', daemon=True
+        ).start()
+        atexit.register(_flush_debug_queue)
+        _debug_writer_started = True
+
+
+def write_debug(msg) -> None:
+    """Write debug message to file with timestamp.
+
+    No-op when DEBUG_LOG=false. Accepts a plain string, a zero-arg callable
+    (evaluated lazily so hot paths can skip f-string interpolation when debug
+    is off), or a dict (serialized with orjson when available). Lines are
+    queued and flushed by a background thread so callers never block on disk.
+    """
+    if not DEBUG_ENABLED:
+        return
+    if callable(msg):
+        msg = msg()
+    if isinstance(msg, dict):
+        if orjson is not None:
+            msg = orjson.dumps(msg).decode('utf-8')
+        else:
+            msg = json.dumps(msg, default=str)
     timestamp = datetime.now().strftime('%H:%M:%S.%f')[:-3]
-    msg_with_time = f"[{timestamp}] {msg}"
-    with open('debug_log.txt', 'a', encoding='utf-8') as f:
-        f.write(f"{msg_with_time}\n")
-        f.flush()
-    sys.stderr.write(f"{msg_with_time}\n")
-    sys.stderr.flush()
+    _ensure_debug_writer()
+    _debug_queue.put(f"[{timestamp}] {msg}\n")
 
 
 def parse_header_config(headerConfig: Optional[str]) -> Dict[str, Any]:
     """Parse header configuration from JSON string"""
-    header_config = {}
-    if headerConfig:
-        try:
-            header_config = json.loads(headerConfig)
-        except json.JSONDecodeError:
-            header_config = {}
-    return header_config
+    if not headerConfig:
+        return {}
+    try:
+        if orjson is not None:
+            parsed = orjson.loads(headerConfig)
+        else:
+            parsed = json.loads(headerConfig)
+    except ValueError:  # covers json and orjson decode errors
+        return {}
+    # Callers treat the result as a dict; a bare JSON scalar/list is invalid
+    return parsed if isinstance(parsed, dict) else {}
 
 
 def merge_header_config(module_name: str, header_config: Dict[str, Any]) -> Dict[str, Any]:
@@ -63,7 +144,8 @@ async def save_and_log_export(
     header_config: Optional[Dict[str, Any]] = None,
     created_by: Optional[str] = None,
     date_range: Optional[Dict[str, Optional[str]]] = None,
-    export_type: Optional[str] = None
+    export_type: Optional[str] = None,
+    status: str = "completed"
 ) -> Dict[str, Any]:
     """
     Save export file to disk and log to database.
@@ -219,8 +301,10 @@ async def save_and_log_export(
     # Check database FIRST to see if a recent duplicate exists (before saving file)
     # This prevents duplicate database entries when multiple requests come in simultaneously
     try:
-        connection_string = get_database_connection_string()
-        conn_check = pyodbc.connect(connection_string)
+        from utils.db_pool import get_connection_pool
+        pool = get_connection_pool()
+        conn_check = pool.acquire()
+        discard_check = False
         cursor_check = conn_check.cursor()
         try:
             # Convert title column from ntext to NVARCHAR in pre-check connection first
@@ -319,9 +403,15 @@ async def save_and_log_export(
                     # Cache it for future lookups
                     _export_cache[cache_key] = (result, time.time())
                     return result
+        except Exception:
+            discard_check = True
+            raise
         finally:
-            cursor_check.close()
-            conn_check.close()
+            try:
+                cursor_check.close()
+            except Exception:
+                pass
+            pool.release(conn_check, discard=discard_check)
     except Exception as e:
         write_debug(f"[Save Export] Database pre-check failed (continuing): {str(e)}")
         import traceback
@@ -412,13 +502,24 @@ async def save_and_log_export(
     else:
         relative_path = f"reports_export/{date_folder}/{readable_filename}"
     
-    # Write file (only once)
+    # Write file (only once) - use aiofiles so a multi-MB write doesn't block
+    # the event loop, then tell the kernel to drop the pages: exports are
+    # written once and immediately streamed to the client, so keeping them in
+    # the page cache only evicts more useful pages.
     write_debug(f"[Save Export] Attempting to write file to: {file_path}")
     write_debug(f"[Save Export] File size: {len(content)} bytes")
     write_debug(f"[Save Export] Directory exists: {os.path.exists(reports_export_dir)}")
     try:
-        with open(file_path, 'wb') as f:
-            f.write(content)
+        import aiofiles
+        async with aiofiles.open(file_path, 'wb') as f:
+            await f.write(content)
+        if hasattr(os, 'posix_fadvise'):  # not available on Windows
+            try:
+                fd = os.open(file_path, os.O_RDONLY)
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+                os.close(fd)
+            except OSError:
+                pass
         # Verify file was written
         if os.path.exists(file_path):
             file_size = os.path.getsize(file_path)
@@ -439,10 +540,11 @@ async def save_and_log_export(
     write_debug(f"[Save Export] ===== DATABASE LOGGING START =====")
     write_debug(f"[Save Export] Attempting to connect to database...")
     try:
-        connection_string = get_database_connection_string()
-        write_debug(f"[Save Export] Connection string retrieved (length: {len(connection_string) if connection_string else 0})")
-        conn = pyodbc.connect(connection_string)
-        write_debug(f"[Save Export] Database connection established successfully")
+        from utils.db_pool import get_connection_pool
+        pool = get_connection_pool()
+        conn = pool.acquire()
+        discard_conn = False
+        write_debug(f"[Save Export] Database connection acquired from pool")
         cursor = conn.cursor()
         write_debug(f"[Save Export] Cursor created successfully")
         try:
@@ -461,6 +563,7 @@ async def save_and_log_export(
                     format NVARCHAR(20) NOT NULL,
                     dashboard NVARCHAR(100) NULL,
                     type NVARCHAR(50) NULL,
+                    status NVARCHAR(20) NULL,
                     created_by NVARCHAR(255) NULL,
                     created_at DATETIME2 DEFAULT GETDATE()
                   )
@@ -573,6 +676,23 @@ async def save_and_log_export(
                 conn.commit()
             except Exception:
                 pass
+
+            # Add status column if it doesn't exist (tracks background export jobs)
+            try:
+                cursor.execute(
+                    """
+                    IF NOT EXISTS (
+                      SELECT * FROM INFORMATION_SCHEMA.COLUMNS
+                      WHERE TABLE_NAME = 'report_exports' AND COLUMN_NAME = 'status'
+                    )
+                    BEGIN
+                      ALTER TABLE dbo.report_exports ADD status NVARCHAR(20) NULL
+                    END
+                    """
+                )
+                conn.commit()
+            except Exception:
+                pass
             
             # Insert export record (only if not already exists)
             # Use db_title for database record (can include header config title)
@@ -679,6 +799,7 @@ async def save_and_log_export(
                 safe_format = str(file_extension)[:20] if file_extension else ""
                 safe_dashboard = str(dashboard)[:100] if dashboard else ""
                 safe_type = str(export_type)[:50] if export_type else ""
+                safe_status = str(status)[:20] if status else "completed"
                 safe_created_by = str(user_name)[:255] if user_name else "System"
                 
                 write_debug(f"[Save Export] Safe values (truncated to column sizes):")
@@ -708,15 +829,15 @@ async def save_and_log_export(
                     write_debug(f"[Save Export] Attempting direct INSERT...")
                     cursor.execute(
                         """
-                        INSERT INTO dbo.report_exports (title, src, format, dashboard, type, created_by)
-                        VALUES (?, ?, ?, ?, ?, ?)
+                        INSERT INTO dbo.report_exports (title, src, format, dashboard, type, status, created_by)
+                        OUTPUT INSERTED.id
+                        VALUES (?, ?, ?, ?, ?, ?, ?)
                         """,
-                        (safe_title, safe_src, safe_format, safe_dashboard, safe_type, safe_created_by)
+                        (safe_title, safe_src, safe_format, safe_dashboard, safe_type, safe_status, safe_created_by)
                     )
+                    export_id = cursor.fetchone()[0]
                     write_debug(f"[Save Export] INSERT statement executed, committing...")
                     conn.commit()
-                    write_debug(f"[Save Export] Commit successful, getting identity...")
-                    export_id = cursor.execute("SELECT @@IDENTITY").fetchone()[0]
                     write_debug(f"[Save Export] ✓✓✓ SUCCESS: Created new export record ID: {export_id} for {relative_path} (type: {export_type})")
                 except Exception as insert_err:
                     write_debug(f"[Save Export] ✗✗✗ INSERT failed: {str(insert_err)}")
@@ -729,13 +850,14 @@ async def save_and_log_export(
                         write_debug(f"[Save Export] Retrying INSERT with explicit CONVERT...")
                         cursor.execute(
                             """
-                            INSERT INTO dbo.report_exports (title, src, format, dashboard, type, created_by)
-                            VALUES (CONVERT(NVARCHAR(500), ?), ?, ?, ?, ?, ?)
+                            INSERT INTO dbo.report_exports (title, src, format, dashboard, type, status, created_by)
+                            OUTPUT INSERTED.id
+                            VALUES (CONVERT(NVARCHAR(500), ?), ?, ?, ?, ?, ?, ?)
                             """,
-                            (safe_title, safe_src, safe_format, safe_dashboard, safe_type, safe_created_by)
+                            (safe_title, safe_src, safe_format, safe_dashboard, safe_type, safe_status, safe_created_by)
                         )
+                        export_id = cursor.fetchone()[0]
                         conn.commit()
-                        export_id = cursor.execute("SELECT @@IDENTITY").fetchone()[0]
                         write_debug(f"[Save Export] ✓✓✓ SUCCESS (with CONVERT): Created new export record ID: {export_id}")
                     except Exception as retry_err:
                         write_debug(f"[Save Export] ✗✗✗ INSERT retry with CONVERT also failed: {str(retry_err)}")
@@ -746,13 +868,14 @@ async def save_and_log_export(
                             write_debug(f"[Save Export] Trying INSERT without title, then UPDATE (last resort)...")
                             cursor.execute(
                                 """
-                                INSERT INTO dbo.report_exports (title, src, format, dashboard, type, created_by)
-                                VALUES ('', ?, ?, ?, ?, ?)
+                                INSERT INTO dbo.report_exports (title, src, format, dashboard, type, status, created_by)
+                                OUTPUT INSERTED.id
+                                VALUES ('', ?, ?, ?, ?, ?, ?)
                                 """,
-                                (safe_src, safe_format, safe_dashboard, safe_type, safe_created_by)
+                                (safe_src, safe_format, safe_dashboard, safe_type, safe_status, safe_created_by)
                             )
+                            export_id = cursor.fetchone()[0]
                             conn.commit()
-                            export_id = cursor.execute("SELECT @@IDENTITY").fetchone()[0]
                             write_debug(f"[Save Export] INSERT without title succeeded, ID: {export_id}, now updating title...")
                             # Now update the title
                             cursor.execute(
@@ -771,18 +894,17 @@ async def save_and_log_export(
                             write_debug(f"[Save Export] Final error type: {type(final_err).__name__}")
                             write_debug(f"[Save Export] Final error traceback: {traceback.format_exc()}")
                             raise
+        except Exception:
+            discard_conn = True
+            raise
         finally:
-            write_debug(f"[Save Export] Closing database connection...")
+            write_debug(f"[Save Export] Returning database connection to pool...")
             try:
                 cursor.close()
                 write_debug(f"[Save Export] Cursor closed")
             except Exception as close_cursor_err:
                 write_debug(f"[Save Export] Error closing cursor: {str(close_cursor_err)}")
-            try:
-                conn.close()
-                write_debug(f"[Save Export] Connection closed")
-            except Exception as close_conn_err:
-                write_debug(f"[Save Export] Error closing connection: {str(close_conn_err)}")
+            pool.release(conn, discard=discard_conn)
     except Exception as e:
         write_debug(f"[Save Export] ✗✗✗ EXCEPTION in database logging section: {str(e)}")
         write_debug(f"[Save Export] Exception type: {type(e).__name__}")
@@ -892,48 +1014,199 @@ def hex_to_color_for_pdf(hex_color: str):
     except:
         return colors.HexColor(f"#{hex_color}")
 
-def build_dynamic_sql_query(tables, joins, columns, where_conditions, time_filter):
-    """Build SQL query from dynamic report configuration"""
+@lru_cache(maxsize=256)
+def _build_dynamic_sql_for_shape(tables, join_shape, columns, time_column, condition_shape):
+    """Build the SQL text for one report shape (no literal values).
+
+    Dashboards re-issue the same tables/joins/columns with different filter
+    values, so the string-building is cached per shape and values are bound
+    as ? placeholders - which also lets SQL Server reuse one cached plan
+    per shape instead of compiling every literal variant.
+    """
     # Start with SELECT clause
     select_columns = ', '.join(columns) if columns else '*'
     sql = f"SELECT {select_columns}"
-    
+
     # Add FROM clause with first table
     if not tables:
         raise ValueError("At least one table is required")
-    
+
     sql += f" FROM {tables[0]}"
-    
+
     # Add JOINs
-    for join in joins:
-        if join.get('leftTable') and join.get('rightTable') and join.get('leftColumn') and join.get('rightColumn'):
-            join_type = join.get('type', 'INNER')
-            sql += f" {join_type} JOIN {join['rightTable']} ON {join['leftTable']}.{join['leftColumn']} = {join['rightTable']}.{join['rightColumn']}"
-    
+    for left_table, right_table, left_column, right_column, join_type in join_shape:
+        sql += f" {join_type} JOIN {right_table} ON {left_table}.{left_column} = {right_table}.{right_column}"
+
     # Add WHERE clause
     where_clauses = []
-    
+
     # Add time filter
-    if time_filter and time_filter.get('column') and time_filter.get('startDate') and time_filter.get('endDate'):
-        where_clauses.append(f"{time_filter['column']} BETWEEN '{time_filter['startDate']}' AND '{time_filter['endDate']}'")
-    
+    if time_column:
+        where_clauses.append(f"{time_column} BETWEEN ? AND ?")
+
     # Add custom WHERE conditions
-    for i, condition in enumerate(where_conditions):
-        if condition.get('column') and condition.get('value'):
-            operator = condition.get('operator', '=')
-            value = condition.get('value', '')
-            logical_op = condition.get('logicalOperator', 'AND') if i > 0 else ''
-            
-            if logical_op:
-                where_clauses.append(f" {logical_op} {condition['column']} {operator} '{value}'")
-            else:
-                where_clauses.append(f"{condition['column']} {operator} '{value}'")
-    
+    for column, operator, logical_op in condition_shape:
+        if logical_op:
+            where_clauses.append(f" {logical_op} {column} {operator} ?")
+        else:
+            where_clauses.append(f"{column} {operator} ?")
+
     if where_clauses:
         sql += " WHERE " + " ".join(where_clauses)
-    
+
     return sql
 
+
+def build_dynamic_sql_query(tables, joins, columns, where_conditions, time_filter):
+    """Build SQL query from dynamic report configuration.
+
+    Returns (sql, params): the SQL text uses ? placeholders for filter
+    values, which must be passed to cursor.execute alongside it.
+    """
+    join_shape = tuple(
+        (join['leftTable'], join['rightTable'], join['leftColumn'], join['rightColumn'],
+         join.get('type', 'INNER'))
+        for join in joins
+        if join.get('leftTable') and join.get('rightTable') and join.get('leftColumn') and join.get('rightColumn')
+    )
+
+    time_column = None
+    params = []
+    if time_filter and time_filter.get('column') and time_filter.get('startDate') and time_filter.get('endDate'):
+        time_column = time_filter['column']
+        params.extend([time_filter['startDate'], time_filter['endDate']])
+
+    condition_shape = []
+    for i, condition in enumerate(where_conditions):
+        if condition.get('column') and condition.get('value'):
+            logical_op = condition.get('logicalOperator', 'AND') if i > 0 else ''
+            condition_shape.append((condition['column'], condition.get('operator', '='), logical_op))
+            params.append(condition.get('value', ''))
+
+    sql = _build_dynamic_sql_for_shape(
+        tuple(tables), join_shape, tuple(columns), time_column, tuple(condition_shape)
+    )
+    return sql, params
+
+# Above this row count the in-memory workbook dominates the export cost;
+# large plain exports switch to the write-only streaming path instead
+_EXCEL_STREAMING_ROW_THRESHOLD = 5000
+
+# Above this row count a chart-less render is handed to a worker process so
+# the CPU-bound work (cell serialization, PDF layout) does not hold this
+# process's GIL while other requests are being served
+_PROCESS_RENDER_ROW_THRESHOLD = 20000
+
+_render_executor = None
+_render_executor_lock = threading.Lock()
+
+
+def _get_render_executor():
+    """Lazily create the shared render process pool"""
+    global _render_executor
+    if _render_executor is None:
+        with _render_executor_lock:
+            if _render_executor is None:
+                from concurrent.futures import ProcessPoolExecutor
+                _render_executor = ProcessPoolExecutor(
+                    max_workers=min(4, os.cpu_count() or 1)
+                )
+                atexit.register(_render_executor.shutdown)
+    return _render_executor
+
+
+def _render_report_in_worker(format_type, columns, data_rows, header_config):
+    """Dispatch to the right generator (top-level so the process pool can pickle it)"""
+    if format_type == 'excel':
+        return generate_excel_report(columns, data_rows, header_config)
+    if format_type == 'word':
+        return generate_word_report(columns, data_rows, header_config)
+    return generate_pdf_report(columns, data_rows, header_config)
+
+
+def render_report_offloaded(format_type, columns, data_rows, header_config):
+    """Render a report, using a worker process for very large plain exports.
+
+    The inputs (column names, stringified rows, the JSON-derived header
+    config) and the returned bytes all pickle cheaply. Chart-bearing configs
+    always render in-process so their matplotlib figures use this process's
+    font setup; a pool failure also falls back to an in-process render.
+    """
+    if (
+        len(data_rows) > _PROCESS_RENDER_ROW_THRESHOLD
+        and not (header_config or {}).get('chart_data')
+    ):
+        try:
+            executor = _get_render_executor()
+            future = executor.submit(
+                _render_report_in_worker, format_type, columns, data_rows, header_config
+            )
+            return future.result()
+        except Exception as e:
+            write_debug(f"Process-pool render failed, rendering in-process: {e}")
+    return _render_report_in_worker(format_type, columns, data_rows, header_config)
+
+
+def _generate_excel_report_streaming(columns, data_rows, header_config):
+    """Write large exports with openpyxl's write-only workbook.
+
+    Rows are serialized to the output stream as they are appended, so memory
+    stays roughly flat no matter the row count, versus the normal mode that
+    keeps every cell object alive until save. Write-only mode cannot do
+    merged cells, logos, images or watermarks, so this path keeps styling to
+    the title/date lines and a colored header row; callers only dispatch
+    here for big chart-less exports where the table is the payload.
+    """
+    from io import BytesIO
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font, Alignment, PatternFill
+    from openpyxl.utils import get_column_letter
+
+    title = header_config.get("title", "Dynamic Report")
+    subtitle = header_config.get("subtitle", "")
+    include_header = header_config.get("includeHeader", True)
+    font_color = (header_config.get("fontColor", "#1F4E79") or "#1F4E79").lstrip('#')
+    header_bg = (header_config.get("tableHeaderBgColor", "#1F4E79") or "#1F4E79").lstrip('#')
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(title=(str(title)[:31] or 'Dynamic Report'))
+
+    # Fixed width instead of the O(rows x cols) auto-fit scan
+    for col_idx in range(1, len(columns) + 1):
+        ws.column_dimensions[get_column_letter(col_idx)].width = 18
+
+    if include_header:
+        title_cell = WriteOnlyCell(ws, value=title)
+        title_cell.font = Font(size=14, bold=True, color=font_color)
+        ws.append([title_cell])
+        if subtitle:
+            subtitle_cell = WriteOnlyCell(ws, value=subtitle)
+            subtitle_cell.font = Font(size=11, color=font_color)
+            ws.append([subtitle_cell])
+        if header_config.get("showDate", True):
+            ws.append([f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"])
+        ws.append([])
+
+    header_font = Font(bold=True, color='FFFFFF')
+    header_fill = PatternFill(start_color=header_bg, end_color=header_bg, fill_type='solid')
+    header_cells = []
+    for col in columns:
+        cell = WriteOnlyCell(ws, value=col)
+        cell.font = header_font
+        cell.fill = header_fill
+        cell.alignment = Alignment(horizontal='center')
+        header_cells.append(cell)
+    ws.append(header_cells)
+
+    for row in data_rows:
+        ws.append(row)
+
+    output = BytesIO()
+    wb.save(output)
+    return output.getvalue()
+
+
 def generate_excel_report(columns, data_rows, header_config=None):
     """Generate Excel report from dynamic data with full header configuration support"""
     from io import BytesIO
@@ -942,9 +1215,9 @@ def generate_excel_report(columns, data_rows, header_config=None):
     from openpyxl.utils import get_column_letter
     import os
     import base64
-    
+
     write_debug(f"generate_excel_report called with columns={columns}, data_rows count={len(data_rows)}")
-    
+
     # Get default header config if none provided
     if not header_config:
         write_debug("header_config is None, creating default")
@@ -955,7 +1228,13 @@ def generate_excel_report(columns, data_rows, header_config=None):
         write_debug(f"chart_data present? {header_config.get('chart_data') is not None}")
         if header_config.get('chart_data'):
             write_debug(f"chart_data has {len(header_config['chart_data'].get('labels', []))} labels")
-    
+
+    # Large chart-less exports stream through the write-only workbook; the
+    # rich path below keeps full styling, logos and chart images for the rest
+    if len(data_rows) > _EXCEL_STREAMING_ROW_THRESHOLD and not header_config.get('chart_data'):
+        write_debug(f"generate_excel_report: {len(data_rows)} rows, using write-only streaming path")
+        return _generate_excel_report_streaming(columns, data_rows, header_config)
+
     wb = Workbook()
     ws = wb.active
     ws.title = header_config.get('title', 'Dynamic Report')
@@ -1304,13 +1583,16 @@ def generate_excel_report(columns, data_rows, header_config=None):
                 
                 ax.set_title(title if title else 'Chart')
             
-            plt.tight_layout()
-            
+            # Operate on fig, not the pyplot current-figure API: renders run
+            # on worker threads now, and the global current figure would let
+            # concurrent exports save each other's charts
+            fig.tight_layout()
+
             # Save chart to buffer
             chart_buffer = BytesIO()
-            plt.savefig(chart_buffer, format='png', dpi=150, bbox_inches='tight')
+            fig.savefig(chart_buffer, format='png', dpi=150, bbox_inches='tight')
             chart_buffer.seek(0)
-            plt.close()
+            plt.close(fig)
             
             # Add chart to Excel on the right side
             img = XLImage(chart_buffer)
@@ -1785,13 +2067,16 @@ def generate_word_report(columns, data_rows, header_config=None):
             
             chart_title = title if title else (header_config.get('chartConfig', {}).get('xKey', 'Chart') if header_config.get('chartConfig') else 'Chart')
             ax.set_title(chart_title)
-            plt.tight_layout()
-            
+            # Operate on fig, not the pyplot current-figure API: renders run
+            # on worker threads now, and the global current figure would let
+            # concurrent exports save each other's charts
+            fig.tight_layout()
+
             # Save chart to buffer
             chart_buffer = BytesIO()
-            plt.savefig(chart_buffer, format='png', dpi=150, bbox_inches='tight')
+            fig.savefig(chart_buffer, format='png', dpi=150, bbox_inches='tight')
             chart_buffer.seek(0)
-            plt.close()
+            plt.close(fig)
             
             # Add chart to Word document
             chart_para = doc.add_paragraph()
@@ -3214,13 +3499,16 @@ def generate_pdf_report(columns, data_rows, header_config=None):
             
             chart_title = title if title else (header_config.get('chartConfig', {}).get('xKey', 'Chart') if header_config.get('chartConfig') else 'Chart')
             ax.set_title(chart_title)
-            plt.tight_layout()
-            
+            # Operate on fig, not the pyplot current-figure API: renders run
+            # on worker threads now, and the global current figure would let
+            # concurrent exports save each other's charts
+            fig.tight_layout()
+
             # Save chart to buffer
             chart_buffer = BytesIO()
-            plt.savefig(chart_buffer, format='png', dpi=150, bbox_inches='tight')
+            fig.savefig(chart_buffer, format='png', dpi=150, bbox_inches='tight')
             chart_buffer.seek(0)
-            plt.close()
+            plt.close(fig)
             
             # Add chart to PDF
             chart_img = RLImage(chart_buffer, width=6*inch, height=3.5*inch)
@@ -6,7 +6,6 @@ from openpyxl.styles import Font, PatternFill, Alignment
 from openpyxl.utils import get_column_letter
 from openpyxl.drawing.image import Image
 import io
-import matplotlib.pyplot as plt
 import matplotlib
 matplotlib.use('Agg')
 
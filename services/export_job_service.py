@@ -0,0 +1,76 @@
+"""
+In-process background job service for export generation
+
+Allows export endpoints to return immediately with a job id while the
+fetch + generate + save pipeline runs on the event loop in the background.
+Job state is kept in an in-memory registry (same pattern as the export
+dedup cache in route_utils) so status polling and downloads are cheap.
+"""
+import asyncio
+import time
+import uuid
+from typing import Any, Awaitable, Dict, Optional
+
+# Job statuses
+JOB_PENDING = "pending"
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"
+
+# How long finished jobs stay visible to status/download polling (seconds)
+_JOB_RETENTION_SECONDS = 3600
+
+
+class ExportJobService:
+    """Tracks background export jobs in memory (per worker process)"""
+
+    def __init__(self):
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+
+    def submit(self, coro: Awaitable[Dict[str, Any]]) -> str:
+        """Schedule an export coroutine and return its job id.
+
+        The coroutine must return the export_info dict produced by
+        save_and_log_export (file_path, relative_path, filename, export_id).
+        """
+        self._cleanup()
+        job_id = uuid.uuid4().hex
+        self._jobs[job_id] = {
+            "status": JOB_PENDING,
+            "created_at": time.time(),
+            "result": None,
+            "error": None,
+        }
+        task = asyncio.ensure_future(self._run(job_id, coro))
+        self._jobs[job_id]["task"] = task
+        return job_id
+
+    async def _run(self, job_id: str, coro: Awaitable[Dict[str, Any]]) -> None:
+        job = self._jobs.get(job_id)
+        if job is None:
+            return
+        job["status"] = JOB_RUNNING
+        try:
+            result = await coro
+            job["result"] = result
+            job["status"] = JOB_COMPLETED
+        except Exception as e:
+            job["error"] = str(e)
+            job["status"] = JOB_FAILED
+        finally:
+            job["finished_at"] = time.time()
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Return the job record for job_id, or None if unknown/expired"""
+        self._cleanup()
+        return self._jobs.get(job_id)
+
+    def _cleanup(self) -> None:
+        """Drop finished jobs older than the retention window"""
+        now = time.time()
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job.get("finished_at") and now - job["finished_at"] >= _JOB_RETENTION_SECONDS
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
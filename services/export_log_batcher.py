@@ -0,0 +1,124 @@
+"""
+Coalescing batcher for export log inserts
+
+Bursts of export logging from the UI used to cost two round-trips per row
+(INSERT then SELECT @@IDENTITY). The batcher queues rows for up to ~50ms and
+flushes them as a single multi-row INSERT ... OUTPUT INSERTED.id, so a burst
+of N requests collapses into one round-trip. Each caller awaits a Future
+resolved with its row's new id when the batch lands.
+
+pyodbc does not support OUTPUT with fast_executemany/executemany, so the
+flush uses a single multi-row VALUES statement instead (SQL Server allows up
+to 1000 row value expressions per INSERT; the batch cap stays well under it).
+
+Multi-row flushes go through MERGE rather than a plain INSERT: SQL Server
+does not guarantee that INSERT ... OUTPUT returns rows in VALUES order, but
+MERGE can OUTPUT columns of its *source* rows, so each row carries a
+client-generated ordinal and ids are matched on that instead of on result
+order.
+"""
+import asyncio
+from typing import Any, List, Tuple
+
+# Flush when this many rows are queued, or when the window elapses
+_MAX_BATCH = 500
+_FLUSH_WINDOW_SECONDS = 0.05
+
+_INSERT_COLUMNS = "(title, src, format, dashboard, type, created_by)"
+_ROW_PLACEHOLDER = "(?, ?, ?, ?, ?, ?)"
+
+
+class ExportLogBatcher:
+    """Batches report_exports inserts across concurrent requests"""
+
+    def __init__(self):
+        self._queue: "asyncio.Queue[Tuple[tuple, asyncio.Future]]" = asyncio.Queue()
+        self._drain_task = None
+
+    async def log(self, row: tuple) -> int:
+        """Queue one export log row and await its inserted id.
+
+        row is (title, src, format, dashboard, type, created_by).
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        if self._drain_task is None or self._drain_task.done():
+            self._drain_task = asyncio.ensure_future(self._drain_loop())
+        await self._queue.put((row, future))
+        return await future
+
+    async def _drain_loop(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await self._queue.get()
+            batch = [item]
+            deadline = loop.time() + _FLUSH_WINDOW_SECONDS
+            while len(batch) < _MAX_BATCH:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            rows = [row for row, _ in batch]
+            try:
+                ids = await asyncio.to_thread(self._flush_sync, rows)
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            for (_, future), new_id in zip(batch, ids):
+                if not future.done():
+                    future.set_result(new_id)
+
+    def _flush_sync(self, rows: List[tuple]) -> List[int]:
+        """Insert all queued rows in one statement and return their ids.
+
+        The returned list is index-aligned with rows: each row's VALUES
+        entry carries its list index as a literal ordinal, MERGE OUTPUTs
+        that source ordinal next to INSERTED.id, and the ids are reordered
+        by it - result-set order never matters.
+        """
+        from utils.db_pool import get_connection_pool
+        pool = get_connection_pool()
+        conn = pool.acquire()
+        cursor = conn.cursor()
+        discard = False
+        try:
+            params: List[Any] = [value for row in rows for value in row]
+            if len(rows) == 1:
+                # Single row: ordering is trivially correct, skip the MERGE
+                cursor.execute(
+                    f"INSERT INTO dbo.report_exports {_INSERT_COLUMNS} "
+                    f"OUTPUT INSERTED.id VALUES {_ROW_PLACEHOLDER}",
+                    params,
+                )
+                ids = [int(cursor.fetchone()[0])]
+            else:
+                # The ordinal is a client-generated int literal, not user data
+                values_clause = ", ".join(
+                    f"({i}, ?, ?, ?, ?, ?, ?)" for i in range(len(rows))
+                )
+                cursor.execute(
+                    "MERGE INTO dbo.report_exports AS t "
+                    f"USING (VALUES {values_clause}) "
+                    "AS s (ordinal, title, src, format, dashboard, type, created_by) "
+                    "ON 1 = 0 "
+                    f"WHEN NOT MATCHED THEN INSERT {_INSERT_COLUMNS} "
+                    "VALUES (s.title, s.src, s.format, s.dashboard, s.type, s.created_by) "
+                    "OUTPUT s.ordinal, INSERTED.id;",
+                    params,
+                )
+                ids_by_ordinal = {int(r[0]): int(r[1]) for r in cursor.fetchall()}
+                ids = [ids_by_ordinal[i] for i in range(len(rows))]
+            conn.commit()
+            return ids
+        except Exception:
+            discard = True
+            raise
+        finally:
+            cursor.close()
+            pool.release(conn, discard=discard)
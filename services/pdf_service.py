@@ -9,7 +9,6 @@ from reportlab.lib.units import inch
 from reportlab.platypus import Image
 from reportlab.lib.utils import ImageReader
 import io
-import matplotlib.pyplot as plt
 import matplotlib
 matplotlib.use('Agg')
 from datetime import datetime
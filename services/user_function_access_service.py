@@ -3,8 +3,19 @@ User Function Access Service - filters data by user's assigned functions.
 Mirrors the Node.js implementation in reporting_system_node.
 """
 from typing import Dict, Any, List, Optional
+import logging
 import pyodbc
 import os
+import re
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+
+_log = logging.getLogger(__name__)
+
+from utils.db_pool import PyODBCConnectionPool
 
 # Database connection string
 DB_CONNECTION_STRING = os.getenv(
@@ -12,167 +23,435 @@ DB_CONNECTION_STRING = os.getenv(
     "DRIVER={ODBC Driver 17 for SQL Server};SERVER=192.168.1.100;DATABASE=GRC;UID=sa;PWD=P@ssw0rd123"
 )
 
+# This service talks to its own database (the GRC user/function tables), so it
+# keeps its own pool rather than sharing the reporting pool. Connections are
+# ping-checked on acquire, so a lookup never lands on a dead socket.
+_POOL_SIZE = int(os.getenv("USER_ACCESS_DB_POOL_SIZE", "10"))
+_pool = PyODBCConnectionPool(lambda: DB_CONNECTION_STRING, max_size=_POOL_SIZE)
+
+# pyodbc keeps a one-slot prepared-statement cache per *cursor*: the prepare
+# is only re-used when the next execute on the same cursor carries identical
+# SQL text, so a fresh cursor per call always re-prepares server-side. Keep
+# one long-lived cursor per pooled connection instead. pyodbc connections
+# are C objects without __dict__, so the cursor rides in this side table
+# keyed by id(conn); each entry holds a strong reference to its connection,
+# which guarantees the id cannot be recycled while the entry exists.
+_CURSOR_CACHE_MAX = 2 * _POOL_SIZE
+_conn_cursors: Dict[int, tuple] = {}  # id(conn) -> (conn, cursor)
+_conn_cursors_lock = threading.Lock()
+
+
+def _cached_cursor(conn):
+    """Return the long-lived cursor for a pooled connection."""
+    key = id(conn)
+    with _conn_cursors_lock:
+        entry = _conn_cursors.get(key)
+        if entry is not None and entry[0] is conn:
+            return entry[1]
+    cursor = conn.cursor()
+    try:
+        # Free for single executes; any future executemany on this cursor
+        # then ships its parameter array as one buffered TDS RPC instead
+        # of a round-trip per row
+        cursor.fast_executemany = True
+    except (AttributeError, pyodbc.Error):
+        pass
+    with _conn_cursors_lock:
+        if len(_conn_cursors) >= _CURSOR_CACHE_MAX:
+            _conn_cursors.clear()  # crude but bounds memory; refills fast
+        _conn_cursors[key] = (conn, cursor)
+    return cursor
+
+
+def _drop_cached_cursor(conn) -> None:
+    """Forget the cursor for a connection that is being discarded."""
+    with _conn_cursors_lock:
+        _conn_cursors.pop(id(conn), None)
+
+
+# Short-TTL cache for function-access lookups: a user clicking through a
+# dashboard fires the same (user_id) lookup on every export, and assignments
+# change rarely, so 60 seconds of staleness is an acceptable trade for
+# skipping a DB round-trip per request. Entries are treated as immutable.
+# The one hot query of this service, hoisted so every call submits the
+# byte-identical text. pyodbc sends parameterized executes through
+# sp_executesql, so identical text + a bound user_id means SQL Server
+# caches one plan (an index seek, given an index on
+# UserFunction(user_id, deletedAt) INCLUDE (function_id)) and skips
+# parse/optimize on every call after the first.
+_USER_FUNCTIONS_SQL = """
+    SELECT uf.function_id
+    FROM [UserFunction] uf
+    INNER JOIN [Functions] f ON f.id = uf.function_id
+    WHERE uf.user_id = ? AND uf.deletedAt IS NULL AND f.deletedAt IS NULL
+"""
+
+_ACCESS_CACHE_TTL = 60.0
+_ACCESS_CACHE_MAX = 1024
+_access_cache: Dict[str, tuple] = {}  # user_id -> (expires_at, UserFunctionAccess)
+_access_cache_lock = threading.Lock()
+
+
+# The filter fragments built below are spliced as text into the dashboard
+# queries (which the entity services run on their own connections), so the
+# values cannot be bound as pyodbc parameters. Everything that reaches a
+# fragment is therefore validated against a strict allow-list first: aliases
+# must be plain SQL identifiers and function IDs plain UUID-style tokens.
+_SQL_IDENTIFIER_RE = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+_FUNCTION_ID_RE = re.compile(r'^[0-9A-Za-z_-]{1,64}$')
+
+# Super-admin group matcher, compiled once. The word boundaries matter: the
+# old loop also tested group_lower in admin_group, which made any substring
+# of "admin" (e.g. a group called "dm") count as super admin.
+_ADMIN_RE = re.compile(r'\b(?:super[ _-]?admin|admin)\b', re.IGNORECASE)
+
+# Exact super-admin spellings seen in practice, already normalized (the
+# old list also carried entries the lowercase/de-underscore loop could
+# never reach, and its reverse substring check made short names like "dm"
+# match "admin" - both gone with the loop). The frozenset is what the hot
+# path probes; the tuple is kept as the readable source of truth.
+_ADMIN_GROUP_NAMES = ('super admin', 'superadmin', 'super_admin', 'super-admin', 'admin')
+_EXACT_ADMIN = frozenset(_ADMIN_GROUP_NAMES)
+
+
+@lru_cache(maxsize=1024)
+def _is_admin_group(group_name: str) -> bool:
+    """Decide super-admin for a group name; memoized because the same
+    handful of group names repeats across virtually every request."""
+    if group_name.lower() in _EXACT_ADMIN:
+        return True
+    return _ADMIN_RE.search(group_name) is not None
+
+
+def _check_table_alias(table_alias: str) -> None:
+    """Reject aliases that are not bare identifiers (programmer error)."""
+    if not _SQL_IDENTIFIER_RE.match(table_alias or ''):
+        raise ValueError(f"Invalid SQL table alias: {table_alias!r}")
+
+
+def _safe_function_ids(function_ids: List[str]) -> List[str]:
+    """Keep only IDs that are safe to embed in a SQL string literal."""
+    return [fid for fid in function_ids if _FUNCTION_ID_RE.match(fid)]
+
+
+# Per-entity shape of the function filter. Controls and Risks go through a
+# junction table (EXISTS sub-select); KRIs and Incidents carry the function
+# ID as an in-row column. One builder consumes this table instead of four
+# hand-copied methods drifting apart.
+_ENTITY_META = {
+    'control':  {'mode': 'exists', 'join': 'ControlFunctions', 'join_alias': 'cf', 'fk': 'control_id'},
+    'risk':     {'mode': 'exists', 'join': 'RiskFunctions',    'join_alias': 'rf', 'fk': 'risk_id'},
+    'kri':      {'mode': 'column', 'col': 'related_function_id'},
+    'incident': {'mode': 'column', 'col': 'function_id'},
+}
 
+
+# Above this many IDs, stop inlining the IN-list and derive the set
+# server-side from UserFunction instead: the query text stays small and
+# constant-shaped no matter how many functions a power user holds.
+_INLIST_MAX = 500
+
+# Predicate shapes for _filter_template. 'subquery' takes the user_id, the
+# other two take the function ID(s).
+_PREDICATES = {
+    'selected': "= '{0}'",
+    'inlist': "IN ('{0}')",
+    'subquery': (
+        "IN (SELECT uf.function_id FROM [UserFunction] uf"
+        " INNER JOIN [Functions] f ON f.id = uf.function_id"
+        " WHERE uf.user_id = '{0}' AND uf.deletedAt IS NULL AND f.deletedAt IS NULL)"
+    ),
+}
+
+
+@lru_cache(maxsize=256)
+def _filter_template(entity: str, table_alias: str, shape: str) -> str:
+    """Render the fragment skeleton once per (entity, alias, shape).
+
+    The skeleton depends only on the entity, the outer-table alias and the
+    predicate shape (single-ID equality, IN-list, or UserFunction
+    subquery); the concrete value is substituted into the {0} slot at call
+    time. Repeated filter builds for the same dashboard therefore skip
+    re-assembling the EXISTS scaffolding entirely.
+    """
+    meta = _ENTITY_META[entity]
+    predicate = _PREDICATES[shape]
+    if meta['mode'] == 'exists':
+        ja = meta['join_alias']
+        return (
+            f" AND EXISTS (SELECT 1 FROM [{meta['join']}] {ja}"
+            f" WHERE {ja}.{meta['fk']} = {table_alias}.id"
+            f" AND {ja}.function_id {predicate} AND {ja}.deletedAt IS NULL)"
+        )
+    return f" AND {table_alias}.{meta['col']} {predicate}"
+
+
+class UserFunctionAccessError(Exception):
+    """Raised when a function-access lookup fails at the database layer.
+
+    Lets callers tell a DB failure apart from the legitimate empty result
+    of a user with no assigned functions; the old behaviour of returning
+    [] on error made the two indistinguishable.
+    """
+
+
+@dataclass(frozen=True, slots=True)
 class UserFunctionAccess:
-    """Data class for user function access info."""
-    def __init__(self, is_super_admin: bool = False, function_ids: List[str] = None):
-        self.is_super_admin = is_super_admin
-        self.function_ids = function_ids or []
+    """Data class for user function access info.
+
+    Frozen and slotted: instances sit in the TTL cache and are handed out
+    to concurrent requests, so immutability makes sharing safe and slots
+    drop the per-instance __dict__ overhead.
+    """
+    is_super_admin: bool = False
+    function_ids: tuple = ()
+    # Kept so very large function sets can be filtered via a
+    # UserFunction subquery instead of an inlined IN-list
+    user_id: Optional[str] = None
 
 
 class UserFunctionAccessService:
     """Service to manage user function-based data filtering."""
     
-    # Super admin groups that bypass function filtering (case-insensitive, partial match)
-    SUPER_ADMIN_GROUPS = ['super admin', 'superadmin', 'super_admin', 'admin']
+    # Super admin groups that bypass function filtering (case-insensitive,
+    # word-bounded match via _is_admin_group)
+    SUPER_ADMIN_GROUPS = _ADMIN_GROUP_NAMES
     
     def execute_query(self, query: str, params: Optional[List] = None) -> List[Dict[str, Any]]:
-        """Execute a SQL query and return results."""
+        """Execute a SQL query on a pooled connection and return results.
+
+        Raises UserFunctionAccessError on a database failure; an empty
+        list always means the query genuinely matched nothing.
+        """
+        try:
+            conn = _pool.acquire()
+        except pyodbc.Error as e:
+            _log.exception("execute_query could not acquire a connection")
+            raise UserFunctionAccessError("Could not acquire a database connection") from e
+        discard = False
         try:
-            conn = pyodbc.connect(DB_CONNECTION_STRING)
-            cursor = conn.cursor()
+            cursor = _cached_cursor(conn)
             if params:
                 cursor.execute(query, params)
             else:
                 cursor.execute(query)
             columns = [column[0] for column in cursor.description] if cursor.description else []
             rows = cursor.fetchall()
-            cursor.close()
-            conn.close()
             return [dict(zip(columns, row)) for row in rows]
-        except Exception as e:
-            print(f"[UserFunctionAccessService] execute_query ERROR: {e}")
-            return []
+        except pyodbc.Error as e:
+            discard = True
+            _drop_cached_cursor(conn)
+            _log.exception("execute_query failed: %s", query[:200])
+            raise UserFunctionAccessError("Function access query failed") from e
+        finally:
+            _pool.release(conn, discard=discard)
     
+    def execute_scalar_column(self, query: str, params: Optional[List] = None, col: int = 0) -> List[Any]:
+        """Execute a query and return a single column as a flat list.
+
+        Iterates the cursor directly instead of fetchall + a dict per row;
+        the hot caller (get_user_function_access) only ever needs the
+        function_id column, so the per-row dict was pure allocation waste.
+        Raises UserFunctionAccessError on a database failure.
+        """
+        try:
+            conn = _pool.acquire()
+        except pyodbc.Error as e:
+            _log.exception("execute_scalar_column could not acquire a connection")
+            raise UserFunctionAccessError("Could not acquire a database connection") from e
+        discard = False
+        try:
+            cursor = _cached_cursor(conn)
+            if params:
+                cursor.execute(query, params)
+            else:
+                cursor.execute(query)
+            return [row[col] for row in cursor]
+        except pyodbc.Error as e:
+            discard = True
+            _drop_cached_cursor(conn)
+            _log.exception("execute_scalar_column failed: %s", query[:200])
+            raise UserFunctionAccessError("Function access query failed") from e
+        finally:
+            _pool.release(conn, discard=discard)
+
+    def invalidate_access_cache(self, user_id: Optional[str] = None) -> None:
+        """Drop cached access for one user, or for everyone when no ID given.
+
+        Call after reassigning functions so the change shows up before the
+        TTL expires.
+        """
+        with _access_cache_lock:
+            if user_id is None:
+                _access_cache.clear()
+            else:
+                _access_cache.pop(user_id, None)
+
     def get_user_function_access(self, user_id: str, group_name: Optional[str] = None) -> UserFunctionAccess:
         """
         Get user's function access info.
         Returns UserFunctionAccess with is_super_admin flag and list of function IDs.
         """
-        # Check if user is super admin (case-insensitive partial match)
-        is_super_admin = False
-        if group_name:
-            group_lower = group_name.lower().replace('_', ' ').replace('-', ' ')
-            for admin_group in self.SUPER_ADMIN_GROUPS:
-                if admin_group in group_lower or group_lower in admin_group:
-                    is_super_admin = True
-                    break
-        
+        # Check if user is super admin (memoized exact-match fast path,
+        # regex scan only for unseen spellings)
+        is_super_admin = bool(group_name) and _is_admin_group(group_name)
+
         if is_super_admin:
-            return UserFunctionAccess(is_super_admin=True, function_ids=[])
-        
+            return UserFunctionAccess(is_super_admin=True)
+
         if not user_id:
-            return UserFunctionAccess(is_super_admin=False, function_ids=[])
-        
+            return UserFunctionAccess(is_super_admin=False)
+
+        # Normalize once: the same string object serves as cache key, bound
+        # parameter, and (validated) subquery literal, so pyodbc never has
+        # to coerce a UUID or other object per call
+        user_id = str(user_id)
+
+        # Cached DB lookup (the super-admin and anonymous paths above are
+        # pure string work and need no caching)
+        now = time.monotonic()
+        with _access_cache_lock:
+            hit = _access_cache.get(user_id)
+            if hit and hit[0] > now:
+                return hit[1]
+
         # Get user's assigned function IDs
-        query = """
-            SELECT uf.function_id
-            FROM [UserFunction] uf
-            INNER JOIN [Functions] f ON f.id = uf.function_id
-            WHERE uf.user_id = ? AND uf.deletedAt IS NULL AND f.deletedAt IS NULL
-        """
-        
-        results = self.execute_query(query, [user_id])
-        function_ids = [str(row['function_id']) for row in results if row.get('function_id')]
-        
-        return UserFunctionAccess(is_super_admin=False, function_ids=function_ids)
+        results = self.execute_scalar_column(_USER_FUNCTIONS_SQL, [user_id])
+        # Interned: users sharing functions share the ID string objects too.
+        # Deduplicated and sorted so two users with the same functions render
+        # the same canonical IN-list regardless of row order (and a stray
+        # duplicate UserFunction row cannot inflate the filter).
+        function_ids = tuple(sorted({sys.intern(str(value)) for value in results if value is not None}))
+
+        access = UserFunctionAccess(is_super_admin=False, function_ids=function_ids, user_id=user_id)
+        with _access_cache_lock:
+            if len(_access_cache) >= _ACCESS_CACHE_MAX:
+                _access_cache.clear()  # crude but bounds memory; refills fast
+            _access_cache[user_id] = (now + _ACCESS_CACHE_TTL, access)
+        return access
     
-    def build_control_function_filter(
-        self, 
-        table_alias: str, 
-        access: UserFunctionAccess, 
+    # Chunk size for batched IN-lists; stays under SQL Server's
+    # 2100-parameter cap with headroom.
+    _BATCH_CHUNK = 1800
+
+    def get_user_function_access_many(self, user_ids: List[str]) -> Dict[str, UserFunctionAccess]:
+        """
+        Batch variant of get_user_function_access: one IN-list query per
+        1800 users instead of one round-trip each (the classic N+1).
+        Returns a dict keyed by user_id; users with no assignments get an
+        empty access object. Super-admin bypass is group-based and known
+        to the caller, so handle admins first and batch only the rest.
+        """
+        out: Dict[str, UserFunctionAccess] = {}
+        pending: List[str] = []
+        now = time.monotonic()
+        with _access_cache_lock:
+            for uid in dict.fromkeys(str(u) for u in user_ids if u):
+                hit = _access_cache.get(uid)
+                if hit and hit[0] > now:
+                    out[uid] = hit[1]
+                else:
+                    pending.append(uid)
+        if not pending:
+            return out
+
+        grouped: Dict[str, List[str]] = {uid: [] for uid in pending}
+        for start in range(0, len(pending), self._BATCH_CHUNK):
+            chunk = pending[start:start + self._BATCH_CHUNK]
+            placeholders = ','.join('?' * len(chunk))
+            query = f"""
+                SELECT uf.user_id, uf.function_id
+                FROM [UserFunction] uf
+                INNER JOIN [Functions] f ON f.id = uf.function_id
+                WHERE uf.user_id IN ({placeholders})
+                  AND uf.deletedAt IS NULL AND f.deletedAt IS NULL
+            """
+            for row in self.execute_query(query, list(chunk)):
+                function_id = row.get('function_id')
+                uid = str(row.get('user_id'))
+                if function_id is not None and uid in grouped:
+                    grouped[uid].append(sys.intern(str(function_id)))
+
+        expires_at = now + _ACCESS_CACHE_TTL
+        with _access_cache_lock:
+            for uid, function_ids in grouped.items():
+                access = UserFunctionAccess(is_super_admin=False, function_ids=tuple(sorted(set(function_ids))), user_id=uid)
+                out[uid] = access
+                if len(_access_cache) >= _ACCESS_CACHE_MAX:
+                    _access_cache.clear()  # crude but bounds memory; refills fast
+                _access_cache[uid] = (expires_at, access)
+        return out
+
+    def build_function_filter(
+        self,
+        entity: str,
+        table_alias: str,
+        access: UserFunctionAccess,
         selected_function_id: Optional[str] = None
     ) -> str:
         """
-        Build SQL filter for Controls via ControlFunctions join table.
-        Returns SQL fragment like: " AND EXISTS (SELECT 1 FROM ControlFunctions cf WHERE ...)"
+        Build the function-access SQL filter for an entity in _ENTITY_META.
+        Returns a fragment like " AND EXISTS (...)" / " AND i.function_id IN (...)",
+        "" for super admins, or " AND 1 = 0" when the user has no access.
         """
+        if entity not in _ENTITY_META:
+            raise ValueError(f"Unknown filter entity: {entity!r}")
+        _check_table_alias(table_alias)
+
         if selected_function_id:
             # Filter by specific function
+            if not _FUNCTION_ID_RE.match(selected_function_id):
+                return " AND 1 = 0"  # Malformed ID can never match anything
             if not access.is_super_admin and selected_function_id not in access.function_ids:
                 return " AND 1 = 0"  # User doesn't have access to this function
-            return f" AND EXISTS (SELECT 1 FROM [ControlFunctions] cf WHERE cf.control_id = {table_alias}.id AND cf.function_id = '{selected_function_id}' AND cf.deletedAt IS NULL)"
-        
+            return _filter_template(entity, table_alias, 'selected').format(selected_function_id)
+
         if access.is_super_admin:
             return ""  # No filter for super admin
-        
-        if not access.function_ids:
+
+        function_ids = _safe_function_ids(access.function_ids)
+        if not function_ids:
             return " AND 1 = 0"  # User has no functions, return no data
-        
-        function_ids_str = "','".join(access.function_ids)
-        return f" AND EXISTS (SELECT 1 FROM [ControlFunctions] cf WHERE cf.control_id = {table_alias}.id AND cf.function_id IN ('{function_ids_str}') AND cf.deletedAt IS NULL)"
-    
+        if (len(function_ids) > _INLIST_MAX and access.user_id
+                and _FUNCTION_ID_RE.match(access.user_id)):
+            return _filter_template(entity, table_alias, 'subquery').format(access.user_id)
+        return _filter_template(entity, table_alias, 'inlist').format("','".join(function_ids))
+
+    def build_control_function_filter(
+        self,
+        table_alias: str,
+        access: UserFunctionAccess,
+        selected_function_id: Optional[str] = None
+    ) -> str:
+        """Build SQL filter for Controls via ControlFunctions join table."""
+        return self.build_function_filter('control', table_alias, access, selected_function_id)
+
     def build_risk_function_filter(
-        self, 
-        table_alias: str, 
-        access: UserFunctionAccess, 
+        self,
+        table_alias: str,
+        access: UserFunctionAccess,
         selected_function_id: Optional[str] = None
     ) -> str:
-        """
-        Build SQL filter for Risks via RiskFunctions join table.
-        Returns SQL fragment like: " AND EXISTS (SELECT 1 FROM RiskFunctions rf WHERE ...)"
-        """
-        if selected_function_id:
-            if not access.is_super_admin and selected_function_id not in access.function_ids:
-                return " AND 1 = 0"
-            return f" AND EXISTS (SELECT 1 FROM [RiskFunctions] rf WHERE rf.risk_id = {table_alias}.id AND rf.function_id = '{selected_function_id}' AND rf.deletedAt IS NULL)"
-        
-        if access.is_super_admin:
-            return ""
-        
-        if not access.function_ids:
-            return " AND 1 = 0"
-        
-        function_ids_str = "','".join(access.function_ids)
-        return f" AND EXISTS (SELECT 1 FROM [RiskFunctions] rf WHERE rf.risk_id = {table_alias}.id AND rf.function_id IN ('{function_ids_str}') AND rf.deletedAt IS NULL)"
-    
+        """Build SQL filter for Risks via RiskFunctions join table."""
+        return self.build_function_filter('risk', table_alias, access, selected_function_id)
+
     def build_kri_function_filter(
-        self, 
-        table_alias: str, 
-        access: UserFunctionAccess, 
+        self,
+        table_alias: str,
+        access: UserFunctionAccess,
         selected_function_id: Optional[str] = None
     ) -> str:
-        """
-        Build SQL filter for KRIs via related_function_id column.
-        Returns SQL fragment like: " AND k.related_function_id IN (...)"
-        """
-        if selected_function_id:
-            if not access.is_super_admin and selected_function_id not in access.function_ids:
-                return " AND 1 = 0"
-            return f" AND {table_alias}.related_function_id = '{selected_function_id}'"
-        
-        if access.is_super_admin:
-            return ""
-        
-        if not access.function_ids:
-            return " AND 1 = 0"
-        
-        function_ids_str = "','".join(access.function_ids)
-        return f" AND {table_alias}.related_function_id IN ('{function_ids_str}')"
-    
+        """Build SQL filter for KRIs via related_function_id column."""
+        return self.build_function_filter('kri', table_alias, access, selected_function_id)
+
     def build_incident_function_filter(
-        self, 
-        table_alias: str, 
-        access: UserFunctionAccess, 
+        self,
+        table_alias: str,
+        access: UserFunctionAccess,
         selected_function_id: Optional[str] = None
     ) -> str:
-        """
-        Build SQL filter for Incidents via function_id column.
-        Returns SQL fragment like: " AND i.function_id IN (...)"
-        """
-        if selected_function_id:
-            if not access.is_super_admin and selected_function_id not in access.function_ids:
-                return " AND 1 = 0"
-            return f" AND {table_alias}.function_id = '{selected_function_id}'"
-        
-        if access.is_super_admin:
-            return ""
-        
-        if not access.function_ids:
-            return " AND 1 = 0"
-        
-        function_ids_str = "','".join(access.function_ids)
-        return f" AND {table_alias}.function_id IN ('{function_ids_str}')"
+        """Build SQL filter for Incidents via function_id column."""
+        return self.build_function_filter('incident', table_alias, access, selected_function_id)
 
 
 # Singleton instance
@@ -0,0 +1,146 @@
+"""
+Process-wide pyodbc connection pool
+
+Endpoints used to call pyodbc.connect() per request, paying the full
+login/handshake cost on every database touch. This module keeps a small pool
+of live connections per worker process instead. pyodbc is imported lazily so
+modules that only need the pool type can still load where the ODBC driver is
+missing (same convention as the service imports).
+"""
+import queue
+import struct
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Optional
+
+# ODBC type code for SQL Server DATETIMEOFFSET, which pyodbc cannot decode
+# natively ("ODBC SQL type -155 is not yet supported"). Decoding it once at
+# the driver boundary beats per-cell workarounds in every endpoint.
+_SQL_DATETIMEOFFSET = -155
+
+
+def _decode_datetimeoffset(raw: bytes) -> datetime:
+    """Unpack the driver's DATETIMEOFFSET struct into an aware datetime"""
+    year, month, day, hour, minute, second, frac_ns, tz_h, tz_m = struct.unpack(
+        "<6hI2h", raw
+    )
+    return datetime(
+        year, month, day, hour, minute, second, frac_ns // 1000,
+        timezone(timedelta(hours=tz_h, minutes=tz_m)),
+    )
+
+
+class PyODBCConnectionPool:
+    """A small LIFO pool of pyodbc connections.
+
+    Connections are handed back on clean release and closed (not pooled) when
+    the caller saw an exception, so a broken connection never gets reused.
+    """
+
+    def __init__(self, connection_string_factory: Callable[[], str], max_size: int = 10):
+        self._connection_string_factory = connection_string_factory
+        self._max_size = max_size
+        self._idle: "queue.LifoQueue" = queue.LifoQueue(maxsize=max_size)
+        self._lock = threading.Lock()
+        self._created = 0
+
+    def acquire(self):
+        """Get a connection from the pool, creating one if none are idle.
+
+        Idle connections are pinged with a cheap SELECT 1 before being handed
+        out; dead ones (server restart, idle timeout) are discarded and the
+        next candidate is tried.
+        """
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                with self._lock:
+                    if self._created < self._max_size:
+                        self._created += 1
+                        try:
+                            return self._connect()
+                        except Exception:
+                            self._created -= 1
+                            raise
+                # Pool exhausted - wait for a connection to be released
+                conn = self._idle.get()
+            if self._ping(conn):
+                return conn
+            self._discard(conn)
+
+    def _ping(self, conn) -> bool:
+        """Liveness check so a stale pooled connection is never handed out"""
+        try:
+            conn.execute("SELECT 1").fetchone()
+            return True
+        except Exception:
+            return False
+
+    def release(self, conn, discard: bool = False) -> None:
+        """Return a connection to the pool, or close it if discard is set"""
+        if conn is None:
+            return
+        if discard:
+            self._discard(conn)
+            return
+        try:
+            self._idle.put_nowait(conn)
+        except queue.Full:
+            self._discard(conn)
+
+    def _discard(self, conn) -> None:
+        with self._lock:
+            self._created = max(0, self._created - 1)
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def _connect(self):
+        import pyodbc
+        conn = pyodbc.connect(self._connection_string_factory())
+        conn.add_output_converter(_SQL_DATETIMEOFFSET, _decode_datetimeoffset)
+        # SQL Server always talks UTF-16LE for N(VAR)CHAR; declaring it up
+        # front lets pyodbc decode wide strings without re-sniffing the
+        # encoding per value
+        conn.setdecoding(pyodbc.SQL_WCHAR, encoding='utf-16-le')
+        conn.setencoding(encoding='utf-16-le')
+        return conn
+
+    @contextmanager
+    def connection(self):
+        """Context manager: pooled connection, discarded on exception"""
+        conn = self.acquire()
+        try:
+            yield conn
+        except Exception:
+            self.release(conn, discard=True)
+            raise
+        else:
+            self.release(conn)
+
+    def close_all(self) -> None:
+        """Close every idle connection (e.g. on shutdown)"""
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(conn)
+
+
+_default_pool: Optional[PyODBCConnectionPool] = None
+_default_pool_lock = threading.Lock()
+
+
+def get_connection_pool() -> PyODBCConnectionPool:
+    """Return the shared pool for the main reporting database"""
+    global _default_pool
+    if _default_pool is None:
+        with _default_pool_lock:
+            if _default_pool is None:
+                from config import get_database_connection_string
+                _default_pool = PyODBCConnectionPool(get_database_connection_string)
+    return _default_pool
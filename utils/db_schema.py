@@ -0,0 +1,208 @@
+"""
+One-time schema bootstrap for the report_exports table
+
+The export log endpoints used to run IF NOT EXISTS CREATE TABLE / ALTER TABLE
+probes on every request - up to three extra round-trips to SQL Server before
+the real query. The DDL only ever does work once per database, so it now runs
+once per process: at application startup and lazily from the first endpoint
+call, guarded by a flag so every later call is a no-op.
+"""
+import threading
+
+_schema_ready = False
+_schema_lock = threading.Lock()
+
+_dashboard_schema_ready = False
+_dashboard_schema_lock = threading.Lock()
+
+
+def ensure_report_exports_schema() -> None:
+    """Create/upgrade dbo.report_exports once per process.
+
+    Safe to call from any request path: after the first successful run it
+    returns immediately without touching the database. Failures leave the
+    flag unset so the next call retries (e.g. database briefly unreachable
+    at startup).
+    """
+    global _schema_ready
+    if _schema_ready:
+        return
+    with _schema_lock:
+        if _schema_ready:
+            return
+        from utils.db_pool import get_connection_pool
+        pool = get_connection_pool()
+        conn = pool.acquire()
+        cursor = conn.cursor()
+        discard = False
+        try:
+            cursor.execute(
+                """
+                IF NOT EXISTS (
+                  SELECT * FROM INFORMATION_SCHEMA.TABLES
+                  WHERE TABLE_NAME = 'report_exports' AND TABLE_SCHEMA='dbo'
+                )
+                BEGIN
+                  CREATE TABLE dbo.report_exports (
+                    id INT IDENTITY(1,1) PRIMARY KEY,
+                    title NVARCHAR(255) NOT NULL,
+                    src NVARCHAR(1024) NULL,
+                    format NVARCHAR(20) NOT NULL,
+                    dashboard NVARCHAR(100) NULL,
+                    type NVARCHAR(50) NULL,
+                    created_by NVARCHAR(255) NULL,
+                    status NVARCHAR(20) NULL,
+                    created_at DATETIME2 DEFAULT GETDATE()
+                  )
+                END
+                """
+            )
+            conn.commit()
+
+            # Upgrade columns on pre-existing tables (each is a no-op once applied)
+            for column, ddl in (
+                ("created_by", "ALTER TABLE dbo.report_exports ADD created_by NVARCHAR(255) NULL"),
+                ("type", "ALTER TABLE dbo.report_exports ADD type NVARCHAR(50) NULL"),
+                ("status", "ALTER TABLE dbo.report_exports ADD status NVARCHAR(20) NULL"),
+            ):
+                try:
+                    cursor.execute(
+                        f"""
+                        IF NOT EXISTS (
+                          SELECT * FROM INFORMATION_SCHEMA.COLUMNS
+                          WHERE TABLE_NAME = 'report_exports' AND COLUMN_NAME = '{column}'
+                        )
+                        BEGIN
+                          {ddl}
+                        END
+                        """
+                    )
+                    conn.commit()
+                except Exception:
+                    pass  # Column might already exist
+
+            # Covering index for the recent-exports listing: matches the
+            # ORDER BY created_at DESC, id DESC paging and includes every
+            # selected column so the page query never touches the heap
+            try:
+                cursor.execute(
+                    """
+                    IF NOT EXISTS (
+                      SELECT * FROM sys.indexes
+                      WHERE name = 'IX_report_exports_recent'
+                        AND object_id = OBJECT_ID('dbo.report_exports')
+                    )
+                    BEGIN
+                      CREATE NONCLUSTERED INDEX IX_report_exports_recent
+                      ON dbo.report_exports (created_at DESC, id DESC)
+                      INCLUDE (title, src, format, dashboard, type, created_by)
+                    END
+                    """
+                )
+                conn.commit()
+            except Exception:
+                pass  # Index creation is best-effort (permissions may vary)
+
+            _schema_ready = True
+        except Exception:
+            discard = True
+            raise
+        finally:
+            cursor.close()
+            pool.release(conn, discard=discard)
+
+
+def ensure_dashboard_tables_schema() -> None:
+    """Create/upgrade dynamic_dashboard_charts and scheduled_reports once.
+
+    The chart-save and schedule-save endpoints used to replay this DDL
+    (CREATE TABLE plus four ALTER COLUMN widenings) on every POST - about
+    five extra round-trips before the actual INSERT. Same contract as
+    ensure_report_exports_schema: no-op after the first success, retried
+    on the next call if it failed.
+    """
+    global _dashboard_schema_ready
+    if _dashboard_schema_ready:
+        return
+    with _dashboard_schema_lock:
+        if _dashboard_schema_ready:
+            return
+        from utils.db_pool import get_connection_pool
+        pool = get_connection_pool()
+        conn = pool.acquire()
+        cursor = conn.cursor()
+        discard = False
+        try:
+            cursor.execute("""
+                IF NOT EXISTS (SELECT * FROM sysobjects WHERE name='dynamic_dashboard_charts' and xtype='U')
+                CREATE TABLE dynamic_dashboard_charts (
+                    id INT IDENTITY(1,1) PRIMARY KEY,
+                    user_id NVARCHAR(500),
+                    user_name NVARCHAR(500),
+                    chart_config NVARCHAR(MAX) NOT NULL,
+                    title NVARCHAR(1000),
+                    chart_type NVARCHAR(100),
+                    is_active BIT DEFAULT 1,
+                    created_at DATETIME2 DEFAULT GETDATE(),
+                    updated_at DATETIME2 DEFAULT GETDATE()
+                );
+            """)
+            conn.commit()
+
+            # Widen columns on pre-existing tables (each is a no-op once applied)
+            try:
+                for column, size in (
+                    ("title", 1000),
+                    ("chart_type", 100),
+                    ("user_id", 500),
+                    ("user_name", 500),
+                ):
+                    cursor.execute(f"""
+                        IF EXISTS (SELECT * FROM INFORMATION_SCHEMA.COLUMNS
+                                   WHERE TABLE_NAME = 'dynamic_dashboard_charts' AND COLUMN_NAME = '{column}'
+                                   AND CHARACTER_MAXIMUM_LENGTH < {size})
+                        ALTER TABLE dynamic_dashboard_charts ALTER COLUMN {column} NVARCHAR({size});
+                    """)
+                conn.commit()
+            except Exception:
+                pass  # Columns may already be wide enough
+
+            # Covering index for the active-chart listing: matches the
+            # is_active filter and created_at DESC ordering so the paged
+            # query seeks instead of scanning the heap
+            try:
+                cursor.execute("""
+                    IF NOT EXISTS (
+                      SELECT * FROM sys.indexes
+                      WHERE name = 'IX_ddc_active_created'
+                        AND object_id = OBJECT_ID('dynamic_dashboard_charts')
+                    )
+                    BEGIN
+                      CREATE NONCLUSTERED INDEX IX_ddc_active_created
+                      ON dynamic_dashboard_charts (is_active, created_at DESC)
+                      INCLUDE (user_id, user_name, title, chart_type, updated_at)
+                    END
+                """)
+                conn.commit()
+            except Exception:
+                pass  # Index creation is best-effort (permissions may vary)
+
+            cursor.execute("""
+                IF NOT EXISTS (SELECT * FROM sysobjects WHERE name='scheduled_reports' and xtype='U')
+                CREATE TABLE scheduled_reports (
+                    id INT IDENTITY(1,1) PRIMARY KEY,
+                    report_config NVARCHAR(MAX) NOT NULL,
+                    schedule_config NVARCHAR(MAX) NOT NULL,
+                    is_active BIT DEFAULT 1,
+                    created_at DATETIME2 DEFAULT GETDATE()
+                );
+            """)
+            conn.commit()
+
+            _dashboard_schema_ready = True
+        except Exception:
+            discard = True
+            raise
+        finally:
+            cursor.close()
+            pool.release(conn, discard=discard)
@@ -6,6 +6,7 @@ All default values are defined here, users can override via header_config parame
 import io
 import json
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, Any, Optional
 from openpyxl import Workbook
 from openpyxl.styles import Font, PatternFill, Alignment
@@ -140,22 +141,24 @@ def get_dashboard_specific_overrides() -> Dict[str, Dict[str, Any]]:
         "dynamic": generic.copy(),
     }
 
+@lru_cache(maxsize=16)
+def _default_header_config_cached(dashboard_type: str) -> Dict[str, Any]:
+    """Build the merged default config once per dashboard type"""
+    config = get_complete_default_config()
+    overrides = get_dashboard_specific_overrides()
+    config.update(overrides.get(dashboard_type, overrides.get("controls", {})))
+    return config
+
 def get_default_header_config(dashboard_type: str = "controls") -> Dict[str, Any]:
     """
     Get complete default header configuration for a specific dashboard type
     Combines base defaults with dashboard-specific overrides
+
+    The merged defaults are invariant per dashboard type, so they are built
+    once and memoized; callers get a fresh shallow copy they can mutate
+    (all values are scalars, so a shallow copy is enough).
     """
-    # Start with complete default configuration
-    config = get_complete_default_config()
-    
-    # Apply dashboard-specific overrides
-    overrides = get_dashboard_specific_overrides()
-    dashboard_overrides = overrides.get(dashboard_type, overrides.get("controls", {}))
-    
-    # Merge dashboard-specific overrides into base config
-    config.update(dashboard_overrides)
-    
-    return config
+    return dict(_default_header_config_cached(dashboard_type))
 
 def merge_header_config(user_config: Optional[Dict[str, Any]], dashboard_type: str = "controls") -> Dict[str, Any]:
     """
@@ -508,12 +508,15 @@ def generate_pdf_report(
                         labels = ['No Data']
                     ax.pie(values, labels=labels, autopct='%1.1f%%')
             
-            plt.tight_layout()
-            
+            # Operate on fig, not the pyplot current-figure API: renders run
+            # on worker threads now, and the global current figure would let
+            # concurrent exports save each other's charts
+            fig.tight_layout()
+
             chart_buffer = BytesIO()
-            plt.savefig(chart_buffer, format='png', dpi=150, bbox_inches='tight')
+            fig.savefig(chart_buffer, format='png', dpi=150, bbox_inches='tight')
             chart_buffer.seek(0)
-            plt.close()
+            plt.close(fig)
             
             chart_img = RLImage(chart_buffer, width=6*inch, height=3.5*inch)
             chart_img.hAlign = 'CENTER'